@@ -1,4 +1,5 @@
-from .data import Tree, Node
+from .data import Tree, Node, TreeCache
 from .config import Config
 from .functions.showGroupedTable import showGroupedTable
+from .functions.exportGroupedTable import exportGroupedTable
 from .functions.showSelectableList import showSelectableList
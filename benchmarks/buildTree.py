@@ -0,0 +1,65 @@
+# Compares the recursive groupby tree build against the GroupIndex build on a wide, deep frame
+# Run from the directory containing the package:
+#	python -m printTable.benchmarks.buildTree [rows] [depth] [workers]
+from ..data import Tree
+from ..config import Config
+
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+
+def makeFrame(rows: int, depth: int, seed: int = 0) -> pd.DataFrame:
+	rng = np.random.default_rng(seed)
+	data = {}
+	for d in range(depth):
+		# Cardinality grows with depth so every level actually splits its groups
+		cardinality = 3 + 2*d
+		data['g_level' + str(d)] = np.array(['v' + str(v) for v in rng.integers(0, cardinality, rows)], dtype=object)
+	data['h_count'] = rng.integers(0, 100, rows)
+	data['h_amount'] = rng.integers(0, 10000, rows)
+	data['h_note'] = np.array(['note' + str(v) for v in rng.integers(0, 1000, rows)], dtype=object)
+	return pd.DataFrame(data)
+
+
+def timeBuild(build, df, config) -> float:
+	start = time.perf_counter()
+	build(df, config)
+	return time.perf_counter() - start
+
+
+def compare(title: str, df: pd.DataFrame, config: Config, workers: int = 0):
+	recursive = timeBuild(Tree.buildTreeRecursive, df, config)
+	indexed = timeBuild(Tree.buildTree, df, config)
+	lazy = timeBuild(lambda df, config: Tree.buildTree(df, config, lazy = True), df, config)
+	compact = timeBuild(lambda df, config: Tree(df, config, compact = True), df, config)
+
+	print(title)
+	print('	recursive groupby: ' + format(recursive, '.3f') + 's')
+	print('	group index:       ' + format(indexed, '.3f') + 's (' + format(recursive/indexed, '.1f') + 'x)')
+	print('	group index, lazy: ' + format(lazy, '.3f') + 's (' + format(recursive/lazy, '.1f') + 'x)')
+	print('	tree store:        ' + format(compact, '.3f') + 's (' + format(recursive/compact, '.1f') + 'x)')
+	if config.usesDefaultSummary or config.usesAggregations:
+		chunkRows = max(1, len(df) // 10)
+		chunked = timeBuild(lambda df, config: Tree.fromChunks((df.iloc[start:start+chunkRows] for start in range(0, len(df), chunkRows)), config), df, config)
+		print('	10 chunks:         ' + format(chunked, '.3f') + 's (' + format(recursive/chunked, '.1f') + 'x)')
+	if workers > 1:
+		parallel = timeBuild(lambda df, config: Tree.buildTreeParallel(df, config, workers), df, config)
+		print('	' + format(str(workers) + ' workers:', '19s') + format(parallel, '.3f') + 's (' + format(recursive/parallel, '.1f') + 'x)')
+
+
+def main(rows: int = 50000, depth: int = 5, workers: int = 0):
+	df = makeFrame(rows, depth)
+	countable = {'h_count', 'h_amount'}
+	hidden = {'h_count', 'h_amount', 'h_note'}
+
+	print('rows: ' + str(rows) + ', depth: ' + str(depth))
+	compare('default summaries', df, Config(countable, hidden), workers)
+	compare('declarative aggregations', df, Config(countable, hidden, aggregations = {'h_count': ['sum', 'max'], 'h_amount': 'mean'}), workers)
+	# A constant summary takes summarizing out of the picture, leaving just the grouping
+	compare('grouping only', df, Config(countable, hidden, summarize = lambda self, df, colName, long: ''))
+
+
+if __name__ == '__main__':
+	main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,57 @@
+# Compares expanding every node of a tree one at a time (the way clicking each one does) against Node.expandAll, along with the
+# render of the expanded tree that follows either
+# Run from the directory containing the package:
+#	python -m printTable.benchmarks.expand [rows] [depth]
+from ..config import Config
+from ..data import Tree
+from ..drawing import Line
+from .buildTree import makeFrame
+
+import sys
+import time
+
+
+def expandEach(node):
+	stack = [node]
+	while len(stack) > 0:
+		node = stack.pop()
+		node.isExpanded = True
+		stack.extend(node.children)
+
+
+def timeExpand(tree: Tree, expand) -> tuple:
+	start = time.perf_counter()
+	expand(tree.root)
+	expanded = time.perf_counter() - start
+	tree.render(0, 50)
+	return (expanded, time.perf_counter() - start - expanded)
+
+
+def main(rows: int = 200000, depth: int = 4):
+	# Colors are only set up by curses, which these renders never start
+	Line.colorsInitialized = True
+	Line.getElementDecorator = staticmethod(lambda lineType: 0)
+
+	df = makeFrame(rows, depth)
+	config = Config({'h_count', 'h_amount'}, {'h_count', 'h_amount', 'h_note'})
+	# Trees are built (and their children condensed) before timing, so only expanding is timed
+	eachTree = Tree(df, config)
+	allTree = Tree(df, config)
+	expandEach(eachTree.root)
+	expandEach(allTree.root)
+	eachTree.root.collapseToDepth(1)
+	allTree.root.collapseToDepth(1)
+
+	each = timeExpand(eachTree, expandEach)
+	bulk = timeExpand(allTree, lambda root: root.expandAll())
+	print('rows: ' + str(rows) + ', depth: ' + str(depth) + ', drawn rows: ' + str(allTree.root.measure()[0] + 2))
+	print('	one at a time: ' + format(each[0]*1000, '.1f') + 'ms to expand, ' + format(each[1]*1000, '.1f') + 'ms to render')
+	print('	expandAll:     ' + format(bulk[0]*1000, '.1f') + 'ms to expand, ' + format(bulk[1]*1000, '.1f') + 'ms to render')
+
+	start = time.perf_counter()
+	allTree.root.collapseToDepth(2)
+	print('	collapseToDepth(2): ' + format((time.perf_counter() - start)*1000, '.1f') + 'ms')
+
+
+if __name__ == '__main__':
+	main(*[int(arg) for arg in sys.argv[1:]])
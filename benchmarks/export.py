@@ -0,0 +1,41 @@
+# Compares exporting a fully expanded tree a chunk at a time against drawing one full render of it, in time and peak memory
+# Run from the directory containing the package:
+#	python -m printTable.benchmarks.export [rows] [depth] [chunkRows]
+from ..config import Config
+from ..data import Tree
+from ..functions.exportGroupedTable import exportGroupedTable, _ExportWindow, EXPORT_DECORATORS
+from .buildTree import makeFrame
+
+import os
+import sys
+import time
+import tracemalloc
+
+
+def measure(run) -> tuple:
+	tracemalloc.start()
+	start = time.perf_counter()
+	run()
+	elapsed = time.perf_counter() - start
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	return (elapsed, peak)
+
+
+def main(rows: int = 50000, depth: int = 4, chunkRows: int = 1000):
+	tree = Tree(makeFrame(rows, depth), Config({'h_count', 'h_amount'}, {'h_count', 'h_amount', 'h_note'}))
+	tree.root.expandAll()
+	drawnRows = tree.root.measure()[0] + 2
+	print('rows: ' + str(rows) + ', depth: ' + str(depth) + ', drawn rows: ' + str(drawnRows))
+
+	with open(os.devnull, 'w') as stream:
+		exported, exportPeak = measure(lambda: exportGroupedTable(tree, stream, width = 160, chunkRows = chunkRows))
+	# What exporting would take if it drew one full render of the tree (drawing with the line types, as exporting does)
+	full, fullPeak = measure(lambda: tree.render(cache = False).draw(_ExportWindow(160, 0, drawnRows), decorators = EXPORT_DECORATORS))
+
+	print('	full render:                  ' + format(full, '.2f') + 's, peak ' + format(fullPeak / 2**20, '.1f') + 'MiB')
+	print('	export (' + str(chunkRows) + ' row chunks): ' + format(exported, '.2f') + 's, peak ' + format(exportPeak / 2**20, '.1f') + 'MiB')
+
+
+if __name__ == '__main__':
+	main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,29 @@
+# Times hiding a node whose siblings are all long chains of single children (drawn as leaves), and the recalculation of its
+# parent's children that follows
+# Run from the directory containing the package:
+#	python -m printTable.benchmarks.hide [siblings] [chainLength]
+from ..config import Config
+from ..data import Tree
+
+import sys
+import time
+import pandas as pd
+
+
+def main(siblings: int = 3000, chainLength: int = 12, hides: int = 20):
+	# Every row has its own value in every column, so each top level group is a chain of chainLength nodes
+	df = pd.DataFrame({'g_level' + str(d): ['v' + str(d) + '_' + str(i) for i in range(siblings)] for d in range(chainLength)})
+	df['h_count'] = 1
+	tree = Tree(df, Config({'h_count'}, {'h_count'}))
+	tree.root.children
+
+	start = time.perf_counter()
+	for i in range(hides):
+		tree.root._children[i].hide()
+		tree.root.children
+	print('siblings: ' + str(siblings) + ', chain length: ' + str(chainLength))
+	print('	hide and recalculate: ' + format((time.perf_counter() - start) / hides * 1000, '.1f') + 'ms')
+
+
+if __name__ == '__main__':
+	main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,91 @@
+# Times drawing one screenful of a fully expanded tree, the way showGroupedTable draws every frame
+# Run from the directory containing the package:
+#	python -m printTable.benchmarks.render [rows] [depth] [height]
+from ..data import Tree
+from ..data.node import Node
+from ..config import Config
+from ..drawing import ScrollableWindow, Line
+from .buildTree import makeFrame
+
+import sys
+import time
+
+
+# Stands in for a curses window, so frames can be drawn without a terminal
+class NullWindow:
+	def __init__(self, h: int, w: int):
+		self.h = h
+		self.w = w
+		self.calls = 0
+
+	def getmaxyx(self):
+		return (self.h, self.w)
+
+	def addstr(self, y, x, string, *args):
+		self.calls += 1
+
+	def move(self, y, x):
+		pass
+
+	def clrtoeol(self):
+		pass
+
+	def erase(self):
+		pass
+
+
+# step is run before each frame, to change what is drawn the way a key press would
+# differential draws the frames with drawFrame, like showGroupedTable does
+def timeFrames(tree: Tree, scrollWindow: ScrollableWindow, windowed: bool, frames: int = 10, step = None, differential: bool = False) -> float:
+	start = time.perf_counter()
+	for _ in range(frames):
+		if step is not None:
+			step()
+		lineBlock = tree.render(scrollWindow.top, scrollWindow.top + scrollWindow.h) if windowed else tree.render()
+		if differential:
+			scrollWindow.drawFrame(lineBlock)
+		else:
+			scrollWindow.erase()
+			scrollWindow.drawAll(lineBlock)
+	return (time.perf_counter() - start) / frames
+
+
+def main(rows: int = 5000, depth: int = 4, height: int = 50):
+	# Colors are only set up by curses, which these frames never start
+	Line.colorsInitialized = True
+	Line.getElementDecorator = staticmethod(lambda lineType: 0)
+
+	tree = Tree(makeFrame(rows, depth), Config({'h_count', 'h_amount'}, {'h_count', 'h_amount', 'h_note'}))
+	tree.root.expandAll()
+	window = NullWindow(height, 200)
+	scrollWindow = ScrollableWindow(window)
+	scrollWindow.drawAll(tree.render())
+	scrollWindow.scrollTo(scrollWindow.contentLen // 2)
+
+	print('rows: ' + str(rows) + ', depth: ' + str(depth) + ', drawn rows: ' + str(scrollWindow.contentLen) + ', window height: ' + str(height))
+	full = timeFrames(tree, scrollWindow, False)
+	windowed = timeFrames(tree, scrollWindow, True)
+	print('	full render:     ' + format(full*1000, '.1f') + 'ms per frame')
+	print('	windowed render: ' + format(windowed*1000, '.1f') + 'ms per frame (' + format(full/windowed, '.1f') + 'x)')
+
+	# Moving the focus only invalidates the cached renders of the nodes it moves between and their ancestors
+	focus = [tree.root.children[0].focusIn(depth)]
+	def moveFocus():
+		focus[0] = focus[0].focusDown()
+
+	Node.resetRenderCacheCounters()
+	full = timeFrames(tree, scrollWindow, False, step = moveFocus)
+	print('	full render, moving the focus:     ' + format(full*1000, '.1f') + 'ms per frame (render cache hit rate ' + format(Node.renderCacheHitRate()*100, '.1f') + '%)')
+	Node.resetRenderCacheCounters()
+	windowed = timeFrames(tree, scrollWindow, True, step = moveFocus)
+	print('	windowed render, moving the focus: ' + format(windowed*1000, '.1f') + 'ms per frame (render cache hit rate ' + format(Node.renderCacheHitRate()*100, '.1f') + '%)')
+
+	# Only the rows the focus moves between change from frame to frame
+	for differential in [False, True]:
+		window.calls = 0
+		elapsed = timeFrames(tree, scrollWindow, True, step = moveFocus, differential = differential)
+		print('	' + ('differential redraw' if differential else 'erase and redraw') + ', moving the focus: ' + format(elapsed*1000, '.1f') + 'ms, ' + str(window.calls // 10) + ' addstr calls per frame')
+
+
+if __name__ == '__main__':
+	main(*[int(arg) for arg in sys.argv[1:]])
@@ -1,32 +1,144 @@
 import pandas as pd
-from typing import Set
+import numpy as np
+import hashlib
+import types
+from typing import Set, Dict, List, Union
 
 class Config:
 	# TODO: Add non collapsible columns
-	def __init__(self, countableCols: Set[str], hiddenCols: Set[str], summarize = None, colNameCleanup = None):
+	# aggregations is an optional declarative alternative to summarize, mapping column names to one or more pandas aggregation names
+	# (sum, mean, min, max, count, nunique, ...), which lets trees evaluate every group's summary in batches
+	# The results are formatted with summaryFormat/summaryFormatLong, which are str.format strings whose fields are named column_aggregation
+	# (ie '{h_amount_mean:.2f}'), or listed out as 'column aggregation: value' if no format is given
+	def __init__(self, countableCols: Set[str], hiddenCols: Set[str], summarize = None, colNameCleanup = None, aggregations: Dict[str, Union[str, List[str]]] = None, summaryFormat: str = None, summaryFormatLong: str = None):
 		self.countableCols = countableCols
 		self.hiddenCols = hiddenCols
-		self.sumFunc = summarize if summarize is not None else Config.defaultSummary
+		self.aggregations = None if aggregations is None else {col: [funcs] if isinstance(funcs, str) else list(funcs) for col, funcs in aggregations.items()}
+		self.summaryFormat = summaryFormat
+		self.summaryFormatLong = summaryFormatLong
+		if summarize is not None:
+			self.sumFunc = summarize
+		else:
+			self.sumFunc = Config.aggregateSummary if self.aggregations is not None else Config.defaultSummary
 		self.colNameCleanupFunc = colNameCleanup if colNameCleanup is not None else Config.defaultColCleanup
 
 
+	# Everything that changes how a tree is built from a dataframe, as a string (used to key cached trees), or None if that can't be told
+	# Functions are identified by their name, their compiled code, and the values they close over, default to and read from module globals,
+	# so editing a summarize function or making the same one with other values changes its identity
+	# Values that only print their address (ie objects without a repr) can't be compared between runs, so configs using them have no identity
+	def identity(self) -> str:
+		def valueIdentity(value, depth: int) -> str:
+			if isinstance(value, types.CodeType):
+				consts = [valueIdentity(const, depth) for const in value.co_consts]
+				return hashlib.sha1(value.co_code + repr(consts).encode('utf-8')).hexdigest()
+			if isinstance(value, types.FunctionType):
+				return funcIdentity(value, depth + 1)
+			if isinstance(value, types.ModuleType):
+				return 'module ' + value.__name__
+			if isinstance(value, type):
+				return 'class ' + value.__module__ + '.' + value.__qualname__
+			if isinstance(value, (tuple, list)):
+				return type(value).__name__ + repr([valueIdentity(item, depth) for item in value])
+			if isinstance(value, (set, frozenset)):
+				return type(value).__name__ + repr(sorted([valueIdentity(item, depth) for item in value]))
+			if isinstance(value, dict):
+				return 'dict' + repr([(valueIdentity(key, depth), valueIdentity(item, depth)) for key, item in value.items()])
+			# Large arrays and frames print abbreviated, so hash their contents instead
+			if isinstance(value, np.ndarray):
+				return 'ndarray ' + str(value.dtype) + str(value.shape) + hashlib.sha1(np.ascontiguousarray(value).tobytes()).hexdigest()
+			if isinstance(value, (pd.Series, pd.DataFrame)):
+				return type(value).__name__ + ' ' + hashlib.sha1(pd.util.hash_pandas_object(value).to_numpy().tobytes()).hexdigest()
+			text = repr(value)
+			if ' at 0x' in text:
+				raise ValueError('No stable identity for ' + text)
+			return text
+
+		def funcIdentity(func, depth: int = 0) -> str:
+			name = getattr(func, '__module__', '') + '.' + getattr(func, '__qualname__', repr(func))
+			code = getattr(func, '__code__', None)
+			if code is None:
+				return valueIdentity(func, depth)
+			# Recursive functions would recurse forever, and anything this deep is library code that is identified by name well enough
+			if depth > 3:
+				return name
+			closure = [cell.cell_contents for cell in func.__closure__ or ()]
+			# Only the summarize functions themselves are checked for the module globals they read, not every function they call
+			names = [] if depth > 0 else [name for name in code.co_names if name in func.__globals__]
+			return name + ':' + valueIdentity(code, depth) + ':' + valueIdentity([
+				closure,
+				func.__defaults__,
+				func.__kwdefaults__,
+				{name: func.__globals__[name] for name in names}
+			], depth)
+
+		try:
+			return repr((
+				sorted([str(col) for col in self.countableCols]),
+				sorted([str(col) for col in self.hiddenCols]),
+				funcIdentity(self.sumFunc),
+				funcIdentity(self.colNameCleanupFunc),
+				self.aggregations,
+				self.summaryFormat,
+				self.summaryFormatLong
+			))
+		except ValueError:
+			return None
+
+
 	def summarize(self, df: pd.DataFrame, colName: str, long: bool = False):
 		return self.sumFunc(self, df, colName, long)
 
 
+	# True when summaries are the default column sums, which can be precomputed for every group at once instead of calling summarize per node
+	@property
+	def usesDefaultSummary(self):
+		return self.sumFunc is Config.defaultSummary
+
+
+	# True when summaries come from the declarative aggregations, which can be evaluated for a whole level of groups at once
+	@property
+	def usesAggregations(self):
+		return self.sumFunc is Config.aggregateSummary
+
+
+	# A column that isn't in df (ie dropped from a group's frame for being all na) is aggregated as the all na column it was
+	@staticmethod
+	def aggregateSummary(self, df: pd.DataFrame, colName: str, long: bool):
+		values = {}
+		for col, funcs in self.aggregations.items():
+			column = df[col] if col in df.columns else pd.Series(np.nan, index = df.index, dtype = float)
+			for func in funcs:
+				values[(col, func)] = column.agg(func)
+		return self.formatAggregates(values, long)
+
+
+	# Formats {(colName, aggregation): value} into a summary using the configured format strings
+	def formatAggregates(self, values, long: bool):
+		fmt = self.summaryFormatLong if long else self.summaryFormat
+		if fmt is None:
+			return ', '.join([str(self.colNameCleanup(col)) + ' ' + func + ': ' + str(value) for (col, func), value in values.items()])
+		return fmt.format(**{str(col) + '_' + func: value for (col, func), value in values.items()})
+
+
 	@staticmethod
 	def defaultSummary(self, df: pd.DataFrame, colName: str, long: bool):
 		sums = []
-		summary = 0
 		for col in df.columns:
 			if col in self.countableCols:
-				sum = pd.to_numeric(df[col].fillna(0), downcast='integer').sum()
-				summary += sum
-				sums.append(self.colNameCleanup(col) + ': ' + str(sum))
+				sums.append((col, pd.to_numeric(df[col].fillna(0), downcast='integer').sum()))
+		return self.formatSums(sums, long)
+
+
+	# Formats (colName, sum) pairs into the default summary
+	def formatSums(self, sums, long: bool):
 		if not long:
+			summary = 0
+			for col, sum in sums:
+				summary += sum
 			return 'Total: ' + str(summary)
 		else:
-			return ', '.join(sums)
+			return ', '.join([self.colNameCleanup(col) + ': ' + str(sum) for col, sum in sums])
 
 
 	def colNameCleanup(self, v):
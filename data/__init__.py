@@ -2,3 +2,6 @@ from .node import Node
 from .mergableNode import MergableNode
 from .leafNode import LeafNode
 from .tree import Tree
+from .treeCache import TreeCache
+from .pathTrie import PathTrie
+from .searchIndex import SearchIndex
@@ -7,23 +7,65 @@ class ChildCondensingNode(FocusableNode):
 	def __init__(self, *args, **kwargs):
 		super().__init__(*args, **kwargs)
 		self._effChildren = []
-		self.recalculateChildren = True
-		self.isHidden = False
+		self._recalculateChildren = True
+		self._isHidden = False
 
+	# Both change what this node's parent draws, so they invalidate its cached renders
+	# Children are recalculated when they change, which can change whether this node is a leaf too
+	@property
+	def recalculateChildren(self):
+		return self._recalculateChildren
+
+	@recalculateChildren.setter
+	def recalculateChildren(self, recalculateChildren):
+		self._recalculateChildren = recalculateChildren
+		if recalculateChildren:
+			self.invalidate()
+			self.invalidateLeaf()
+
+	@property
+	def isHidden(self):
+		return self._isHidden
+
+	@isHidden.setter
+	def isHidden(self, isHidden):
+		self._isHidden = isHidden
+		self.invalidate()
+
+	# Hiding or showing a node changes its parent's children, and so whether its parent is a leaf (or the chain of a leaf it is part of)
+	# Every ancestor that is part of a leaf's chain, before or after, is drawn differently by its own parent, which recalculates too
 	def hide(self):
+		wasLeaf = 0
+		node = self.parent
+		while node is not None and LeafNode.isLeaf(node):
+			wasLeaf += 1
+			node = node.parent
+
 		self.isHidden = not self.isHidden
-		if self.parent is not None:
-			self.parent.recalculateChildren = True
+		if self.parent is None:
+			return
+		self.parent.recalculateChildren = True
+
+		node = self.parent
+		while node.parent is not None and (wasLeaf > 0 or LeafNode.isLeaf(node)):
+			node.parent.recalculateChildren = True
+			node = node.parent
+			wasLeaf -= 1
 
 	@property
 	def children(self):
 		if not self.recalculateChildren:
 			return self._effChildren
 
-		# Go through the current effChildren and copy any leaf node state back onto the original child
+		# Leaf nodes whose chain has not changed since they were made (so whether it is a leaf is still cached) are kept as they are
+		# Go through the rest of the current effChildren and copy any leaf node state back onto the original child
+		keptLeaves = {}
 		for child in self._effChildren:
 			if isinstance(child, LeafNode):
-				child.saveState()
+				if child.derivedNode._isLeaf and not child.derivedNode.isHidden:
+					keptLeaves[id(child.derivedNode)] = child
+				else:
+					child.saveState()
 
 		self.recalculateChildren = False
 		self._effChildren = []
@@ -44,7 +86,11 @@ class ChildCondensingNode(FocusableNode):
 
 			# If a child is leafable, do it
 			if LeafNode.isLeaf(child):
-				leaf = LeafNode.promote(child)
+				leaf = keptLeaves.get(id(child))
+				if leaf is not None:
+					leaf.unmerge()
+				else:
+					leaf = LeafNode.promote(child)
 #				self._children[c] = leaf
 				self._effChildren.append(leaf)
 
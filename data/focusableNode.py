@@ -4,8 +4,8 @@ from ..drawing import Line
 class FocusableNode(Node):
 	def __init__(self, *args, isFocused = False, focusedIdx = 0, **kwargs):
 		super().__init__(*args, **kwargs)
-		self.isFocused = isFocused
-		self.focusedIdx = focusedIdx
+		self._isFocused = isFocused
+		self._focusedIdx = focusedIdx
 
 	@staticmethod
 	def copy(other):
@@ -24,6 +24,25 @@ class FocusableNode(Node):
 		return (args, kwargs)
 
 
+	@property
+	def isFocused(self):
+		return self._isFocused
+
+	@isFocused.setter
+	def isFocused(self, isFocused):
+		self._isFocused = isFocused
+		self.invalidateRender()
+
+	@property
+	def focusedIdx(self):
+		return self._focusedIdx
+
+	@focusedIdx.setter
+	def focusedIdx(self, focusedIdx):
+		self._focusedIdx = focusedIdx
+		self.invalidateRender()
+
+
 	def click(self):
 		# If i'm collapsed, dont allow clicks on the last possible focusedIdx
 		if self.isCollapsed and self.focusedIdx == len(self.contentLine)-1:
@@ -46,7 +65,7 @@ class FocusableNode(Node):
 
 		sourceNode = self if sourceNode is None else sourceNode
 
-		childIdx = self.parent.children.index(self)
+		childIdx = self.parent.childIndex(self)
 		# If I am the first child in my parent, let my parent focus up (recursive case)
 		if childIdx <= 0:
 			return self.parent.focusUp(sourceNode)
@@ -63,7 +82,7 @@ class FocusableNode(Node):
 
 		sourceNode = self if sourceNode is None else sourceNode
 
-		childIdx = self.parent.children.index(self)
+		childIdx = self.parent.childIndex(self)
 		# If I am the last child in my parent, let my parent focus down (recursive case)
 		if childIdx+1 >= len(self.parent.children):
 			return self.parent.focusDown(sourceNode)
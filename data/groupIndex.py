@@ -0,0 +1,164 @@
+from ..config import Config
+from .summaryRollup import SummaryRollup, AggregationRollup
+from typing import List
+import pandas as pd
+import numpy as np
+
+# Factorizes every groupable column of a dataframe into integer codes once and sorts the rows by those codes once
+# After that every group at every depth of the tree is just a contiguous range [start, end) of the sorted rows, so building a level
+# never has to copy, dropna or groupby a dataframe
+# Hidden columns are never grouped by, so they are not factorized (their codes stay -1) but are still tracked for na checks
+class GroupIndex:
+	def __init__(self, df: pd.DataFrame, config: Config):
+		self.source = df
+		self.config = config
+		self.columns = list(df.columns)
+		self.hidden: List[bool] = [col in config.hiddenCols for col in self.columns]
+
+		# Na values get the code -1, which sorts before every real value and is dropped from subgroups just like groupby does
+		codes = np.full((len(df), len(self.columns)), -1, dtype=np.int32)
+		self.uniques = [None for _ in self.columns]
+		self.uniqueLens = [None for _ in self.columns]
+		for c in range(len(self.columns)):
+			if self.hidden[c]:
+				continue
+			colCodes, uniques = pd.factorize(df.iloc[:, c], sort = True)
+			codes[:, c] = colCodes
+			self.uniques[c] = uniques
+			self.uniqueLens[c] = np.array([len(str(u)) for u in uniques], dtype=np.int64)
+
+		# Sort once by every groupable column left to right (lexsort takes its primary key last)
+		# lexsort is stable, so rows that share every code keep their original order
+		keys = [codes[:, c] for c in reversed(range(len(self.columns))) if not self.hidden[c]]
+		self.order = np.lexsort(keys) if len(keys) > 0 else np.arange(len(df))
+		self.codes = codes[self.order]
+
+		# Running count of non na values per column in sorted order, so "is this column all na in this group" is a subtraction
+		notna = df.notna().to_numpy()[self.order]
+		self.notnaCounts = np.zeros((len(df)+1, len(self.columns)), dtype=np.int32)
+		np.cumsum(notna, axis=0, out=self.notnaCounts[1:])
+
+		self._strCols = {}
+		self._groupStarts = {}
+		self._rollup = None
+
+
+	def __len__(self):
+		return len(self.order)
+
+
+	# The same columns Tree._prepareDf would leave on this group's dataframe, as column positions
+	# Columns before colStart have already been grouped by (or dropped) by an ancestor
+	def groupCols(self, start: int, end: int, colStart: int) -> List[int]:
+		counts = self.notnaCounts[end, colStart:] - self.notnaCounts[start, colStart:]
+		cols = [colStart + int(c) for c in np.flatnonzero(counts)]
+
+		# Remove all hidden columns that are before the first non hidden column
+		while len(cols) > 0 and self.hidden[cols[0]]:
+			cols.pop(0)
+		return cols
+
+
+	# The start of every group made by grouping on the columns before prefixLen (in sorted order)
+	# A group's rows are exactly the rows that share its codes on every column before its group column, so these are the starts of the
+	# runs of equal code prefixes.  This is what lets every group at a depth be summarized in one pass
+	def groupStarts(self, prefixLen: int):
+		if prefixLen not in self._groupStarts:
+			changed = np.zeros(max(len(self)-1, 0), dtype=bool)
+			for c in range(prefixLen):
+				changed |= self.codes[1:, c] != self.codes[:-1, c]
+			self._groupStarts[prefixLen] = np.concatenate([[0], np.flatnonzero(changed) + 1]) if len(self) > 0 else np.zeros(0, dtype=np.int64)
+		return self._groupStarts[prefixLen]
+
+
+	# Original positions of the rows in a group, in their original order
+	def groupRows(self, start: int, end: int):
+		return np.sort(self.order[start:end])
+
+
+	# The group as its own dataframe, only needed for user defined summaries
+	def groupFrame(self, start: int, end: int, cols: List[int]) -> pd.DataFrame:
+		return self.source.iloc[self.groupRows(start, end), cols]
+
+
+	# Splits a group into one (groupName, start, end) per distinct value of col, in sorted order
+	# Rows where col is na are left out of every subgroup
+	def subgroups(self, start: int, end: int, col: int) -> List[tuple]:
+		codes = self.codes[start:end, col]
+		bounds = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+		starts = [0, *bounds.tolist()]
+		ends = [*bounds.tolist(), len(codes)]
+
+		uniques = self.uniques[col]
+		return [(uniques[codes[s]], start+s, start+e) for s, e in zip(starts, ends) if codes[s] >= 0]
+
+
+	# The widest group name a split on col would produce, without building the subgroups
+	def subgroupNameWidth(self, start: int, end: int, col: int) -> int:
+		codes = self.codes[start:end, col]
+		codes = codes[codes >= 0]
+		return int(self.uniqueLens[col][codes].max()) if len(codes) > 0 else 0
+
+
+	# The values of col for every row in the group as strings (in original order), for groups that are made of leaf rows
+	def rowValues(self, start: int, end: int, col: int) -> list:
+		if col not in self._strCols:
+			self._strCols[col] = self.source.iloc[:, col].astype(str).to_numpy(dtype=object)
+		return self._strCols[col][self.groupRows(start, end)].tolist()
+
+
+	# (value, path) for every group name and leaf row value of the tree built from this index, with the path of _children indices to
+	# the node it is drawn on (see SearchIndex).  Groups are split the same way describeGroup splits them, but nothing is summarized
+	def searchEntries(self) -> List[tuple]:
+		entries = []
+		stack = [(0, len(self), 0, ())]
+		while len(stack) > 0:
+			start, end, colStart, path = stack.pop()
+			cols = self.groupCols(start, end, colStart)
+			groupCol = cols[0]
+			if len([c for c in cols if not self.hidden[c]]) > 1:
+				for c, (gn, childStart, childEnd) in enumerate(self.subgroups(start, end, groupCol)):
+					entries.append((gn, (*path, c)))
+					stack.append((childStart, childEnd, groupCol+1, (*path, c)))
+			else:
+				entries.extend([(val, (*path, c)) for c, val in enumerate(self.rowValues(start, end, groupCol))])
+		return entries
+
+
+	# Returns (colSummary, colSummaryLong) for a group
+	# Default summaries and declarative aggregations come from a rollup that is computed once per depth and cached here
+	# Anything else falls back to calling summarize on the group's dataframe
+	def summarize(self, start: int, end: int, cols: List[int]) -> tuple:
+		if self._rollup is None:
+			if self.config.usesAggregations:
+				self._rollup = AggregationRollup(self)
+			elif self.config.usesDefaultSummary:
+				self._rollup = SummaryRollup(self)
+		if self._rollup is not None:
+			return self._rollup.summarize(start, end, cols)
+
+		df = self.groupFrame(start, end, cols)
+		return (self.config.summarize(df, df.columns[0], long = False), self.config.summarize(df, df.columns[0], long = True))
+
+
+	# Everything about a group that is needed to build its node: its grouping column, summaries, child col width,
+	# and its groups, which are (name, start, end) ranges of the index, or just a name for the leaf rows of the last column
+	def describeGroup(self, start: int, end: int, colStart: int) -> tuple:
+		config = self.config
+		cols = self.groupCols(start, end, colStart)
+		groupCol = cols[0]
+
+		childColName = str(config.colNameCleanup(self.columns[groupCol]))
+		colSummary, colSummaryLong = [str(summary) for summary in self.summarize(start, end, cols)]
+
+		# Count the number of non hidden columns left in the group
+		colCount = len([c for c in cols if not self.hidden[c]])
+
+		if colCount > 1:
+			groups = self.subgroups(start, end, groupCol)
+			childColWidth = max(len(childColName), self.subgroupNameWidth(start, end, groupCol)+2)
+		else:
+			groups = self.rowValues(start, end, groupCol)
+			childColWidth = max([len(childColName), *[len(val) for val in groups if isinstance(val, str)]])
+
+		return (groupCol, colCount, childColName, colSummary, colSummaryLong, groups, childColWidth)
@@ -11,19 +11,24 @@ class LeafNode(MergableNode):
 		super().__init__(*args, **kwargs)
 		self.derivedNode = derivedNode
 
+	# Cached on the node until its children (or the children of a node under it) change, so recalculating a node's children only has
+	# to look at each child once, instead of down every child's chain of single children
 	@staticmethod
 	def isLeaf(node: Node) -> bool:
-		firstChild = None
-		for child in node.children:
-			# More than one child is a collapsible node
-			if firstChild is not None:
-				return False
-			firstChild = child
-		# No children is definitely a leaf
-		if firstChild is None:
-			return True
-		# Otherwise, traverse down to make sure all desendants are also leaves
-		return LeafNode.isLeaf(firstChild)
+		if node._isLeaf is not None:
+			return node._isLeaf
+
+		# Unloaded nodes already know their child count, so only single child chains need to be built to check
+		if not node.isLoaded and node.childCount != 1:
+			isLeaf = node.childCount == 0
+		else:
+			children = node.children
+			# No children is definitely a leaf, more than one child is a collapsible node
+			# Otherwise, traverse down to make sure all desendants are also leaves
+			isLeaf = len(children) == 0 or (len(children) == 1 and LeafNode.isLeaf(children[0]))
+
+		node._isLeaf = isLeaf
+		return isLeaf
 
 
 	@staticmethod
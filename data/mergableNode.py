@@ -17,6 +17,7 @@ class IMergableNode:
 # Adds:
 #	- canMerge(other)
 #	- merge(others)
+#	- unmerge()
 #	- isMerged
 class MergableNode(FocusableNode):
 	@staticmethod
@@ -54,6 +55,16 @@ class MergableNode(FocusableNode):
 			node.isMerged = True
 
 
+	# Undoes merge, so the node can be merged again (with the same or other nodes)
+	# Merging changes how the node is drawn, so its cached render and measure go too (its parent recalculating its children drops its own)
+	def unmerge(self):
+		self.isMerged = False
+		self._effColWidths = self._colWidths
+		self._renderCache = None
+		self._measure = None
+		self._layout = None
+
+
 	@property
 	def colWidths(self):
 		return self._effColWidths
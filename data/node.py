@@ -1,5 +1,6 @@
 from typing import List, Union
-from ..drawing import Line, LineBlock, Chars
+import bisect
+from ..drawing import Line, LineBlock, Chars, SkippedBlock
 
 class INode:
 	pass
@@ -12,17 +13,32 @@ class INode:
 #	- children: A list of Nodes
 #	- isCollapsed: A boolean indicating if the node is both collapsible (len(self.children) > 1) and is collapsed (not self.isExpanded)
 #	- contentDecorators: A list of line types matching the length of self.contentLine
+# A node can also be built lazily by passing a childLoader (called with the node, returning its children) and the childCount it will produce
+# instead of a children list.  The loader is only run the first time _children is accessed
 class Node:
-	def __init__(self, contentLine, childHeaderLine, colWidths, children, parent, depth, colSummary = None, colSummaryLong = None, isExpanded = False):
+	renderCacheHits: int = 0
+	renderCacheMisses: int = 0
+
+	def __init__(self, contentLine, childHeaderLine, colWidths, children, parent, depth, colSummary = None, colSummaryLong = None, isExpanded = False, childLoader = None, childCount = None):
 		self._contentLine: List[str] = contentLine if isinstance(contentLine, list) else [contentLine]
 		self._childHeaderLine: List[str] = childHeaderLine if isinstance(childHeaderLine, list) else [childHeaderLine]
 		self._colWidths: list[int] = colWidths
-		self._children: List[INode] = children
+		self._loadedChildren: List[INode] = children if children is not None else []
+		self._childLoader = childLoader
+		self.childCount: int = childCount if childCount is not None else len(self._loadedChildren)
 		self.parent: INode = parent
 		self.depth: int = depth
 		self.colSummary: str = colSummary
 		self.colSummaryLong: str = colSummaryLong if colSummaryLong is not None else colSummary
-		self.isExpanded: bool = isExpanded
+		self._isExpanded: bool = isExpanded
+
+		# Whether this node is drawn as a leaf (see LeafNode.isLeaf), cleared by invalidateLeaf
+		self._isLeaf: bool = None
+
+		# Cleared by invalidate
+		self._renderCache: LineBlock = None
+		self._measure: tuple = None
+		self._layout: tuple = None
 
 	@staticmethod
 	def copy(other: INode):
@@ -38,6 +54,58 @@ class Node:
 	def click(self):
 		self.isExpanded = not self.isExpanded
 
+
+	@property
+	def isExpanded(self):
+		return self._isExpanded
+
+	@isExpanded.setter
+	def isExpanded(self, isExpanded):
+		self._isExpanded = isExpanded
+		self.invalidate()
+
+	# Expands this node and every node drawn under it, in one pass that clears each node's caches once (instead of once per
+	# descendant, like setting isExpanded on each would).  Lazy nodes are all loaded
+	def expandAll(self):
+		self._setExpansion(None)
+
+	# Expands the nodes drawn less than depth levels below this one (this node itself for depth 1) and collapses the ones at depth
+	# Only those levels are visited, so nodes below them keep whatever state they had (and their caches)
+	def collapseToDepth(self, depth: int):
+		self._setExpansion(self.depth + depth)
+
+	def _setExpansion(self, collapseDepth: int):
+		stack = [self]
+		while len(stack) > 0:
+			node = stack.pop()
+			node._renderCache = None
+			node._measure = None
+			node._layout = None
+			node._isExpanded = collapseDepth is None or node.depth < collapseDepth
+			if node._isExpanded:
+				stack.extend(node.children)
+		self.invalidate()
+
+	@property
+	def isLoaded(self):
+		return self._childLoader is None
+
+	@property
+	def _children(self):
+		if self._childLoader is not None:
+			loader, self._childLoader = self._childLoader, None
+			self._loadedChildren = loader(self)
+			self.childCount = len(self._loadedChildren)
+		return self._loadedChildren
+
+	@_children.setter
+	def _children(self, children):
+		self._childLoader = None
+		self._loadedChildren = children
+		self.childCount = len(children)
+		self.invalidate()
+		self.invalidateLeaf()
+
 	@property
 	def contentLine(self):
 		# A collapsed line get an up arrow added to the last element of the content line, and a col summary
@@ -77,6 +145,9 @@ class Node:
 
 	@property
 	def isCollapsed(self):
+		# An unloaded node can't have hidden children yet, so its child count is enough and nothing needs to be built
+		if not self.isLoaded:
+			return not self.isExpanded and self.childCount > 1
 		return not self.isExpanded and len(self.children) > 1
 
 	@property
@@ -97,21 +168,25 @@ class Node:
 
 	# If there are children, render them and hyjack the first header and content lines of the children
 	# It is possible there is not a header line (first child is a one column child)
-	def _renderWithChildren(self, header, content, colWidths, renderedLines) -> LineBlock:
-		for child in self.children:
-			renderedLines.addLine(child.render())
-
+	def _renderWithChildren(self, header, content, colWidths, renderedLines, window = None, cache = True) -> LineBlock:
+		if window is None:
+			for child in self.children:
+				renderedLines.addLine(child.render(cache = cache))
+		else:
+			self._renderVisibleChildren(renderedLines, window, cache)
+
+		# Whether any child has a header line is known from their measures, so without one the scan only has to find the first content line
 		headerAdded = len(header) == 0
+		if not headerAdded and self._childLayout()[3][-1] == 0:
+			renderedLines.prependLine(Line(colWidths, header, self, elDecorators = Line.HEADER))
+			headerAdded = True
 		contentAdded = len(content) == 0
-		for line, lineType in renderedLines:
+		for y, line, lineType in renderedLines:
 			if lineType == Line.HEADER and not headerAdded:
-				for headerCell in header[::-1]:
-					line.insertContentCell(headerCell, Line.HEADER)
+				line.insertContentCells(header, [Line.HEADER for _ in header])
 				headerAdded = True
 			elif not lineType == Line.HEADER and not contentAdded:
-				content, decorators = content[::-1], self.contentDecorators[::-1]
-				for c in range(len(content)):
-					line.insertContentCell(content[c], decorators[c], self)
+				line.insertContentCells(content, self.contentDecorators, self)
 				contentAdded = True
 
 			if headerAdded and contentAdded:
@@ -135,7 +210,166 @@ class Node:
 		return renderedLines
 
 
-	def render(self) -> LineBlock:
+	# Only renders the children that have rows in window, replacing the runs of the others before and after them with SkippedBlocks
+	def _renderVisibleChildren(self, renderedLines, window, cache):
+		top, bottom = window
+		prepended, starts, ends, headerCounts, indices = self._childLayout()
+		children = self.children
+
+		# The hline above a child is drawn with it, so a child is visible from the row before its start
+		first = bisect.bisect_right(ends, top)
+		last = bisect.bisect_left(starts, bottom+1)
+
+		if first > 0:
+			renderedLines.addLine(SkippedBlock(children[0], children[first-1], ends[first-1] - starts[0], headerCounts[first] > 0, cache))
+		for c in range(first, last):
+			renderedLines.addLine(children[c].render((top - starts[c], bottom - starts[c]), cache))
+		if last < len(children):
+			renderedLines.addLine(SkippedBlock(children[last], children[-1], ends[-1] - starts[last], headerCounts[-1] - headerCounts[last] > 0, cache))
+
+
+	# Drops the cached render and measure of this node and of every ancestor, whose blocks all contain this node's
+	# Called whenever something that changes how this node is drawn changes
+	def invalidate(self):
+		node = self
+		while node is not None:
+			node._renderCache = None
+			node._measure = None
+			node._layout = None
+			node = node.parent
+
+	# Like invalidate, but keeps the measures and child layouts, for changes that only change what is drawn on this node's rows (ie focus)
+	def invalidateRender(self):
+		node = self
+		while node is not None:
+			node._renderCache = None
+			node = node.parent
+
+
+	# Drops the cached leaf-ness of this node and of every ancestor that depends on it, called whenever its children change
+	# An ancestor only works out its leaf-ness from this node's, so once a node has none cached neither does anything above it that depends on it
+	def invalidateLeaf(self):
+		node = self
+		while node is not None and node._isLeaf is not None:
+			node._isLeaf = None
+			node = node.parent
+
+
+	# The number of rows render produces for this node (not counting the hlines around it), and whether any of them is a header line
+	def measure(self) -> tuple:
+		if self._measure is None:
+			header = self.childHeaderLine
+			if not self.isCollapsed and len(self.children) > 0:
+				prepended, starts, ends, headerCounts, indices = self._childLayout()
+				self._measure = (ends[-1], prepended or headerCounts[-1] > 0)
+			else:
+				self._measure = ((1 if len(header) > 0 else 0) + (1 if len(self.contentLine) > 0 else 0), len(header) > 0)
+		return self._measure
+
+
+	# Where each child's own rows start and end in this node's rows, how many children before each one have a header line, and
+	# each child's index by id (children are compared by identity, as LeafNodes compare equal to the node they were made from)
+	# Children are separated by hlines, and if none of them has a header line this node prepends its own header line above them
+	def _childLayout(self) -> tuple:
+		if self._layout is None:
+			starts = []
+			ends = []
+			headerCounts = [0]
+			indices = {}
+			start = 0
+			for child in self.children:
+				rows, hasHeader = child.measure()
+				indices[id(child)] = len(starts)
+				starts.append(start)
+				ends.append(start + rows)
+				headerCounts.append(headerCounts[-1] + (1 if hasHeader else 0))
+				start += rows + 1
+
+			prepended = len(self.childHeaderLine) > 0 and headerCounts[-1] == 0
+			if prepended:
+				starts = [start+1 for start in starts]
+				ends = [end+1 for end in ends]
+			self._layout = (prepended, starts, ends, headerCounts, indices)
+		return self._layout
+
+
+	# child's index in children, looked up in the cached child layout
+	# A LeafNode that has since been rebuilt by its parent is not in it, but compares equal to the node that replaced it
+	def childIndex(self, child) -> int:
+		idx = self._childLayout()[4].get(id(child))
+		if idx is None:
+			return self.children.index(child)
+		return idx
+
+
+	# The rows render puts this node's block on, relative to the root's rows, or None if it is not drawn (ie it is inside a collapsed node)
+	# Header lines prepended by ancestors go into the first block of their first child, so they are part of the block
+	# Every ancestor's child layout is cached, so this only costs a lookup per ancestor
+	def getBlockRowRange(self) -> tuple:
+		ownStart = 0
+		prependedAbove = 0
+		inFirstChain = True
+		node = self
+		while node.parent is not None:
+			parent = node.parent
+			if parent.isCollapsed:
+				return None
+			prepended, starts, ends, headerCounts, indices = parent._childLayout()
+			idx = indices.get(id(node))
+			if idx is None:
+				return None
+			ownStart += starts[idx]
+			inFirstChain = inFirstChain and idx == 0
+			if inFirstChain and prepended:
+				prependedAbove += 1
+			node = parent
+
+		return (ownStart - prependedAbove, ownStart + self.measure()[0] - 1)
+
+
+	# The deepest node whose own rows include row (relative to this node's rows, as counted by measure), along with where row is in
+	# that node's rows.  The hlines between children and the header lines that are prepended belong to the parent
+	def getNodeAtRow(self, row: int) -> tuple:
+		node = self
+		while not node.isCollapsed and len(node.children) > 0:
+			prepended, starts, ends, headerCounts, indices = node._childLayout()
+			idx = bisect.bisect_right(starts, row) - 1
+			if idx < 0 or row >= ends[idx]:
+				break
+			row -= starts[idx]
+			node = node.children[idx]
+		return (node, row)
+
+
+	# window limits rendering to the rows [top, bottom) of this node's rows (as counted by measure), which keeps the cost of drawing a
+	# screenful of a huge tree down to what is on screen.  Every row in the window is rendered exactly as a full render would
+	# Whole renders are cached until the node is invalidated, and handed back with whatever parents added to them last time taken back out
+	# Without cache, nothing is read from or put in any node's render cache, so the blocks it makes are only held by the caller (ie to
+	# export a table a chunk at a time)
+	def render(self, window: tuple = None, cache: bool = True) -> LineBlock:
+		rows, hasHeader = self.measure()
+		if window is not None and (window[0] > 0 or window[1] < rows):
+			# The cached renders of the children drawn in full are handed out again below, and taking this node's old cells back out of
+			# them would leave its own cached block (and its ancestors', which are all rendered through a window too) wrong
+			if cache:
+				self._renderCache = None
+			return self._render(window, cache)
+
+		if not cache:
+			return self._render(cache = cache)
+
+		if self._renderCache is not None:
+			Node.renderCacheHits += 1
+			self._renderCache.restorePristine()
+			return self._renderCache
+
+		Node.renderCacheMisses += 1
+		self._renderCache = self._render()
+		self._renderCache.savePristine(hasHeader)
+		return self._renderCache
+
+
+	def _render(self, window: tuple = None, cache: bool = True) -> LineBlock:
 		renderedLines: LineBlock = LineBlock(self)
 
 		header = self.childHeaderLine
@@ -146,10 +380,22 @@ class Node:
 			return self._renderCollapsed(header, content, colWidths, renderedLines)
 
 		if len(self.children) > 0:
-			return self._renderWithChildren(header, content, colWidths, renderedLines)
+			return self._renderWithChildren(header, content, colWidths, renderedLines, window, cache)
 
 		return self._renderLeaf(header, content, colWidths, renderedLines)
 
 
+	# The fraction of whole renders served from the cache since the counters were last reset
+	@staticmethod
+	def renderCacheHitRate() -> float:
+		total = Node.renderCacheHits + Node.renderCacheMisses
+		return Node.renderCacheHits / total if total > 0 else 0.0
+
+	@staticmethod
+	def resetRenderCacheCounters():
+		Node.renderCacheHits = 0
+		Node.renderCacheMisses = 0
+
+
 	def __str__(self):
 		return str(self._contentLine[0])
@@ -0,0 +1,504 @@
+from ..config import Config
+from typing import List
+from array import array
+import pandas as pd
+import numpy as np
+
+# One node of a PathTrie: all the rows that share the codes of every grouping column down to its level
+# Instead of keeping those rows it keeps running totals of them, which is everything a group's node needs to be drawn
+class PathNode:
+	__slots__ = ['parent', 'code', 'level', 'children', 'emptied', 'totals', 'mins', 'maxs', 'rows', 'leafId', 'view']
+
+	def __init__(self, parent: 'PathNode', code: int, width: int, extremes: int):
+		self.parent = parent
+		self.code = code
+		self.level = 0 if parent is None else parent.level+1
+		self.children = {}
+		# Children left without rows (by remove or filter) by code, which are put back as they are if they get rows again
+		self.emptied = {}
+		# The row count, then the non na count of every tracked column, then the sum and non integral count of every value column
+		self.totals = np.zeros(width)
+		self.mins = np.full(extremes, np.nan) if extremes > 0 else None
+		self.maxs = np.full(extremes, np.nan) if extremes > 0 else None
+		# The ids of the rows that end at this node (in order), only used for nodes that have a code for every grouping column
+		self.rows = None
+		self.leafId = -1
+		# The tree node drawn for the group that starts at this node, once one has been made (see Tree._fromTrie)
+		self.view = None
+
+
+	@property
+	def rowCount(self) -> int:
+		return int(self.totals[0])
+
+
+	# The ids of every row under this node, unsorted
+	def subtreeRows(self) -> np.ndarray:
+		if self.rows is not None:
+			return np.array(self.rows, dtype=np.int64)
+		parts = [child.subtreeRows() for child in self.children.values()]
+		return np.concatenate(parts) if len(parts) > 0 else np.zeros(0, dtype=np.int64)
+
+
+# Groups rows by their codes on every non hidden column, left to right, as they are added, so a tree can be built from data that
+# never all exists at once (ie the chunks of pd.read_csv(..., chunksize=...))
+# Rows whose codes agree on the first n grouping columns share the node at level n, so every group of the tree, at any depth, is one
+# of these nodes (or a chain of them through na codes) and its summaries come from the node's totals
+# Only grouping codes, row ids and totals of the value columns (countable and aggregated columns) are kept, the rest of every chunk is dropped
+# That needs summaries that can be added up, which are the default summary and the sum, count, size, mean, min and max aggregations
+# Any other summary (a user summarize, or other aggregations) is made by summarizing the group's rows, so for those every chunk is kept
+# Rows can also be removed again: the leaves they were in are counted again from the values kept per row, and their ancestors re-added from their children
+# Filtering takes rows out of the totals the same way, but only hides them, so they can be put back in by a later filter
+class PathTrie:
+	AGGREGATIONS = {'sum', 'count', 'size', 'mean', 'min', 'max'}
+
+	def __init__(self, columns: List[str], config: Config):
+		self.config = config
+		self.columns = list(columns)
+		self.hidden: List[bool] = [col in config.hiddenCols for col in self.columns]
+		self.addsUp = config.usesDefaultSummary or (config.usesAggregations and all(func in PathTrie.AGGREGATIONS for funcs in config.aggregations.values() for func in funcs))
+		# Every chunk as (id of its first row, chunk), for summaries that are made from the rows
+		self.chunks: List[tuple] = None if self.addsUp else []
+
+		# Levels are the grouping columns, values are the columns summaries are calculated from
+		self.levelCols = [c for c in range(len(self.columns)) if not self.hidden[c]]
+		aggregated = config.aggregations.keys() if config.usesAggregations else []
+		self.valueCols = [c for c, col in enumerate(self.columns) if col in config.countableCols or col in aggregated] if self.addsUp else []
+		self.valueIds = {c: v for v, c in enumerate(self.valueCols)}
+		# Hidden columns that are not values never change how a group is drawn, so their na counts are not needed
+		# unless the group's rows are summarized, which gets every column that is not all na
+		self.tracked = sorted(set(self.levelCols).union(self.valueCols)) if self.addsUp else list(range(len(self.columns)))
+		self.trackedIds = {c: t for t, c in enumerate(self.tracked)}
+		self.levelOf = {c: level for level, c in enumerate(self.levelCols)}
+		self.isFloat = [False for _ in self.valueCols]
+		self.width = 1 + len(self.tracked) + 2*len(self.valueCols)
+		self.extremes = len(self.valueCols) if config.usesAggregations and any(func in ('min', 'max') for funcs in config.aggregations.values() for func in funcs) else 0
+
+		# Per grouping column, the code of every value seen so far, the values by code, and the string each leaf row shows for them
+		self.codes = [{} for _ in self.levelCols]
+		self.values = [[] for _ in self.levelCols]
+		self.labels = [[] for _ in self.levelCols]
+		self.naLabels = ['nan' for _ in self.levelCols]
+		# The categories of grouping columns that are categorical (in order, across every chunk), and the cached order of the values by code
+		self.categories = [None for _ in self.levelCols]
+		self._ranks = [None for _ in self.levelCols]
+
+		self.root = PathNode(None, -1, self.width, self.extremes)
+		self.nextRowId = 0
+
+		# Per row id, the leaf it ended up in (-1 once removed) and its values, so removed rows can be taken back out of the totals
+		self.leaves: List[PathNode] = []
+		self.rowLeaf = array('q')
+		self.valuesByRow = array('d')
+		# Per row id, whether the current filter shows it (it is in its leaf's rows and totals)
+		self.rowShown = array('b')
+
+
+	def __len__(self):
+		return self.root.rowCount
+
+
+	def _newNode(self, parent: PathNode, code: int) -> PathNode:
+		node = parent.emptied.pop(code, None)
+		if node is None:
+			node = PathNode(parent, code, self.width, self.extremes)
+		parent.children[code] = node
+		return node
+
+
+	# Codes a chunk's column with the codes of earlier chunks, giving new values the next free codes
+	def _encode(self, level: int, series: pd.Series) -> np.ndarray:
+		if isinstance(series.dtype, pd.CategoricalDtype):
+			categories = self.categories[level] if self.categories[level] is not None else []
+			known = set(categories)
+			self.categories[level] = [*categories, *[category for category in series.cat.categories if category not in known]]
+		localCodes, uniques = pd.factorize(series)
+		codes, values, labels = self.codes[level], self.values[level], self.labels[level]
+
+		localLabels = None
+		mapping = np.empty(len(uniques)+1, dtype=np.int64)
+		mapping[-1] = -1
+		for u, value in enumerate(uniques):
+			code = codes.get(value)
+			if code is None:
+				if localLabels is None:
+					localLabels = series.astype(str).to_numpy(dtype=object)
+					firsts = np.full(len(uniques), -1, dtype=np.int64)
+					valid = localCodes >= 0
+					firsts[localCodes[valid][::-1]] = np.flatnonzero(valid)[::-1]
+				code = len(values)
+				codes[value] = code
+				values.append(value)
+				labels.append(localLabels[firsts[u]])
+			mapping[u] = code
+
+		if (localCodes < 0).any():
+			self.naLabels[level] = str(series[localCodes < 0].astype(str).iloc[0])
+		return mapping[localCodes]
+
+
+	# Adds the rows of a chunk, which must have the same columns as the trie
+	# Returns every node whose totals changed, including new ones
+	def addChunk(self, chunk: pd.DataFrame) -> List[PathNode]:
+		if list(chunk.columns) != self.columns:
+			raise ValueError('Every chunk must have the columns ' + str(self.columns))
+		n = len(chunk)
+		if n == 0:
+			return []
+		rowIds = np.arange(self.nextRowId, self.nextRowId+n, dtype=np.int64)
+		if self.chunks is not None:
+			self.chunks.append((self.nextRowId, chunk))
+		self.nextRowId += n
+
+		codes = np.full((n, len(self.levelCols)), -1, dtype=np.int64)
+		for level, c in enumerate(self.levelCols):
+			codes[:, level] = self._encode(level, chunk.iloc[:, c])
+
+		values = np.zeros((n, len(self.valueCols)))
+		for v, c in enumerate(self.valueCols):
+			column = pd.to_numeric(chunk.iloc[:, c])
+			self.isFloat[v] = self.isFloat[v] or np.issubdtype(column.dtype, np.floating)
+			values[:, v] = column.to_numpy(dtype=np.float64, na_value=np.nan)
+		filled = np.nan_to_num(values, nan=0)
+		self.valuesByRow.extend(values.ravel().tolist())
+
+		# Everything that is added up per node, as one row per chunk row
+		totals = np.concatenate([
+			np.ones((n, 1)),
+			chunk.iloc[:, self.tracked].notna().to_numpy(dtype=np.float64),
+			filled,
+			(filled != np.floor(filled)).astype(np.float64)
+		], axis=1)
+
+		# Sort the chunk like a GroupIndex does, then the rows of every node are runs of equal code prefixes
+		order = np.lexsort(codes.T[::-1]) if len(self.levelCols) > 0 else np.arange(n)
+		codes, totals, values, rowIds = codes[order], totals[order], values[order], rowIds[order]
+
+		touched = []
+		changed = np.zeros(max(n-1, 0), dtype=bool)
+		nodes = [self.root]
+		runStarts = np.zeros(1, dtype=np.int64)
+		for level in range(len(self.levelCols)+1):
+			if level > 0:
+				changed |= codes[1:, level-1] != codes[:-1, level-1]
+				starts = np.concatenate([[0], np.flatnonzero(changed) + 1])
+				# Each run at this level is inside exactly one run of the level above, so its parent is the last run that starts at or before it
+				parents = np.searchsorted(runStarts, starts, side='right') - 1
+				levelCodes = codes[starts, level-1].tolist()
+				nodes = [nodes[p].children.get(code) or self._newNode(nodes[p], code) for p, code in zip(parents.tolist(), levelCodes)]
+				runStarts = starts
+
+			runTotals = np.add.reduceat(totals, runStarts, axis=0)
+			runMins = np.fmin.reduceat(values, runStarts, axis=0) if self.extremes > 0 else None
+			runMaxs = np.fmax.reduceat(values, runStarts, axis=0) if self.extremes > 0 else None
+			touched.extend(nodes)
+			for r, node in enumerate(nodes):
+				node.totals += runTotals[r]
+				if self.extremes > 0:
+					node.mins = np.fmin(node.mins, runMins[r])
+					node.maxs = np.fmax(node.maxs, runMaxs[r])
+
+		# The last level's runs are full code paths, which hold their rows
+		ends = [*runStarts[1:].tolist(), n]
+		for node, start, end in zip(nodes, runStarts.tolist(), ends):
+			if node.rows is None:
+				node.rows = array('q')
+				node.leafId = len(self.leaves)
+				self.leaves.append(node)
+			node.rows.extend(rowIds[start:end].tolist())
+
+		rowLeaf = np.empty(n, dtype=np.int64)
+		rowLeaf[order] = np.repeat([node.leafId for node in nodes], np.diff([*runStarts.tolist(), n]))
+		self.rowLeaf.extend(rowLeaf.tolist())
+		self.rowShown.extend([1] * n)
+		return touched
+
+
+	# The totals of a leaf, counted again from its rows
+	def _recount(self, leaf: PathNode):
+		rows = np.array(leaf.rows, dtype=np.int64)
+		values = np.frombuffer(self.valuesByRow, dtype=np.float64).reshape(-1, len(self.valueCols))[rows] if len(self.valueCols) > 0 else np.zeros((len(rows), 0))
+		filled = np.nan_to_num(values, nan=0)
+
+		# Every row of a leaf has the same codes, so a grouping column is either na for all of them or for none
+		codes = {}
+		node = leaf
+		while node.parent is not None:
+			codes[self.levelCols[node.level-1]] = node.code
+			node = node.parent
+		valueNotna = (~np.isnan(values)).sum(axis=0)
+		rowNotna = self.rowFrame(rows).notna().to_numpy().sum(axis=0) if self.chunks is not None else None
+		notna = np.array([(len(rows) if codes[c] >= 0 else 0) if c in codes else valueNotna[self.valueIds[c]] if c in self.valueIds else rowNotna[c] for c in self.tracked], dtype=np.float64)
+
+		leaf.totals = np.concatenate([[len(rows)], notna, filled.sum(axis=0), (filled != np.floor(filled)).sum(axis=0)])
+		if self.extremes > 0:
+			leaf.mins = np.fmin.reduce(values, axis=0, initial=np.nan)
+			leaf.maxs = np.fmax.reduce(values, axis=0, initial=np.nan)
+
+
+	# The ids of every row still in the trie (shown or not), in the order they were added, checking that mask has one value for each
+	# (no mask is true for all of them)
+	def _liveRows(self, mask) -> tuple:
+		live = np.flatnonzero(self.liveRows())
+		mask = np.ones(len(live), dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+		if len(mask) != len(live):
+			raise ValueError('The mask has ' + str(len(mask)) + ' values, but there are ' + str(len(live)) + ' rows')
+		return (live, mask)
+
+	# rowIds split up by the leaf they are in, as {leafId: sorted row ids}
+	def _byLeaf(self, rowIds: np.ndarray) -> dict:
+		leafIds = np.frombuffer(self.rowLeaf, dtype=np.int64)[rowIds]
+		order = np.argsort(leafIds, kind='stable')
+		leafIds, rowIds = leafIds[order], rowIds[order]
+		bounds = np.flatnonzero(leafIds[1:] != leafIds[:-1]) + 1
+		return {int(leafIds[start]): rows for start, rows in zip([0, *bounds.tolist()], np.split(rowIds, bounds))} if len(rowIds) > 0 else {}
+
+
+	# Removes the rows where mask is true, where mask has one value per row still in the trie (shown or not), in the order they were added
+	# Returns every node whose totals changed, including the ones that were emptied and taken out of the trie
+	def remove(self, mask) -> List[PathNode]:
+		live, mask = self._liveRows(mask)
+		rowIds = live[mask]
+		removed = self._byLeaf(rowIds)
+		for r in rowIds.tolist():
+			self.rowLeaf[r] = -1
+
+		leaves = []
+		for leafId, rows in removed.items():
+			leaf = self.leaves[leafId]
+			leaf.rows = array('q', np.setdiff1d(np.array(leaf.rows, dtype=np.int64), rows, assume_unique=True).tolist())
+			leaves.append(leaf)
+		touched = self._recountLeaves(leaves)
+
+		# Chunks are dropped once none of their rows are left
+		if self.chunks is not None:
+			live = self.liveRows()
+			self.chunks = [(firstId, chunk) for firstId, chunk in self.chunks if live[firstId:firstId + len(chunk)].any()]
+		return touched
+
+
+	# Shows only the rows where keep is true, where keep has one value per row still in the trie, in the order they were added (or all of them)
+	# Rows it hides are taken out of their groups just like remove does, and hidden rows it shows again are put back in theirs
+	# Returns every node whose totals changed, including the ones that were emptied and taken out of the trie or put back in it
+	def filter(self, keep) -> List[PathNode]:
+		live, keep = self._liveRows(keep)
+		shown = np.frombuffer(self.rowShown, dtype=np.int8)[live] > 0
+		return self._setShown(live[shown & ~keep], live[~shown & keep])
+
+	# Filters out just the rows rowIds (ie rows that were just added and do not match the current filter), like filter does
+	def hide(self, rowIds: np.ndarray) -> List[PathNode]:
+		return self._setShown(rowIds, np.zeros(0, dtype=np.int64))
+
+	# Whether each row id is still in the trie (shown or not)
+	def liveRows(self) -> np.ndarray:
+		return np.frombuffer(self.rowLeaf, dtype=np.int64) >= 0
+
+	def _setShown(self, hideIds: np.ndarray, showIds: np.ndarray) -> List[PathNode]:
+		hidden = self._byLeaf(hideIds)
+		unhidden = self._byLeaf(showIds)
+
+		leaves = []
+		for leafId in set(hidden.keys()).union(unhidden.keys()):
+			leaf = self.leaves[leafId]
+			rows = np.array(leaf.rows, dtype=np.int64)
+			if leafId in hidden:
+				rows = np.setdiff1d(rows, hidden[leafId], assume_unique=True)
+				for r in hidden[leafId].tolist():
+					self.rowShown[r] = 0
+			if leafId in unhidden:
+				rows = np.union1d(rows, unhidden[leafId])
+				for r in unhidden[leafId].tolist():
+					self.rowShown[r] = 1
+			leaf.rows = array('q', rows.tolist())
+			leaves.append(leaf)
+
+			# A leaf that had been emptied is put back along with every emptied node above it
+			node = leaf
+			while len(leaf.rows) > 0 and node.parent is not None and node.parent.emptied.get(node.code) is node:
+				node.parent.children[node.code] = node.parent.emptied.pop(node.code)
+				node = node.parent
+		return self._recountLeaves(leaves)
+
+
+	# Counts leaves again from their rows, and every node above them again from its children, setting aside the children left without rows
+	def _recountLeaves(self, leaves: List[PathNode]) -> List[PathNode]:
+		touched = set()
+		for leaf in leaves:
+			self._recount(leaf)
+			touched.add(leaf)
+
+		level = [node.parent for node in touched if node.parent is not None]
+		while len(level) > 0:
+			parents = set()
+			for node in level:
+				if node in touched:
+					continue
+				touched.add(node)
+				children = list(node.children.values())
+				for child in children:
+					if child.rowCount == 0:
+						node.emptied[child.code] = node.children.pop(child.code)
+				# A node can have no children left to count (ie when rows that were filtered out are removed)
+				node.totals = np.sum([child.totals for child in children], axis=0) if len(children) > 0 else np.zeros(self.width)
+				if self.extremes > 0:
+					node.mins = np.fmin.reduce([child.mins for child in children], axis=0) if len(children) > 0 else np.full(self.extremes, np.nan)
+					node.maxs = np.fmax.reduce([child.maxs for child in children], axis=0) if len(children) > 0 else np.full(self.extremes, np.nan)
+				if node.parent is not None:
+					parents.add(node.parent)
+			level = list(parents)
+		return list(touched)
+
+
+	# The same columns GroupIndex.groupCols gives for the group at node, as column positions
+	def groupCols(self, node: PathNode, colStart: int) -> List[int]:
+		notna = node.totals[1:1+len(self.tracked)]
+		cols = [c for t, c in enumerate(self.tracked) if c >= colStart and notna[t] > 0]
+
+		# Remove all hidden columns that are before the first non hidden column
+		while len(cols) > 0 and self.hidden[cols[0]]:
+			cols.pop(0)
+		return cols
+
+
+	# Grouping columns between a group's colStart and its group column are all na for it, so it continues through their na codes
+	def _descend(self, node: PathNode, colStart: int, groupCol: int) -> PathNode:
+		for c in self.levelCols:
+			if colStart <= c < groupCol:
+				node = node.children[-1]
+		return node
+
+
+	# The value, as it would be summarized, of a value column's total
+	def _value(self, node: PathNode, v: int, func: str):
+		notna = node.totals[1+self.trackedIds[self.valueCols[v]]]
+		sum = node.totals[1+len(self.tracked)+v]
+		if func == 'size':
+			return node.rowCount
+		if func == 'count':
+			return int(notna)
+		if func == 'mean':
+			return float(sum / notna) if notna > 0 else np.nan
+		if func == 'sum':
+			return float(sum) if self.isFloat[v] else int(sum)
+		value = node.mins[v] if func == 'min' else node.maxs[v]
+		return float(value) if self.isFloat[v] or np.isnan(value) else int(value)
+
+
+	# The rows with the (sorted) ids rowIds, for tries that keep their chunks
+	def rowFrame(self, rowIds: np.ndarray) -> pd.DataFrame:
+		frames = []
+		for firstId, chunk in self.chunks:
+			start, end = np.searchsorted(rowIds, [firstId, firstId + len(chunk)])
+			if end > start:
+				frames.append(chunk.iloc[rowIds[start:end] - firstId])
+		if len(frames) == 0:
+			return self.chunks[0][1].iloc[:0]
+		return frames[0] if len(frames) == 1 else pd.concat(frames)
+
+
+	def summarize(self, node: PathNode, cols: List[int]) -> tuple:
+		config = self.config
+		if self.chunks is not None:
+			# Aggregations are of whole groups (like AggregationRollup's), even of the columns that are all na in the group
+			df = self.rowFrame(np.sort(node.subtreeRows()))
+			df = df if config.usesAggregations else df.iloc[:, cols]
+			return (config.summarize(df, df.columns[0], long = False), config.summarize(df, df.columns[0], long = True))
+		if config.usesAggregations:
+			values = {}
+			for col, funcs in config.aggregations.items():
+				v = self.valueIds[self.columns.index(col)]
+				for func in funcs:
+					values[(col, func)] = self._value(node, v, func)
+			return (config.formatAggregates(values, long = False), config.formatAggregates(values, long = True))
+
+		sums = []
+		nonIntegral = node.totals[1+len(self.tracked)+len(self.valueCols):]
+		for c in cols:
+			if c in self.valueIds and self.columns[c] in config.countableCols:
+				v = self.valueIds[c]
+				# Sums of whole numbers are shown as ints, just like defaultSummary downcasts them
+				sum = node.totals[1+len(self.tracked)+v]
+				sums.append((self.columns[c], int(sum) if nonIntegral[v] == 0 else float(sum)))
+		return (config.formatSums(sums, long = False), config.formatSums(sums, long = True))
+
+
+	# (value, rowId) for every row under node, with the value of the group column as a string, in the order the rows were added
+	def rowValues(self, node: PathNode, groupCol: int) -> List[tuple]:
+		level = self.levelOf[groupCol]
+		ids = []
+		codes = []
+		for code, child in node.children.items():
+			rows = child.subtreeRows()
+			ids.append(rows)
+			codes.append(np.full(len(rows), code, dtype=np.int64))
+		if len(ids) == 0:
+			return []
+		ids = np.concatenate(ids)
+		order = np.argsort(ids, kind='stable')
+		labels, naLabel = self.labels[level], self.naLabels[level]
+		return [(labels[code] if code >= 0 else naLabel, id) for code, id in zip(np.concatenate(codes)[order].tolist(), ids[order].tolist())]
+
+
+	# The place of every value of a grouping column (by code) in the order GroupIndex sorts them in, which is pd.factorize(sort=True)'s:
+	# category order for categoricals, and an order that works for columns that mix types
+	def _rank(self, level: int) -> np.ndarray:
+		values = self.values[level]
+		ranks = self._ranks[level]
+		if ranks is None or len(ranks) != len(values):
+			if self.categories[level] is not None:
+				series = pd.Series(pd.Categorical(values, categories = self.categories[level]))
+			else:
+				series = pd.Series(values, dtype=object).infer_objects()
+			ranks, uniques = pd.factorize(series, sort = True)
+			self._ranks[level] = ranks
+		return ranks
+
+
+	# Splits a group into one (groupName, node) per distinct value of its group column, in sorted order
+	def subgroups(self, node: PathNode, groupCol: int) -> List[tuple]:
+		level = self.levelOf[groupCol]
+		values = self.values[level]
+		ranks = self._rank(level)
+		codes = sorted([code for code in node.children.keys() if code >= 0], key = lambda code: ranks[code])
+		return [(values[code], node.children[code]) for code in codes]
+
+
+	# The same as GroupIndex.searchEntries, for the tree made from the trie
+	def searchEntries(self) -> List[tuple]:
+		entries = []
+		stack = [(self.root, 0, ())]
+		while len(stack) > 0:
+			node, colStart, path = stack.pop()
+			cols = self.groupCols(node, colStart)
+			groupCol = cols[0]
+			node = self._descend(node, colStart, groupCol)
+			if len([c for c in cols if not self.hidden[c]]) > 1:
+				for c, (gn, child) in enumerate(self.subgroups(node, groupCol)):
+					entries.append((gn, (*path, c)))
+					stack.append((child, groupCol+1, (*path, c)))
+			else:
+				entries.extend([(val, (*path, c)) for c, (val, rowId) in enumerate(self.rowValues(node, groupCol))])
+		return entries
+
+
+	# The same as GroupIndex.describeGroup, except that groups are (name, PathNode), or (name, rowId) for leaf rows
+	def describeGroup(self, node: PathNode, colStart: int) -> tuple:
+		config = self.config
+		cols = self.groupCols(node, colStart)
+		groupCol = cols[0]
+
+		childColName = str(config.colNameCleanup(self.columns[groupCol]))
+		colSummary, colSummaryLong = [str(summary) for summary in self.summarize(node, cols)]
+
+		# Count the number of non hidden columns left in the group
+		colCount = len([c for c in cols if not self.hidden[c]])
+
+		node = self._descend(node, colStart, groupCol)
+		if colCount > 1:
+			groups = self.subgroups(node, groupCol)
+			childColWidth = max([len(childColName), *[len(str(gn))+2 for gn, child in groups]])
+		else:
+			groups = self.rowValues(node, groupCol)
+			childColWidth = max([len(childColName), *[len(val) for val, rowId in groups]])
+
+		return (groupCol, colCount, childColName, colSummary, colSummaryLong, groups, childColWidth)
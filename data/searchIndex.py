@@ -0,0 +1,58 @@
+from typing import List
+import bisect
+
+
+# Every value drawn in the tree's cells (group names and leaf row values), lowercased and sorted, each with the path to the node it is
+# drawn on.  Paths are the indices of the node and its ancestors in their parent's _children, so they sort in the order the tree is drawn
+# in, and the nodes they lead to do not need to exist yet (ie in lazy trees) until they are revealed
+# entries are (value, path) pairs, which come from whatever the tree's nodes are made from (see GroupIndex.searchEntries), so making the
+# index never makes a node.  After that finding every node with a value starting with some prefix is two bisects
+class SearchIndex:
+	def __init__(self, root, entries: List[tuple]):
+		self.root = root
+		entries = sorted([(str(value).lower(), path) for value, path in entries])
+		self.values: List[str] = [value for value, path in entries]
+		self.nodePaths: List[tuple] = [path for value, path in entries]
+		self._lastQuery = None
+		self._lastMatches = []
+
+		# The index of every child in its parent's _children by id, per parent, made for the parents pathOf goes through
+		self._positions = {}
+
+
+	def __len__(self):
+		return len(self.values)
+
+
+	# The paths of every node with a value that starts with query (ignoring case), in the order they are drawn
+	def find(self, query: str) -> List[tuple]:
+		query = query.lower()
+		if query != self._lastQuery:
+			start = bisect.bisect_left(self.values, query)
+			end = bisect.bisect_left(self.values, query + '\U0010ffff', start)
+			self._lastMatches = sorted(set(self.nodePaths[start:end]))
+			self._lastQuery = query
+		return self._lastMatches
+
+
+	# The path of a node in the tree the index was built from (a LeafNode's is the path to the node of its focused cell), or None
+	def pathOf(self, node) -> tuple:
+		derivedNode = getattr(node, 'derivedNode', None)
+		if derivedNode is not None:
+			path = self.pathOf(derivedNode)
+			if path is None:
+				return None
+			return (*path, *[0 for _ in range(node.focusedIdx)])
+
+		path = []
+		while node.parent is not None:
+			positions = self._positions.get(id(node.parent))
+			if positions is None:
+				positions = {id(child): c for c, child in enumerate(node.parent._children)}
+				self._positions[id(node.parent)] = positions
+			c = positions.get(id(node))
+			if c is None:
+				return None
+			path.append(c)
+			node = node.parent
+		return tuple(reversed(path)) if node is self.root else None
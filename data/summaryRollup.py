@@ -0,0 +1,97 @@
+from typing import List
+import pandas as pd
+import numpy as np
+
+# Precomputes the default summary (the sum of every countable column) for every group of a GroupIndex
+# A group's rows are exactly the sorted rows that share its codes on every column before its group column, so for a given prefix length
+# the sorted rows split into runs that are precisely the groups at that depth, and np.add.reduceat sums all of them in one pass
+# Those per prefix tables are built the first time a group needs them, then every summary is a lookup
+class SummaryRollup:
+	def __init__(self, index):
+		self.index = index
+		self.config = index.config
+
+		# Every countable column converted once (in sorted order) the same way defaultSummary converts a group's column
+		self.values = {}
+		self.isFloat = {}
+		for c, col in enumerate(index.columns):
+			if col not in self.config.countableCols:
+				continue
+			values = pd.to_numeric(index.source.iloc[:, c].fillna(0)).to_numpy()[index.order]
+			self.isFloat[c] = np.issubdtype(values.dtype, np.floating)
+			self.values[c] = values if self.isFloat[c] else values.astype(np.int64)
+
+		self._tables = {}
+
+
+	# Returns (groupStarts, sums, nonIntegralCounts) for every group made by the columns before prefixLen
+	def _table(self, prefixLen: int):
+		if prefixLen not in self._tables:
+			starts = self.index.groupStarts(prefixLen)
+
+			sums = {}
+			nonIntegral = {}
+			for c, values in self.values.items():
+				sums[c] = np.add.reduceat(values, starts) if len(values) > 0 else values
+				# Float columns whose group values are all whole numbers get downcast to ints by defaultSummary, so count the rest
+				if self.isFloat[c]:
+					nonIntegral[c] = np.add.reduceat((values != np.floor(values)).astype(np.int64), starts) if len(values) > 0 else values
+
+			self._tables[prefixLen] = (starts, sums, nonIntegral)
+		return self._tables[prefixLen]
+
+
+	# The (colName, sum) pairs defaultSummary would produce for the group [start, end) with the given columns
+	def groupSums(self, start: int, end: int, cols: List[int]) -> List[tuple]:
+		starts, sums, nonIntegral = self._table(cols[0])
+		group = int(np.searchsorted(starts, start))
+
+		groupSums = []
+		for c in cols:
+			if c not in sums:
+				continue
+			sum = sums[c][group]
+			if not self.isFloat[c] or nonIntegral[c][group] == 0:
+				sum = int(sum)
+			else:
+				sum = float(sum)
+			groupSums.append((self.index.columns[c], sum))
+		return groupSums
+
+
+	def summarize(self, start: int, end: int, cols: List[int]):
+		sums = self.groupSums(start, end, cols)
+		return (self.config.formatSums(sums, long = False), self.config.formatSums(sums, long = True))
+
+
+# Evaluates a Config's declarative aggregations for every group of a GroupIndex
+# Groups are found the same way as in SummaryRollup, and each prefix length is a single groupby().agg over the group ids of the sorted rows
+class AggregationRollup:
+	def __init__(self, index):
+		self.index = index
+		self.config = index.config
+
+		# Only the aggregated columns, sorted once so every group is a run of rows
+		self.frame = index.source[list(self.config.aggregations.keys())].take(index.order).reset_index(drop = True)
+		self._tables = {}
+
+
+	# Returns (groupStarts, {(colName, aggregation): values per group}) for every group made by the columns before prefixLen
+	def _table(self, prefixLen: int):
+		if prefixLen not in self._tables:
+			starts = self.index.groupStarts(prefixLen)
+			groupIds = np.repeat(np.arange(len(starts)), np.diff([*starts, len(self.frame)]))
+			table = self.frame.groupby(groupIds, sort = False).agg(self.config.aggregations)
+			self._tables[prefixLen] = (starts, {key: table[key].to_numpy() for key in table.columns})
+		return self._tables[prefixLen]
+
+
+	def groupAggregates(self, start: int, end: int, cols: List[int]) -> dict:
+		starts, table = self._table(cols[0])
+		group = int(np.searchsorted(starts, start))
+		return {key: values[group] for key, values in table.items()}
+
+
+	def summarize(self, start: int, end: int, cols: List[int]):
+		values = self.groupAggregates(start, end, cols)
+		return (self.config.formatAggregates(values, long = False), self.config.formatAggregates(values, long = True))
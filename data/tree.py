@@ -2,6 +2,15 @@ from .childCondensingNode import ChildCondensingNode
 from ..config import Config
 from typing import List
 import pandas as pd
+import numpy as np
+import bisect
+import re
+from .groupIndex import GroupIndex
+from .treeStore import TreeStore, TreeStoreBuilder
+from .treeCache import TreeCache
+from .pathTrie import PathTrie, PathNode
+from .searchIndex import SearchIndex
+from concurrent.futures import ProcessPoolExecutor
 
 class ITree:
 	pass
@@ -9,21 +18,309 @@ class ITree:
 BaseNode = ChildCondensingNode
 
 class Tree:
-	def __init__(self, df: pd.DataFrame, config: Config):
-		self.root = Tree.buildTree(df, config)
+	# lazy only builds nodes' children as they are needed
+	# compact builds the whole tree into a TreeStore up front, and only makes nodes from it as they are needed
+	# workers > 1 builds the top level groups of a compact tree in that many processes.  It is ignored for lazy trees, which build almost nothing up front
+	# cache is a TreeCache to load the compact tree from, or save it to once built (cacheHit says which happened)
+	# trie is a PathTrie to build the tree from instead of df (see fromChunks), in which case df is None
+	# append and remove move any tree onto a PathTrie the first time they are called, after which df is None as well
+	def __init__(self, df: pd.DataFrame, config: Config, lazy: bool = False, workers: int = None, compact: bool = False, cache: TreeCache = None, trie: PathTrie = None):
+		self.df = df
+		self.config = config
+		self._index: GroupIndex = None
+		self.store: TreeStore = None
+		self.trie = trie
+		self.cacheHit = False
+		self._searchIndex: SearchIndex = None
+		# The frames of every row of the tree, as (id of its first row, frame) in the order they were added, which filters are evaluated
+		# against (None when they are not kept, ie for chunked trees)
+		self._sources: List[tuple] = [(0, df)] if df is not None else None
+		self.filterPredicate = None
+
+		if trie is not None:
+			self.root = Tree._fromTrie(trie, trie.root, 0, 'root', [], 0)
+			self.root.isExpanded = True
+			return
+
+		cache = cache if not lazy else None
+		if cache is not None:
+			cacheKey = cache.key(df, config)
+			self.store = cache.load(cacheKey) if cacheKey is not None else None
+			self.cacheHit = self.store is not None
+
+		if self.store is None and not lazy:
+			if workers is not None and workers > 1:
+				self.store = Tree.buildStoreParallel(df, config, workers)
+			elif compact or cache is not None:
+				self.store = TreeStore.build(self.index)
+				# Nodes are only made from the store from here on, and the index is several times its size
+				self._index = None
+
+			if cache is not None and cacheKey is not None:
+				cache.save(cacheKey, self.store)
+
+		if self.store is not None:
+			self.root = Tree._fromStore(self.store, 0, [])
+		else:
+			self.root = Tree.buildTree(df, config, lazy, self.index)
 		self.root.isExpanded = True
 
-	def render(self):
-		return self.root.render()
+	# The index holds the sorted rows and the cached summary rollups, which lazy nodes keep using after the build
+	# It is only made when needed, so trees loaded from a cache never have to sort the dataframe
+	@property
+	def index(self) -> GroupIndex:
+		if self._index is None:
+			self._index = GroupIndex(self.df, self.config)
+		return self._index
 
-	# All nodes created from this are built with no parent defined, they can be filled in with a second pass
+	# Made the first time the tree is searched, and kept until rows are added, removed or filtered
+	# It is made from whatever the nodes are made from (the trie, store or index), so nodes that have not been made yet are only made
+	# once a match in them is revealed
+	@property
+	def searchIndex(self) -> SearchIndex:
+		if self._searchIndex is None:
+			if self.trie is not None:
+				entries = self.trie.searchEntries()
+			elif self.store is not None:
+				entries = self.store.searchEntries()
+			else:
+				entries = self.index.searchEntries()
+			self._searchIndex = SearchIndex(self.root, entries)
+		return self._searchIndex
+
+	# The paths (see SearchIndex) of every node with a value that starts with query (ignoring case), in the order they are drawn
+	def find(self, query: str) -> List[tuple]:
+		return self.searchIndex.find(query)
+
+	# The path of the first match of query after node, or before it with step -1, wrapping around at the ends (or None if nothing matches)
+	# With inclusive, node itself counts if it matches.  Matches in hidden nodes (or under them) are skipped
+	def findNext(self, query: str, node, step: int = 1, inclusive: bool = False) -> tuple:
+		matches = self.find(query)
+		if len(matches) == 0:
+			return None
+		path = self.searchIndex.pathOf(node)
+		if path is None:
+			idx = 0 if step > 0 else len(matches)-1
+		elif step > 0:
+			idx = bisect.bisect_left(matches, path) if inclusive else bisect.bisect_right(matches, path)
+		else:
+			idx = (bisect.bisect_right(matches, path) if inclusive else bisect.bisect_left(matches, path)) - 1
+
+		for _ in range(len(matches)):
+			match = matches[idx % len(matches)]
+			if not self.isPathHidden(match):
+				return match
+			idx += 1 if step > 0 else -1
+		return None
+
+	# Whether the node at path or any of its ancestors is hidden
+	# Only nodes that have been made can have been hidden, so this never makes any
+	def isPathHidden(self, path: tuple) -> bool:
+		node = self.root
+		for p in path:
+			if not node.isLoaded:
+				return False
+			node = node._children[p]
+			if node.isHidden:
+				return True
+		return False
+
+	# Expands every collapsed ancestor of the node at path, and returns the node to focus on to focus it along with the depth to focus in at
+	# A node drawn as part of a LeafNode is focused through the LeafNode.  Returns None (without expanding anything) if the node or an
+	# ancestor is hidden
+	def revealPath(self, path: tuple) -> tuple:
+		if self.isPathHidden(path):
+			return None
+
+		node = self.root
+		for p in range(len(path)):
+			target = node._children[path[p]]
+			if node.isCollapsed:
+				node.isExpanded = True
+
+			# Children are only left out of the effective children by being hidden, so they are usually still at the same index
+			children = node.children
+			child = children[path[p]] if path[p] < len(children) else None
+			if child is not target and getattr(child, 'derivedNode', None) is not target:
+				child = children[node.childIndex(target)]
+
+			if getattr(child, 'derivedNode', None) is not None:
+				return (child, child.depth + len(path) - p - 1)
+			node = child
+		return (node, node.depth)
+
+	# With top and bottom, only renders what is on the rows [top, bottom) of the drawn tree (which starts with an hline), see Node.render
+	def render(self, top: int = None, bottom: int = None, cache: bool = True):
+		if top is None:
+			return self.root.render(cache = cache)
+		return self.root.render((top-1, bottom-1), cache)
+
+	# The rows of a node's block and the hlines around it, like LineBlock.getNodeYRange, without needing the node to have been rendered
+	def getNodeYRange(self, node):
+		rowRange = node.getBlockRowRange()
+		if rowRange is None:
+			return (0, 0)
+		return (rowRange[0], rowRange[1]+2)
+
+	# The deepest node drawn on row y of the drawn tree (which starts with an hline), or None for the hlines around the root
+	def getNodeAtY(self, y: int):
+		if y < 1 or y > self.root.measure()[0]:
+			return None
+		return self.root.getNodeAtRow(y-1)[0]
+
+	# The node to focus to land on row y of the drawn tree: the deepest node drawn on the nearest row to y, looking in the direction of
+	# step (1 or -1) and then back the other way, that is a row of that node's own (not an hline or a header line of its parent's)
+	def getFocusableNodeNearY(self, y: int, step: int):
+		rows = self.root.measure()[0]
+		y = max(1, min(y, rows))
+		for direction in [step, -step]:
+			row = y
+			while 1 <= row <= rows:
+				node = self.root.getNodeAtRow(row-1)[0]
+				if node.parent is not None and (node.isCollapsed or len(node.children) == 0):
+					return node
+				row += direction
+		return None
+
+	# Builds a tree from an iterable of dataframes that all have the same columns (ie pd.read_csv(..., chunksize=...))
+	# Each chunk is folded into a PathTrie and dropped, so the whole dataframe never has to be in memory
+	# (unless the config's summaries can't be added up from each chunk's, see PathTrie)
 	@staticmethod
-	def _buildTree(df: pd.DataFrame, config: Config, groupName: str, colWidths: List[int], depth: int):
-		# If the df is none, this is a leaf node, which is not responsible for printing child column names and have no children (duh)
-		if df is None:
-			return BaseNode(str(groupName), [], colWidths, [], None, depth)
+	def fromChunks(chunks, config: Config) -> 'Tree':
+		trie = None
+		for chunk in chunks:
+			trie = trie if trie is not None else PathTrie(chunk.columns, config)
+			trie.addChunk(chunk)
+		if trie is None:
+			raise ValueError('Cannot build a tree from no chunks')
+		return Tree(None, config, trie = trie)
 
-		# Otherwise, build children, summarize the column, and store the relevant name
+
+	# Adds rows (with the same columns as the tree) to the groups they belong in
+	# Only the groups the rows land in are touched, and every node that already exists keeps its state (expanded, hidden, focused)
+	# If the tree is filtered with a string, only the new rows are checked against it, and the ones it does not match are filtered out
+	def append(self, rows: pd.DataFrame):
+		trie = self._toTrie()
+		firstId = trie.nextRowId
+		touched = trie.addChunk(rows)
+		if self._sources is not None and len(rows) > 0:
+			self._sources.append((firstId, rows))
+		if isinstance(self.filterPredicate, str) and len(rows) > 0:
+			keep = Tree._matchRows(self.filterPredicate, rows)
+			touched = list(set(touched).union(trie.hide(np.arange(firstId, firstId + len(rows))[~keep])))
+		self._searchIndex = None
+		self._refreshViews(touched)
+
+
+	# Removes the rows where mask is true, with one value per row of the tree in the order the rows were added (ie a mask over df)
+	# Groups left without rows are removed along with their nodes
+	def remove(self, mask):
+		trie = self._toTrie()
+		if len(trie) > 0 and np.asarray(mask, dtype=bool).all():
+			raise ValueError('Cannot remove every row of a tree')
+		self._searchIndex = None
+		self._refreshViews(trie.remove(mask))
+
+		# Removed rows are only left out of their frames (see _liveSources), which are dropped once none of their rows are left
+		if self._sources is not None:
+			live = trie.liveRows()
+			self._sources = [(firstId, frame) for firstId, frame in self._sources if live[firstId:firstId + len(frame)].any()]
+
+
+	# Shows only the rows predicate matches, with every summary counted again from just those rows
+	# predicate is a mask with one value per row of the tree (filtered out or not) in the order the rows were added, or a string evaluated
+	# against the tree's rows, either column = value (compared as strings) or anything DataFrame.eval takes (ie a DataFrame.query string)
+	# No predicate shows every row again.  Like append and remove, the nodes of groups that still have rows keep their state
+	def filter(self, predicate = None):
+		trie = self._toTrie()
+		keep = self._filterMask(predicate) if predicate is not None else None
+		if keep is not None and not keep.any():
+			raise ValueError('No rows match ' + str(predicate))
+		self.filterPredicate = predicate
+		self._searchIndex = None
+		self._refreshViews(trie.filter(keep))
+
+	def _filterMask(self, predicate) -> np.ndarray:
+		if not isinstance(predicate, str):
+			return np.asarray(predicate, dtype=bool)
+
+		if self._sources is None:
+			raise ValueError('Trees built from chunks do not keep their rows, so they can only be filtered with a mask')
+		masks = [Tree._matchRows(predicate, frame) for frame in self._liveSources()]
+		return np.concatenate(masks) if len(masks) > 0 else np.zeros(0, dtype=bool)
+
+	# Whether each row of frame matches a string predicate (see filter)
+	@staticmethod
+	def _matchRows(predicate: str, frame: pd.DataFrame) -> np.ndarray:
+		match = re.fullmatch(r'\s*(.+?)\s*(?<![=!<>])=(?!=)\s*(.*?)\s*', predicate)
+		columns = [str(col) for col in frame.columns]
+		if match is not None and match.group(1) in columns:
+			column = frame.iloc[:, columns.index(match.group(1))]
+			return (column.astype(str) == match.group(2)).to_numpy()
+
+		mask = frame.eval(predicate)
+		if not isinstance(mask, pd.Series) or mask.dtype != bool:
+			raise ValueError('Not a filter: ' + predicate)
+		return mask.to_numpy()
+
+	# The frames of the rows added to the tree, in order, with the rows that have since been removed left out
+	# Each frame is kept as it was added, along with the trie row id of its first row, so adding and removing rows never copies the others
+	def _liveSources(self) -> List[pd.DataFrame]:
+		if self.trie is None:
+			return [frame for firstId, frame in self._sources]
+		live = self.trie.liveRows()
+		frames = []
+		for firstId, frame in self._sources:
+			rows = live[firstId:firstId + len(frame)]
+			frames.append(frame if rows.all() else frame.iloc[np.flatnonzero(rows)])
+		return frames
+
+	# Every row of the tree (filtered out or not), in the order they were added, or None if they are not kept
+	@property
+	def source(self) -> pd.DataFrame:
+		if self._sources is None:
+			return None
+		frames = self._liveSources()
+		return frames[0] if len(frames) == 1 else pd.concat(frames)
+
+	# The node drawn in place of node after the tree has changed, or None if it is no longer in the tree
+	# That is node itself, or the LeafNode drawn for it (or that it was drawn in) made again by its parent
+	def survivor(self, node):
+		found = None
+		while node.parent is not None:
+			try:
+				idx = node.parent.childIndex(node)
+			except ValueError:
+				return None
+			found = node.parent.children[idx] if found is None else found
+			node = node.parent
+		return found if node is self.root else None
+
+
+	# Puts the rows of df into a PathTrie and points every node that has been made at its group in it
+	def _toTrie(self) -> PathTrie:
+		if self.trie is None:
+			trie = PathTrie(self.df.columns, self.config)
+			trie.addChunk(self.df)
+			Tree._bindTrie(trie, self.root, trie.root, 0)
+			self.trie = trie
+			self.df = None
+			self._index = None
+			self.store = None
+		return self.trie
+
+
+	# Brings the nodes of the changed PathTrie nodes up to date, deepest first so that parents only have to add or drop children
+	def _refreshViews(self, touched: List[PathNode]):
+		for pathNode in sorted(touched, key = lambda pathNode: -pathNode.level):
+			node = pathNode.view
+			# Emptied groups are dropped by their parent
+			if node is None or node.pathNode is not pathNode or pathNode.rowCount == 0:
+				continue
+			Tree._refreshView(self.trie, node)
+
+	@staticmethod
+	def _prepareDf(df: pd.DataFrame, config: Config) -> pd.DataFrame:
 		# Remove any columns from the dataframe that are only na
 		# This must be done every time, because grouping reduces rows significantly, leading to new dropped columns
 		df = df.dropna(axis=1, how='all')
@@ -34,6 +331,18 @@ class Tree:
 				df.drop(columns = df.columns[0], inplace = True)
 			else:
 				break
+		return df
+
+
+	# All nodes created from this are built with no parent defined, they can be filled in with a second pass
+	@staticmethod
+	def _buildTree(df: pd.DataFrame, config: Config, groupName: str, colWidths: List[int], depth: int):
+		# If the df is none, this is a leaf node, which is not responsible for printing child column names and have no children (duh)
+		if df is None:
+			return BaseNode(str(groupName), [], colWidths, [], None, depth)
+
+		# Otherwise, build children, summarize the column, and store the relevant name
+		df = Tree._prepareDf(df, config)
 
 		childColName = str(config.colNameCleanup(df.columns[0]))
 		colSummary = str(config.summarize(df, df.columns[0], long = False))
@@ -70,6 +379,259 @@ class Tree:
 		return BaseNode(str(groupName), childColName, myColWidths, children, None, depth, colSummary, colSummaryLong)
 
 
+	# Builds the same node as _buildTree, but from a range of rows in a GroupIndex instead of a grouped copy of the dataframe
+	# Lazy nodes only keep their row range, and build their own children the first time they are accessed
+	# Everything needed to draw the node collapsed (summaries, col widths and child count) is still calculated up front
+	@staticmethod
+	def _buildIndexedNode(index: GroupIndex, start: int, end: int, colStart: int, groupName: str, colWidths: List[int], depth: int, lazy: bool = False):
+		groupCol, colCount, childColName, colSummary, colSummaryLong, groups, childColWidth = index.describeGroup(start, end, colStart)
+		myColWidths = [*colWidths, childColWidth]
+
+		if lazy:
+			loader = lambda node: Tree._buildIndexedChildren(index, node, start, end, groupCol, colCount, lazy)
+			return BaseNode(str(groupName), childColName, myColWidths, None, None, depth, colSummary, colSummaryLong, childLoader = loader, childCount = len(groups))
+
+		node = BaseNode(str(groupName), childColName, myColWidths, [], None, depth, colSummary, colSummaryLong)
+		node._children = Tree._buildIndexedChildren(index, node, start, end, groupCol, colCount, lazy, groups)
+		return node
+
+
+	@staticmethod
+	def _buildIndexedChildren(index: GroupIndex, node, start: int, end: int, groupCol: int, colCount: int, lazy: bool, groups: List[tuple] = None):
+		children = []
+		if colCount > 1:
+			groups = groups if groups is not None else index.subgroups(start, end, groupCol)
+			for gn, childStart, childEnd in groups:
+				children.append(Tree._buildIndexedNode(index, childStart, childEnd, groupCol+1, gn, node._colWidths, node.depth+1, lazy))
+		else:
+			groups = groups if groups is not None else index.rowValues(start, end, groupCol)
+			for val in groups:
+				children.append(BaseNode(str(val), [], node._colWidths, [], None, node.depth+1))
+
+		for child in children:
+			child.parent = node
+		return children
+
+
+	# Makes the node at pos of a store, parentless
+	# Its children are only made when they are first accessed, so nodes only exist for the parts of the tree that have been looked at
+	@staticmethod
+	def _fromStore(store: TreeStore, pos: int, colWidths: List[int]):
+		depth = int(store.depth[pos])
+		name = store.string(store.name[pos])
+
+		if store.isLeafRow(pos):
+			return BaseNode(name, [], colWidths, [], None, depth)
+
+		myColWidths = [*colWidths, int(store.childColWidth[pos])]
+		loader = lambda node: Tree._fromStoreChildren(store, node, pos)
+		return BaseNode(name, store.string(store.header[pos]), myColWidths, None, None, depth, store.string(store.summary[pos]), store.string(store.summaryLong[pos]), childLoader = loader, childCount = int(store.childCount[pos]))
+
+
+	@staticmethod
+	def _fromStoreChildren(store: TreeStore, node, pos: int):
+		children = []
+		for childPos in store.children(pos):
+			child = Tree._fromStore(store, childPos, node._colWidths)
+			child.parent = node
+			children.append(child)
+		return children
+
+
+	# Makes the lazy node of the group at a PathTrie node, parentless
+	@staticmethod
+	def _fromTrie(trie: PathTrie, pathNode: PathNode, colStart: int, groupName: str, colWidths: List[int], depth: int):
+		groupCol, colCount, childColName, colSummary, colSummaryLong, groups, childColWidth = trie.describeGroup(pathNode, colStart)
+		myColWidths = [*colWidths, childColWidth]
+		loader = lambda node: Tree._fromTrieChildren(trie, node, groupCol, colCount, groups)
+		node = BaseNode(str(groupName), childColName, myColWidths, None, None, depth, colSummary, colSummaryLong, childLoader = loader, childCount = len(groups))
+		Tree._bindView(node, pathNode, colStart, groupCol, colCount, groups)
+		return node
+
+
+	@staticmethod
+	def _fromTrieChildren(trie: PathTrie, node, groupCol: int, colCount: int, groups: list):
+		children = []
+		if colCount > 1:
+			for gn, pathNode in groups:
+				children.append(Tree._fromTrie(trie, pathNode, groupCol+1, gn, node._colWidths, node.depth+1))
+		else:
+			for val, rowId in groups:
+				children.append(BaseNode(str(val), [], node._colWidths, [], None, node.depth+1))
+
+		for child in children:
+			child.parent = node
+		return children
+
+
+	# Links a node and the PathTrie node of its group both ways, and remembers how its children were made so they can be updated
+	# For groups of leaf rows, rowIds are the ids of the rows of its children, in order
+	@staticmethod
+	def _bindView(node, pathNode: PathNode, colStart: int, groupCol: int, colCount: int, groups: list):
+		pathNode.view = node
+		node.pathNode = pathNode
+		node.colStart = colStart
+		node.groupCol = groupCol
+		node.colCount = colCount
+		node.rowIds = [rowId for val, rowId in groups] if colCount <= 1 else None
+
+
+	# Binds a node built from a dataframe (and every child of it that has been made) to the same group in trie
+	# Children that have not been made yet will be made from the trie instead
+	@staticmethod
+	def _bindTrie(trie: PathTrie, node, pathNode: PathNode, colStart: int):
+		groupCol, colCount, childColName, colSummary, colSummaryLong, groups, childColWidth = trie.describeGroup(pathNode, colStart)
+		Tree._bindView(node, pathNode, colStart, groupCol, colCount, groups)
+		if not node.isLoaded:
+			node._childLoader = lambda node: Tree._fromTrieChildren(trie, node, groupCol, colCount, groups)
+		elif colCount > 1:
+			# Children are matched to their groups by name, as nodes don't keep the values they were grouped by
+			# Groups whose values print the same (1 and '1') are in the same order in both
+			pathNodes = {}
+			for gn, childPathNode in groups:
+				pathNodes.setdefault(str(gn), []).append(childPathNode)
+			for child in node._loadedChildren:
+				Tree._bindTrie(trie, child, pathNodes[child._contentLine[0]].pop(0), groupCol+1)
+
+
+	# Unlinks a node that is being dropped (and its children) from the trie
+	@staticmethod
+	def _unbindView(node):
+		pathNode = getattr(node, 'pathNode', None)
+		if pathNode is not None and pathNode.view is node:
+			pathNode.view = None
+		if node.isLoaded:
+			for child in node._loadedChildren:
+				Tree._unbindView(child)
+
+
+	# Sets the col width at index for node and every child of it that has been made, which all share the same leading col widths
+	@staticmethod
+	def _setColWidth(node, index: int, width: int):
+		if node._colWidths[index] == width:
+			return
+		node._colWidths[index] = width
+		# Merged children have their own copies of the col widths, so merges have to be worked out again
+		node.recalculateChildren = True
+		if node.isLoaded:
+			for child in node._loadedChildren:
+				Tree._setColWidth(child, index, width)
+
+
+	# Updates a node from its (changed) group in the trie: its summaries, header and col width, and its children if they have been made
+	# Children whose group still exists are kept as they are, and the node only recalculates its children if they actually changed
+	@staticmethod
+	def _refreshView(trie: PathTrie, node):
+		groupCol, colCount, childColName, colSummary, colSummaryLong, groups, childColWidth = trie.describeGroup(node.pathNode, node.colStart)
+		node.colSummary = colSummary
+		node.colSummaryLong = colSummaryLong
+		node._childHeaderLine = [childColName]
+		node.invalidate()
+		Tree._setColWidth(node, node.depth, childColWidth)
+
+		# A group that is grouped by a different column now (because a column stopped or started being all na in it) starts over
+		sameColumn = groupCol == node.groupCol and (colCount > 1) == (node.colCount > 1)
+		oldChildCount = node.childCount
+		changed = not sameColumn
+		if not node.isLoaded:
+			node._childLoader = lambda node: Tree._fromTrieChildren(trie, node, groupCol, colCount, groups)
+			node.childCount = len(groups)
+			node.invalidateLeaf()
+		else:
+			oldChildren = node._loadedChildren
+			if colCount > 1:
+				kept = {child.pathNode: child for child in oldChildren} if sameColumn else {}
+				children = [kept.get(pathNode) or Tree._fromTrie(trie, pathNode, groupCol+1, gn, node._colWidths, node.depth+1) for gn, pathNode in groups]
+			else:
+				kept = dict(zip(node.rowIds, oldChildren)) if sameColumn else {}
+				children = [kept.get(rowId) or BaseNode(str(val), [], node._colWidths, [], None, node.depth+1) for val, rowId in groups]
+
+			if len(children) != len(oldChildren) or any(child is not oldChild for child, oldChild in zip(children, oldChildren)):
+				changed = True
+				keptIds = set([id(child) for child in children])
+				for child in oldChildren:
+					if id(child) not in keptIds:
+						Tree._unbindView(child)
+				for child in children:
+					child.parent = node
+				node._children = children
+				node.recalculateChildren = True
+
+		Tree._bindView(node, node.pathNode, node.colStart, groupCol, colCount, groups)
+
+		# Whether a child can be drawn as a leaf depends on its children, so the parents that might have drawn it as one recalculate too
+		if changed or node.childCount != oldChildCount:
+			parent = node.parent
+			while parent is not None:
+				parent.recalculateChildren = True
+				if parent.childCount != 1:
+					break
+				parent = parent.parent
+
+
+	# Runs in a worker process: builds the store of every top level group in df, which holds whole top level groups only
+	@staticmethod
+	def _buildStoreBatch(df: pd.DataFrame, config: Config, groupCol: int) -> TreeStore:
+		return TreeStore.buildSubgroups(GroupIndex(df, config), groupCol)
+
+
+	# Builds each top level group's subtree in a process pool
+	# Top level groups are independent, so they are split into contiguous batches of about the same number of rows, each shipped to a worker
+	# as its own dataframe.  Workers send back TreeStores, which pickle far smaller and faster than nodes, and the main process only
+	# has to append them under the root.  The config has to be picklable (so no lambdas for summarize or colNameCleanup)
+	# The main process never builds a GroupIndex of the whole frame: the top level groups only need the first grouping column factorized,
+	# and the root's summary is a single summarize of the frame, so the workers do all of the sorting
+	@staticmethod
+	def buildStoreParallel(df: pd.DataFrame, config: Config, workers: int) -> TreeStore:
+		# The same columns GroupIndex.groupCols would give the root
+		hidden = [col in config.hiddenCols for col in df.columns]
+		cols = [int(c) for c in np.flatnonzero(df.notna().any(axis=0).to_numpy())]
+		while len(cols) > 0 and hidden[cols[0]]:
+			cols.pop(0)
+		colCount = len([c for c in cols if not hidden[c]])
+
+		groupCol = cols[0] if len(cols) > 0 else None
+		codes, uniques = pd.factorize(df.iloc[:, groupCol], sort = True) if colCount > 1 else (None, [])
+		# If the root's children are leaf rows there is nothing worth splitting up
+		if colCount <= 1 or workers <= 1 or len(uniques) <= 1:
+			return TreeStore.build(GroupIndex(df, config))
+
+		# Rows by group in sorted order, leaving out the rows whose group value is na just like subgroups does
+		order = np.argsort(codes, kind='stable')[np.count_nonzero(codes < 0):]
+		groupRows = np.bincount(codes[codes >= 0], minlength = len(uniques))
+
+		batchRows = max(1, len(order) // (workers * 4))
+		batches = []
+		batchStart = 0
+		batchEnd = 0
+		for rows in groupRows.tolist():
+			batchEnd += rows
+			if batchEnd - batchStart >= batchRows:
+				batches.append(df.take(np.sort(order[batchStart:batchEnd])))
+				batchStart = batchEnd
+		if batchStart < batchEnd:
+			batches.append(df.take(np.sort(order[batchStart:batchEnd])))
+
+		childColName = str(config.colNameCleanup(df.columns[groupCol]))
+		childColWidth = max(len(childColName), max([len(str(u)) for u in uniques])+2)
+		rootFrame = df.iloc[:, cols]
+		colSummary, colSummaryLong = [str(config.summarize(rootFrame, rootFrame.columns[0], long = long)) for long in [False, True]]
+
+		builder = TreeStoreBuilder()
+		root = builder.addNode(-1, 0, 'root', childColName, childColWidth, colSummary, colSummaryLong, len(uniques))
+		with ProcessPoolExecutor(max_workers = workers) as pool:
+			for store in pool.map(Tree._buildStoreBatch, batches, [config for _ in batches], [groupCol for _ in batches]):
+				builder.addStore(store, root)
+		builder.columns['size'][root] = len(builder)
+
+		return builder.finish()
+
+
+	@staticmethod
+	def buildTreeParallel(df: pd.DataFrame, config: Config, workers: int) -> ITree:
+		return Tree._fromStore(Tree.buildStoreParallel(df, config, workers), 0, [])
+
+
 	# Iterate through the tree linking children to parents
 	@staticmethod
 	def _linkParent(child, parent):
@@ -79,7 +641,14 @@ class Tree:
 
 
 	@staticmethod
-	def buildTree(df: pd.DataFrame, config: Config) -> ITree:
+	def buildTree(df: pd.DataFrame, config: Config, lazy: bool = False, index: GroupIndex = None) -> ITree:
+		index = index if index is not None else GroupIndex(df, config)
+		return Tree._buildIndexedNode(index, 0, len(index), 0, 'root', [], 0, lazy)
+
+
+	# The original recursive groupby build, kept as a reference implementation for the indexed build
+	@staticmethod
+	def buildTreeRecursive(df: pd.DataFrame, config: Config) -> ITree:
 		rootNode = Tree._buildTree(df, config, 'root', [], 0)
 
 		for child in rootNode._children:
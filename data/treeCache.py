@@ -0,0 +1,105 @@
+from ..config import Config
+from .treeStore import TreeStore
+import pandas as pd
+import hashlib
+import shutil
+import os
+
+# A size bounded on disk cache of built TreeStores
+# Entries are keyed by a content hash of the dataframe (values, column names and dtypes) plus the config's identity, and each one is a
+# directory of .npy files that is memory mapped back on a hit, so reopening the same data skips the build entirely
+# When the cache grows past maxBytes the least recently used entries are deleted
+class TreeCache:
+	def __init__(self, directory: str = None, maxBytes: int = 1 << 30):
+		self.directory = directory if directory is not None else os.path.join(os.path.expanduser('~'), '.cache', 'printTable')
+		self.maxBytes = maxBytes
+		self.hits = 0
+		self.misses = 0
+		os.makedirs(self.directory, exist_ok = True)
+
+
+	# None when the config has no identity, as a tree built with it can't be told apart from one built with other summary values
+	@staticmethod
+	def key(df: pd.DataFrame, config: Config) -> str:
+		identity = config.identity()
+		if identity is None:
+			return None
+		digest = hashlib.blake2b(digest_size = 20)
+		digest.update(str(TreeStore.FORMAT_VERSION).encode('utf-8'))
+		digest.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode('utf-8'))
+		digest.update(pd.util.hash_pandas_object(df, index = False).to_numpy().tobytes())
+		digest.update(identity.encode('utf-8'))
+		return digest.hexdigest()
+
+
+	def _path(self, key: str) -> str:
+		return os.path.join(self.directory, key)
+
+
+	def contains(self, key: str) -> bool:
+		return os.path.isdir(self._path(key))
+
+
+	# Returns the cached store for key (counting a hit), or None (counting a miss)
+	def load(self, key: str) -> TreeStore:
+		path = self._path(key)
+		if not os.path.isdir(path):
+			self.misses += 1
+			return None
+
+		try:
+			store = TreeStore.load(path)
+		except (OSError, ValueError):
+			# A partially deleted or corrupt entry is just a miss
+			shutil.rmtree(path, ignore_errors = True)
+			self.misses += 1
+			return None
+
+		# Touch the entry so eviction sees it as recently used
+		os.utime(path)
+		self.hits += 1
+		return store
+
+
+	def save(self, key: str, store: TreeStore):
+		path = self._path(key)
+		if os.path.isdir(path):
+			return
+
+		# Write into a temporary directory and rename it into place, so readers never see half an entry
+		tmpPath = path + '.' + str(os.getpid()) + '.tmp'
+		store.save(tmpPath)
+		try:
+			os.rename(tmpPath, path)
+		except OSError:
+			shutil.rmtree(tmpPath, ignore_errors = True)
+			return
+
+		self.evict()
+
+
+	# Size on disk of every entry, as (last used time, bytes, path), oldest first
+	def entries(self) -> list:
+		entries = []
+		for name in os.listdir(self.directory):
+			path = os.path.join(self.directory, name)
+			if not os.path.isdir(path) or name.endswith('.tmp'):
+				continue
+			size = sum([os.path.getsize(os.path.join(path, file)) for file in os.listdir(path)])
+			entries.append((os.path.getmtime(path), size, path))
+		return sorted(entries)
+
+
+	def evict(self):
+		entries = self.entries()
+		total = sum([size for _, size, _ in entries])
+		# Never evict the newest entry, even if it alone is over the limit
+		while total > self.maxBytes and len(entries) > 1:
+			_, size, path = entries.pop(0)
+			shutil.rmtree(path, ignore_errors = True)
+			total -= size
+
+
+	def clear(self):
+		for _, _, path in self.entries():
+			shutil.rmtree(path, ignore_errors = True)
@@ -0,0 +1,206 @@
+from .groupIndex import GroupIndex
+from typing import List
+from array import array
+import numpy as np
+import os
+
+# A whole tree kept as flat arrays in preorder instead of as node objects
+# Every group and leaf row costs a handful of ints: its parent, first child, next sibling, depth, child count, subtree size, child col width,
+# and ids into one interned table of strings for its name, child header name and summaries (-1 when it has none, ie for leaf rows)
+# Nodes are only made from it as they are needed (see Tree._fromStore), so huge trees never exist as tens of millions of objects
+class TreeStore:
+	FIELDS = ['parent', 'firstChild', 'nextSibling', 'depth', 'childCount', 'size', 'childColWidth', 'name', 'header', 'summary', 'summaryLong']
+	# Bump whenever the saved layout changes, so old saved stores are never read back
+	FORMAT_VERSION = 1
+
+	def __init__(self, arrays: dict, strings: List[str]):
+		self.arrays = arrays
+		self.strings = strings
+
+		self.parent = arrays['parent']
+		self.firstChild = arrays['firstChild']
+		self.nextSibling = arrays['nextSibling']
+		self.depth = arrays['depth']
+		self.childCount = arrays['childCount']
+		self.size = arrays['size']
+		self.childColWidth = arrays['childColWidth']
+		self.name = arrays['name']
+		self.header = arrays['header']
+		self.summary = arrays['summary']
+		self.summaryLong = arrays['summaryLong']
+
+
+	def __len__(self):
+		return len(self.parent)
+
+
+	def string(self, id: int) -> str:
+		return None if id < 0 else self.strings[id]
+
+
+	def isLeafRow(self, pos: int) -> bool:
+		return self.header[pos] < 0
+
+
+	# Positions of the children of the node at pos, in order
+	def children(self, pos: int) -> List[int]:
+		children = []
+		child = int(self.firstChild[pos])
+		while child >= 0:
+			children.append(child)
+			child = int(self.nextSibling[child])
+		return children
+
+
+	# (name, path) for every node under the root, with the path of child indices to it (see SearchIndex)
+	def searchEntries(self) -> List[tuple]:
+		entries = []
+		stack = [(0, ())]
+		while len(stack) > 0:
+			pos, path = stack.pop()
+			for c, child in enumerate(self.children(pos)):
+				entries.append((self.string(self.name[child]), (*path, c)))
+				if not self.isLeafRow(child):
+					stack.append((child, (*path, c)))
+		return entries
+
+
+	# Saves every array as its own .npy file in directory (with the strings as one utf-8 blob plus offsets), so load can memory map them
+	def save(self, directory: str):
+		os.makedirs(directory, exist_ok = True)
+		strings = self.strings if isinstance(self.strings, StringTable) else StringTable.fromStrings(self.strings)
+		for field in TreeStore.FIELDS:
+			np.save(os.path.join(directory, field + '.npy'), np.asarray(self.arrays[field]))
+		np.save(os.path.join(directory, 'stringData.npy'), np.asarray(strings.data))
+		np.save(os.path.join(directory, 'stringOffsets.npy'), np.asarray(strings.offsets))
+
+
+	@staticmethod
+	def load(directory: str, mmap: bool = True) -> 'TreeStore':
+		mode = 'r' if mmap else None
+		arrays = {field: np.load(os.path.join(directory, field + '.npy'), mmap_mode = mode) for field in TreeStore.FIELDS}
+		strings = StringTable(np.load(os.path.join(directory, 'stringData.npy'), mmap_mode = mode), np.load(os.path.join(directory, 'stringOffsets.npy'), mmap_mode = mode))
+		return TreeStore(arrays, strings)
+
+
+	# The store of a whole GroupIndex
+	@staticmethod
+	def build(index: GroupIndex) -> 'TreeStore':
+		builder = TreeStoreBuilder()
+		builder.addGroup(index, 0, len(index), 0, 'root', -1, 0)
+		return builder.finish()
+
+
+	# A store holding only the subtrees of the groups made by groupCol (with no root), as depth 1 nodes
+	@staticmethod
+	def buildSubgroups(index: GroupIndex, groupCol: int) -> 'TreeStore':
+		builder = TreeStoreBuilder()
+		for gn, start, end in index.subgroups(0, len(index), groupCol):
+			builder.addGroup(index, start, end, groupCol+1, gn, -1, 1)
+		return builder.finish()
+
+
+# A read only list of strings kept as one utf-8 blob and the offsets of each string in it, which is what saved stores memory map
+# Strings are only decoded when they are looked up
+class StringTable:
+	def __init__(self, data, offsets):
+		self.data = data
+		self.offsets = offsets
+
+	@staticmethod
+	def fromStrings(strings: List[str]) -> 'StringTable':
+		encoded = [string.encode('utf-8') for string in strings]
+		offsets = np.zeros(len(encoded)+1, dtype=np.int64)
+		np.cumsum([len(string) for string in encoded], out=offsets[1:])
+		return StringTable(np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets)
+
+	def __len__(self):
+		return len(self.offsets) - 1
+
+	def __getitem__(self, id: int) -> str:
+		return bytes(self.data[self.offsets[id]:self.offsets[id+1]]).decode('utf-8')
+
+	def __iter__(self):
+		for id in range(len(self)):
+			yield self[id]
+
+
+class TreeStoreBuilder:
+	def __init__(self):
+		self.columns = {field: array('q') for field in ['parent', 'depth', 'childCount', 'size', 'childColWidth', 'name', 'header', 'summary', 'summaryLong']}
+		self.strings: List[str] = []
+		self.stringIds = {}
+
+
+	def __len__(self):
+		return len(self.columns['parent'])
+
+
+	def intern(self, string: str) -> int:
+		if string is None:
+			return -1
+		id = self.stringIds.get(string)
+		if id is None:
+			id = len(self.strings)
+			self.stringIds[string] = id
+			self.strings.append(string)
+		return id
+
+
+	def addNode(self, parent: int, depth: int, name: str, header: str = None, childColWidth: int = 0, summary: str = None, summaryLong: str = None, childCount: int = 0) -> int:
+		pos = len(self)
+		columns = self.columns
+		columns['parent'].append(parent)
+		columns['depth'].append(depth)
+		columns['childCount'].append(childCount)
+		columns['size'].append(1)
+		columns['childColWidth'].append(childColWidth)
+		columns['name'].append(self.intern(name))
+		columns['header'].append(self.intern(header))
+		columns['summary'].append(self.intern(summary))
+		columns['summaryLong'].append(self.intern(summaryLong))
+		return pos
+
+
+	# Adds the subtree of the group [start, end) of index in preorder
+	def addGroup(self, index: GroupIndex, start: int, end: int, colStart: int, groupName: str, parent: int, depth: int) -> int:
+		groupCol, colCount, childColName, colSummary, colSummaryLong, groups, childColWidth = index.describeGroup(start, end, colStart)
+		pos = self.addNode(parent, depth, str(groupName), childColName, childColWidth, colSummary, colSummaryLong, len(groups))
+
+		if colCount > 1:
+			for gn, childStart, childEnd in groups:
+				self.addGroup(index, childStart, childEnd, groupCol+1, gn, pos, depth+1)
+		else:
+			for val in groups:
+				self.addNode(pos, depth+1, str(val))
+
+		self.columns['size'][pos] = len(self) - pos
+		return pos
+
+
+	# Appends every node of another store, attaching its parentless nodes to parent
+	def addStore(self, store: TreeStore, parent: int):
+		offset = len(self)
+		stringIds = np.array([self.intern(string) for string in store.strings] + [-1], dtype=np.int64)
+
+		columns = self.columns
+		columns['parent'].extend(np.where(store.parent < 0, parent, store.parent + offset).tolist())
+		for field in ['depth', 'childCount', 'size', 'childColWidth']:
+			columns[field].extend(store.arrays[field].tolist())
+		# Id -1 indexes the trailing -1 of stringIds, so missing strings stay missing
+		for field in ['name', 'header', 'summary', 'summaryLong']:
+			columns[field].extend(stringIds[store.arrays[field]].tolist())
+
+
+	def finish(self) -> TreeStore:
+		arrays = {field: np.frombuffer(column, dtype=np.int64).astype(np.int32) for field, column in self.columns.items()}
+
+		# Preorder means a node's first child (if it has any) is right after it, and its next sibling is right after its subtree
+		positions = np.arange(len(self), dtype=np.int32)
+		arrays['firstChild'] = np.where(arrays['childCount'] > 0, positions+1, -1).astype(np.int32)
+		after = positions + arrays['size']
+		hasNext = after < len(self)
+		arrays['nextSibling'] = np.full(len(self), -1, dtype=np.int32)
+		arrays['nextSibling'][hasNext] = np.where(arrays['parent'][after[hasNext]] == arrays['parent'][hasNext], after[hasNext], -1)
+
+		return TreeStore(arrays, self.strings)
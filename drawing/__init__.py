@@ -4,5 +4,6 @@
 from .blockLine import LineBlock
 from .line import Line
 from .hline import HLine
+from .skippedBlock import SkippedBlock
 from .scrollableWindow import ScrollableWindow
 from .chars import Chars
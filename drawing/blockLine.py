@@ -15,6 +15,10 @@ class ILineBlock:
 # This connection might be belonging to the same node, or belonging to the same data line in the case of lines that overflow their column
 # EVERY LINE BLOCK GETS AN HLINE BEFORE AND AFTER IT
 class LineBlock(Connectable):
+	# The rows a block is drawn over without having lines for them, and how many of its last lines stand in for those (see SkippedBlock)
+	skippedRows: int = 0
+	placeholderCount: int = 0
+
 	def __init__(self, node, lines = []):
 		self.node = node
 
@@ -22,9 +26,6 @@ class LineBlock(Connectable):
 		for line in lines:
 			self.addLine(line)
 
-		self._idx = -1
-		self._iter = None
-
 	def insertLine(self, idx: int, line: Union[Line, ILineBlock]):
 		if not isinstance(line, Line) and not isinstance(line, LineBlock):
 			raise UnknownElementException(line)
@@ -47,30 +48,61 @@ class LineBlock(Connectable):
 			self.insertLine(0, line)
 
 
+	# Records the state of the block as its node rendered it, so a cached block can be handed out again with everything that
+	# the node's ancestors added to it last time (their cells at the front of the first header and content lines, and their
+	# header lines at the front of the deepest first block) taken back out by restorePristine
+	def savePristine(self, hasHeader: bool):
+		self._pristineLines = []
+		headerFound = not hasHeader
+		contentFound = False
+		for y, line, lineType in self:
+			if lineType == Line.HEADER and not headerFound:
+				headerFound = True
+			elif not lineType == Line.HEADER and not contentFound:
+				contentFound = True
+			else:
+				continue
+			self._pristineLines.append((line, len(line._cells), len(line.parents)))
+			if headerFound and contentFound:
+				break
+
+		self._pristineFirst = self
+		while len(self._pristineFirst.lines) > 0 and isinstance(self._pristineFirst.lines[0], LineBlock):
+			self._pristineFirst = self._pristineFirst.lines[0]
+		self._pristineFirstLen = len(self._pristineFirst.lines)
+
+	def restorePristine(self):
+		first = self._pristineFirst
+		if len(first.lines) > self._pristineFirstLen:
+			del first.lines[:len(first.lines) - self._pristineFirstLen]
+
+		for line, contentLen, parentsLen in self._pristineLines:
+			del line._cells[contentLen:]
+			del line._cellDecorators[contentLen:]
+			del line.parents[parentsLen:]
+
+
+	# Every line in the block and the blocks in it, in order, as (y, line, lineType), where y is the row the line is drawn on when the
+	# block is drawn at row 0 (which is its top hline, see draw).  The placeholders of a SkippedBlock are given the first row it skips
+	# Each iteration keeps its own stack of list iterators (one per level of blocks it is in), so the same block can be iterated
+	# over by more than one consumer at a time, and getting each line costs the same however deep it is
 	def __iter__(self):
-		self._idx = -1
-		self._iter = None
-		return self
-
-	def __next__(self):
-		# If the current lines element is a LineBlock, attempt to call it's next
-		if self._iter is not None:
-			try:
-				return next(self._iter)
-			# If the iterator is done, move on to the next index as if it was a line
-			except StopIteration:
-				self._iter = None
-		self._idx += 1
-		if self._idx >= len(self.lines):
-			raise StopIteration
-		# If the new current element becomes a LineBlock, call my own self to handle it (safe for empty line blocks)
-		if isinstance(self.lines[self._idx], LineBlock):
-			self._iter = iter(self.lines[self._idx])
-			return self.__next__()
-
-		line = self.lines[self._idx]
-		lineType = Line.HEADER if Line.HEADER in line.elDecorators else Line.NORMAL
-		return (line, lineType)
+		y = 1
+		stack = [(self, enumerate(self.lines))]
+		while len(stack) > 0:
+			block, lines = stack[-1]
+			for c, line in lines:
+				if isinstance(line, LineBlock):
+					# Every block but the first one in another is drawn below an hline of its own
+					y += 1 if c > 0 else 0
+					stack.append((line, enumerate(line.lines)))
+					break
+				yield (y, line, Line.HEADER if line.isHeader else Line.NORMAL)
+				if c < len(block.lines) - block.placeholderCount:
+					y += 1
+			else:
+				stack.pop()
+				y += block.skippedRows
 
 	def getBlockYRange(self):
 		if len(self.lines) == 0:
@@ -103,7 +135,8 @@ class LineBlock(Connectable):
 		return (yRange[0]-1, yRange[1]+1)
 
 
-	def draw(self, window: curses.window, y: int = 0, prevLine: Connectable = None, drawTopHLine = True, drawBottomHLine = True) -> int:
+	# decorators are passed on to every line drawn (see Line.draw)
+	def draw(self, window: curses.window, y: int = 0, prevLine: Connectable = None, drawTopHLine = True, drawBottomHLine = True, decorators: List[int] = None) -> int:
 		if len(self.lines) == 0:
 			return y
 
@@ -117,10 +150,10 @@ class LineBlock(Connectable):
 
 		for c in range(len(self.lines)):
 			if isinstance(self.lines[c], LineBlock):
-				startY = self.lines[c].draw(window, startY, prevLine = None if c <= 0 else self.lines[c-1], drawTopHLine = c > 0, drawBottomHLine = False)
+				startY = self.lines[c].draw(window, startY, prevLine = None if c <= 0 else self.lines[c-1], drawTopHLine = c > 0, drawBottomHLine = False, decorators = decorators)
 			elif isinstance(self.lines[c], Line):
 				# line protects itself
-				self.lines[c].draw(window, startY)
+				self.lines[c].draw(window, startY, decorators = decorators)
 				startY += 1
 			else:
 				raise UnknownElementException(self.lines[c])
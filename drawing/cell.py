@@ -1,5 +1,3 @@
-import curses
-
 class _CellChars:
 	def __init__(self, start, space, padding):
 		self.start = start
@@ -7,28 +5,67 @@ class _CellChars:
 		self.padding = padding
 
 
-class Cell:
-	def __init__(self, content: str, colWidth: int):
-		self.content = str(content)
-		self.colWidth = colWidth
+# Collects the strings a row is drawn with, left to right, into runs of the same attribute so the row takes one addstr per run
+# Strings are cut off at the edge of the window the way Cell always has (leaving the last column for the end wall to be drawn before)
+# Blank strings were never drawn (so they were left as erased), which is the same as drawing them with no attribute, so they join those runs
+class RowRuns:
+	def __init__(self, maxX: int):
+		self.maxX = maxX
+		# [x, strings, attribute, end x]
+		self.runs = []
+
+	def add(self, startX: int, val: str, decorator: int, isContent: bool = False) -> int:
+		nextX = startX + len(val)
+		if len(val) == 0 or startX >= self.maxX:
+			return nextX
 
-	def _drawStr(self, window: curses.window, y: int, startX: int, val: str, decorator: int, maxX: int, isContent: bool = False):
 		if len(val.strip()) == 0:
-			return startX + len(val)
+			decorator = 0
+			val = val[:self.maxX-1 - startX]
+		elif nextX >= self.maxX:
+			val = val[:self.maxX - startX-1]
+			if isContent:
+				val = (val[:-3] + '...')[:self.maxX - startX]
+		if len(val) == 0:
+			return nextX
 
-		if startX + len(val) < maxX:
-			window.addstr(y, startX, val, decorator)
+		last = self.runs[-1] if len(self.runs) > 0 else None
+		if last is not None and last[2] == decorator and last[3] == startX:
+			last[1].append(val)
+			last[3] += len(val)
 		else:
-			repVal = val[:maxX - startX-1]
-			if isContent:
-				repVal = repVal[:-3] + '...'
-			window.addstr(y, startX, repVal, decorator)
-		return startX + len(val)
-
-	def draw(self, window: curses.window, y: int, startX: int, elDecorator: int, fwDecorator: int, cellChars: _CellChars, maxX: int):
-		startX = self._drawStr(window, y, startX, cellChars.start, fwDecorator, maxX)	# Left separator
-		startX = self._drawStr(window, y, startX, cellChars.space * cellChars.padding, fwDecorator, maxX)	# Left padding
-		startX = self._drawStr(window, y, startX, self.content, elDecorator | fwDecorator, maxX, True)	# Content
-		startX = self._drawStr(window, y, startX, cellChars.space * (self.colWidth - len(self.content)), elDecorator | fwDecorator, maxX)	# Remaining col space
-		startX = self._drawStr(window, y, startX, cellChars.space * cellChars.padding, fwDecorator, maxX)	# Right padding
+			self.runs.append([startX, [val], decorator, startX + len(val)])
+		return nextX
+
+	# Draws val at x over whatever the runs already have there
+	def place(self, x: int, val: str, decorator: int):
+		end = x + len(val)
+		after = []
+		while len(self.runs) > 0 and self.runs[-1][3] > x:
+			runX, strings, runDecorator, runEnd = self.runs.pop()
+			text = ''.join(strings)
+			if runEnd > end:
+				after.insert(0, [max(runX, end), [text[max(runX, end) - runX:]], runDecorator, runEnd])
+			if runX < x:
+				self.runs.append([runX, [text[:x - runX]], runDecorator, x])
+				break
+		self.add(x, val, decorator)
+		self.runs.extend(after)
+
+	def draw(self, window, y: int):
+		for x, strings, decorator, end in self.runs:
+			window.addstr(y, x, ''.join(strings), decorator)
+
+
+class Cell:
+	# Adds the cell's left separator, padding, content and remaining col space, and right padding to runs
+	@staticmethod
+	def addRuns(runs: RowRuns, startX: int, content: str, colWidth: int, elDecorator: int, fwDecorator: int, cellChars: _CellChars) -> int:
+		content = str(content)
+		padding = cellChars.space * cellChars.padding
+		startX = runs.add(startX, cellChars.start, fwDecorator)	# Left separator
+		startX = runs.add(startX, padding, fwDecorator)	# Left padding
+		startX = runs.add(startX, content, elDecorator | fwDecorator, True)	# Content
+		startX = runs.add(startX, cellChars.space * (colWidth - len(content)), elDecorator | fwDecorator)	# Remaining col space
+		startX = runs.add(startX, padding, fwDecorator)	# Right padding
 		return startX
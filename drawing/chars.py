@@ -1,5 +1,11 @@
 import curses
 
+# Text is only colored with colorama when curses is not used (USE_CURSES), so it is only needed then
+try:
+	from colorama import Style, Fore, Back
+except ImportError:
+	Style = Fore = Back = None
+
 class Chars:
 	USE_CURSES = True
 
@@ -16,6 +22,7 @@ class Chars:
 	@staticmethod
 	def initColors():
 		if not Chars.USE_CURSES:
+			Chars.requireColorama()
 			Chars.headerDecorator = Chars.colorize(Style.BRIGHT, Fore.BLUE)
 			return
 		# Header
@@ -33,6 +40,7 @@ class Chars:
 		if Chars.USE_CURSES:
 			return Chars.colorize(2 if isFocused else 3, curses.A_BOLD, curses.A_ITALIC if isFocused else 0)
 
+		Chars.requireColorama()
 		focused = [Style.BRIGHT, Fore.BLACK, Back.WHITE]
 		unfocused = [Style.BRIGHT, Fore.WHITE, Back.BLACK]
 		return Chars.colorize(*(focused if isFocused else unfocused))
@@ -45,10 +53,16 @@ class Chars:
 				res |= c
 			return lambda: res
 
+		Chars.requireColorama()
 		colorizeFn = lambda val: ''.join(args) + str(val) + Style.RESET_ALL
 		return colorizeFn
 
 
+	@staticmethod
+	def requireColorama():
+		if Style is None:
+			raise ImportError('Coloring text without curses (Chars.USE_CURSES = False) needs colorama, which is not installed')
+
 	@staticmethod
 	def color(val, *args):
 		pass
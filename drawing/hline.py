@@ -4,28 +4,46 @@ from .chars import Chars, SepClass
 from .line import Line
 from .connectable import Connectable
 
+# Collects what is drawn to it into a list of characters (one per column, as wide as window to start with) instead of a window
+# steal joins them into a string once, so drawing a line costs what its characters do however many addstrs it takes
 class DummyWindow:
 	def __init__(self, window):
 		self.window = window
-		self.string = ''
+		self.width = window.getmaxyx()[1]
+		self.chars = [' '] * self.width
+		self.end = 0
 
 	def getmaxyx(self):
 		return self.window.getmaxyx()
 
 	def addstr(self, y, x, val, *args):
-		lenDiff = (x + len(str(val))) - len(self.string)
-		if lenDiff > 0:
-			self.string += ' ' * lenDiff
-
-		self.string = self.string[:x] + str(val) + self.string[x+len(str(val)):]
+		val = str(val)
+		end = x + len(val)
+		if end > len(self.chars):
+			self.chars.extend(' ' * (end - len(self.chars)))
+		self.chars[x:end] = val
+		if end > self.end:
+			self.end = end
 
 	def steal(self):
-		ret = self.string
-		self.string = ''
+		ret = ''.join(self.chars[:self.end])
+		self.chars = [' '] * self.width
+		self.end = 0
 		return ret
 
 
 class HLine:
+	# Drawn rows, keyed by everything that goes into them (see _rowKey), so identical separators are only worked out once
+	# Cleared when it gets to MAX_CACHED_ROWS, which only happens if the column widths keep changing
+	_rows: dict = {}
+	MAX_CACHED_ROWS: int = 4096
+
+	# The combined character for every pair of characters a Line can draw with a SepClass, keyed by the SepClass
+	_joinTables: dict = {}
+
+	# Only the characters of the lines an hline is worked out from are kept, so they are drawn with no attributes (and without curses)
+	_noDecorators: List[int] = [0 for _ in range(Line.OTHER+1)]
+
 	def __init__(self, nodes: Union[Connectable, List[Connectable]], sepClass = None, decorator = 0):
 		self.nodes = nodes[:min(2, len(nodes))] if isinstance(nodes, list) else [nodes]
 		self.sepClass = sepClass if sepClass is not None else Chars.singleHLineSep
@@ -48,10 +66,6 @@ class HLine:
 	def draw(self, window: curses.window, y, isTop = False, isBottom = False, sepClass = None):
 		sep = sepClass if sepClass is not None else self.sepClass
 
-		# Use a dummy window object to 'draw' the top and bottom lines
-		# Instead it will be printing them to a string
-		dummyWin = DummyWindow(window)
-
 		if isTop:
 			topNode = None
 			bottomNode = self.nodes[0]
@@ -62,46 +76,72 @@ class HLine:
 			topNode = self.nodes[0]
 			bottomNode = self.nodes[1] if len(self.nodes) > 1 else None
 
+		key = HLine._rowKey(topNode, bottomNode, sep, window.getmaxyx()[1])
+		outStr = HLine._rows.get(key)
+		if outStr is None:
+			outStr = self._drawRow(window, topNode, bottomNode, sep)
+			if len(HLine._rows) >= HLine.MAX_CACHED_ROWS:
+				HLine._rows.clear()
+			HLine._rows[key] = outStr
+
+#		window.addstr(y, 0, topStr, self.decorator)
+#		window.addstr(y, 0, bottomStr, self.decorator)
+		window.addstr(y, 0, outStr, self.decorator)
+
+
+	# The row only depends on the col widths and content lengths either side of it, the SepClass, and the width it is drawn at
+	@staticmethod
+	def _rowKey(topNode, bottomNode, sep, width):
+		top = (tuple(topNode.getBottomColWidths()), topNode.getBottomContentLen()) if topNode is not None else None
+		bottom = (tuple(bottomNode.getTopColWidths()), bottomNode.getTopContentLen()) if bottomNode is not None else None
+		return (top, bottom, sep, width)
+
+
+	def _drawRow(self, window, topNode, bottomNode, sep) -> str:
+		# Use a dummy window object to 'draw' the top and bottom lines
+		# Instead it will be printing them to a string
+		dummyWin = DummyWindow(window)
 
 		if topNode is not None:
 			topLine = Line(topNode.getBottomColWidths(), ['' for _ in range(topNode.getBottomContentLen())], None, sepClass = sep)
-			topLine.draw(dummyWin, 0)
+			topLine.draw(dummyWin, 0, decorators = HLine._noDecorators)
 			topStr = dummyWin.steal()
 		else:
 			topStr = ''
 
 		if bottomNode is not None:
 			bottomLine = Line(bottomNode.getTopColWidths(), ['' for _ in range(bottomNode.getTopContentLen())], None, sepClass = sep)
-			bottomLine.draw(dummyWin, 0)
+			bottomLine.draw(dummyWin, 0, decorators = HLine._noDecorators)
 			bottomStr = dummyWin.steal()
 		else:
 			bottomStr = ''
 
-		outStr = ''
+		joinTable, topOnly, bottomOnly = self.getJoinTable(sep)
+		outStr = []
 		for c in range(max(len(topStr), len(bottomStr))):
 			if c >= len(topStr):
-				if bottomStr[c] == sep.startWall:
-					outStr += sep.br
-				elif bottomStr[c] == sep.centerWall:
-					outStr += sep.hBottom
-				elif bottomStr[c] == sep.endWall:
-					outStr += sep.bl
-				else:
-					outStr += bottomStr[c]
+				outStr.append(bottomOnly.get(bottomStr[c], bottomStr[c]))
 			elif c >= len(bottomStr):
-				if topStr[c] == sep.startWall:
-					outStr += sep.tr
-				elif topStr[c] == sep.centerWall:
-					outStr += sep.hTop
-				elif topStr[c] == sep.endWall:
-					outStr += sep.tl
-				else:
-					outStr += topStr[c]
+				outStr.append(topOnly.get(topStr[c], topStr[c]))
 			else:
-				outStr += self.combineChars(topStr[c], bottomStr[c], sep)
-#		window.addstr(y, 0, topStr, self.decorator)
-#		window.addstr(y, 0, bottomStr, self.decorator)
-		window.addstr(y, 0, outStr, self.decorator)
+				joined = joinTable.get((topStr[c], bottomStr[c]))
+				outStr.append(joined if joined is not None else self.combineChars(topStr[c], bottomStr[c], sep))
+		return ''.join(outStr)
+
+
+	# Works out combineChars for every pair of characters a Line draws with sep (and the plain space cells leave), along with
+	# what each of them turns into with nothing on the other side, the first time sep is drawn
+	def getJoinTable(self, sep):
+		tables = HLine._joinTables.get(sep)
+		if tables is None:
+			chars = set([sep.startWall, sep.centerWall, sep.endWall, sep.space, sep.eSpace, sep.eCenter, ' '])
+			joinTable = {(topChar, bottomChar): self.combineChars(topChar, bottomChar, sep) for topChar in chars for bottomChar in chars}
+			# Walls are checked start first, so that one wins if they are the same character
+			topOnly = {sep.endWall: sep.tl, sep.centerWall: sep.hTop, sep.startWall: sep.tr}
+			bottomOnly = {sep.endWall: sep.bl, sep.centerWall: sep.hBottom, sep.startWall: sep.br}
+			tables = (joinTable, topOnly, bottomOnly)
+			HLine._joinTables[sep] = tables
+		return tables
 
 
 	def combineChars(self, topChar, bottomChar, sep):
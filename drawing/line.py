@@ -2,7 +2,7 @@ import curses
 from .chars import Chars, SepClass
 from typing import List, Union
 from .connectable import Connectable
-from .cell import Cell, _CellChars
+from .cell import Cell, _CellChars, RowRuns
 
 class Line(Connectable):
 	NORMAL: int = 0
@@ -12,6 +12,8 @@ class Line(Connectable):
 	OTHER: int = 4
 
 	colorsInitialized: bool = False
+	# getElementDecorator for every line type, made the first time a line is drawn (after curses has started)
+	_decorators: List[int] = None
 
 	@staticmethod
 	def getElementDecorator(lineType: int) -> int:
@@ -35,36 +37,64 @@ class Line(Connectable):
 
 		return curses.color_pair(2)
 
+	@staticmethod
+	def getElementDecorators() -> List[int]:
+		if Line._decorators is None:
+			Line._decorators = [Line.getElementDecorator(lineType) for lineType in range(Line.OTHER+1)]
+		return Line._decorators
+
 
+	# Cells are only ever added in front of the others (by the nodes above the one the line was made for), so they are kept last cell
+	# first, where adding them is an append.  content and elDecorators give them in the order they are drawn
 	def __init__(self, colWidths: List[int], content: List[str], parent, sepClass: SepClass = None, elDecorators: Union[int, List[int]] = None):
 		self.colWidths = colWidths
-		self.content = []
+		self._cells: List[str] = []
+		self._cellDecorators: List[int] = []
 		self.parents = [parent]
-		self.elDecorators = []
 		self.sepClass = sepClass if sepClass is not None else Chars.contentSep
 		self.y = 0
 
-		iContent = content[::-1]
 		if elDecorators is None or isinstance(elDecorators, int):
-			iElDecorators = [elDecorators if elDecorators is not None else Line.NORMAL for _ in range(len(content))]
-		else:
-			iElDecorators = elDecorators[::-1]
+			elDecorators = [elDecorators if elDecorators is not None else Line.NORMAL for _ in range(len(content))]
+		self.insertContentCells(content, elDecorators)
+
 
-		for c in range(len(content)):
-			self.insertContentCell(iContent[c], iElDecorators[c])
+	@property
+	def content(self) -> List[str]:
+		return self._cells[::-1]
+
+	@property
+	def elDecorators(self) -> List[int]:
+		return self._cellDecorators[::-1]
+
+	@property
+	def isHeader(self) -> bool:
+		return Line.HEADER in self._cellDecorators
 
 
 	def insertContentCell(self, content: str, elDecorator: int, parent = None):
-		if len(self.content) == len(self.colWidths):
+		if len(self._cells) == len(self.colWidths):
+			return
+
+		self._cells.append(content)
+		self._cellDecorators.append(elDecorator)
+		if parent is not None:
+			self.parents.append(parent)
+
+	# Adds the cells in front of the line's, as many of the last of them as there is room for
+	def insertContentCells(self, content: List[str], elDecorators: List[int], parent = None):
+		room = min(len(self.colWidths) - len(self._cells), len(content))
+		if room <= 0:
 			return
 
-		self.content.insert(0, content)
-		self.elDecorators.insert(0, elDecorator)
+		self._cells.extend(content[len(content)-room:][::-1])
+		self._cellDecorators.extend(elDecorators[len(elDecorators)-room:][::-1])
 		if parent is not None:
 			self.parents.append(parent)
 
 
-	def draw(self, window: curses.window, y: int, sepClass: SepClass = None):
+	# decorators are the attributes each line type is drawn with, in the order of the line types (getElementDecorators by default)
+	def draw(self, window: curses.window, y: int, sepClass: SepClass = None, decorators: List[int] = None):
 		self.y = y
 
 		# Useful for hline calculations
@@ -78,28 +108,78 @@ class Line(Connectable):
 #		if y >= maxY or y < 0:
 #			return startX
 
+		# The row is drawn as one string with no attribute, with the content that has one drawn over it
+		# Blank cells were never drawn (they are left as erased), which drawing them with no attribute keeps the same
+		decorators = decorators if decorators is not None else Line.getElementDecorators()
+		pad = effSepClass.space * effSepClass.padding
+		emptyPad = effSepClass.eSpace * effSepClass.padding
+		parts = []
+		overlays = []
+
 		# The number of empty cells is the difference between the colWidths and the content
-		firstContentC = len(self.colWidths) - len(self.content)
+		lastC = len(self.colWidths) - 1
+		firstContentC = len(self.colWidths) - len(self._cells)
 		for c in range(len(self.colWidths)):
 			if c < firstContentC:
-				cellChars = _CellChars(effSepClass.eCenter, effSepClass.eSpace, effSepClass.padding)
-				content = ''
-				effElDecorator = 0
+				parts.append(effSepClass.eCenter + emptyPad + effSepClass.eSpace * self.colWidths[c] + emptyPad)
 			else:
-				cellChars = _CellChars(effSepClass.startWall if c == firstContentC else effSepClass.centerWall, effSepClass.space, effSepClass.padding)
-				content = self.content[c - firstContentC]
-				effElDecorator = Line.getElementDecorator(self.elDecorators[c - firstContentC])
+				content = str(self._cells[lastC - c])
+				fill = effSepClass.space * (self.colWidths[c] - len(content))
+				wall = effSepClass.startWall if c == firstContentC else effSepClass.centerWall
+				elDecorator = decorators[self._cellDecorators[lastC - c]] | fwDecorator
+				if elDecorator != fwDecorator:
+					x = startX + len(wall) + len(pad)
+					if len(content.strip()) > 0:
+						overlays.append((x, content + fill if len(fill.strip()) > 0 else content, elDecorator))
+					elif len(fill.strip()) > 0:
+						overlays.append((x + len(content), fill, elDecorator))
+				parts.append(wall + pad + content + fill + pad)
+
+			startX += len(parts[-1])
+			# Cells that run past the edge are cut off, which only the slower cell by cell drawing does
+			if startX >= maxX:
+				return self._drawRuns(window, y, effSepClass, fwDecorator, maxX, decorators)
 
-			cell = Cell(content, self.colWidths[c])
-			startX = cell.draw(window, y, startX, effElDecorator, fwDecorator, cellChars, maxX)
+		# The line is responsible for drawing the last wall at the full width and space chars before it
+		text = ''.join(parts)
+		if len(effSepClass.space.strip()) > 0:
+			text += (maxX - len(effSepClass.endWall) - startX) * effSepClass.space
+		endX = maxX-len(effSepClass.endWall)-1
+		text = text[:endX].ljust(endX) + effSepClass.endWall + text[endX+len(effSepClass.endWall):]
+
+		window.addstr(y, 0, text, fwDecorator)
+		for x, val, elDecorator in overlays:
+			if x < endX:
+				window.addstr(y, x, val[:endX - x], elDecorator)
+
+		return startX
+
+
+	# Draws the line cell by cell, cutting off whatever runs past the edge of the window, in as few runs as the attributes allow
+	def _drawRuns(self, window: curses.window, y: int, effSepClass: SepClass, fwDecorator: int, maxX: int, decorators: List[int]):
+		startX: int = 0
+		runs = RowRuns(maxX)
+		emptyChars = _CellChars(effSepClass.eCenter, effSepClass.eSpace, effSepClass.padding)
+		firstChars = _CellChars(effSepClass.startWall, effSepClass.space, effSepClass.padding)
+		centerChars = _CellChars(effSepClass.centerWall, effSepClass.space, effSepClass.padding)
+
+		lastC = len(self.colWidths) - 1
+		firstContentC = len(self.colWidths) - len(self._cells)
+		for c in range(len(self.colWidths)):
+			if c < firstContentC:
+				startX = Cell.addRuns(runs, startX, '', self.colWidths[c], 0, fwDecorator, emptyChars)
+			else:
+				elDecorator = decorators[self._cellDecorators[lastC - c]]
+				cellChars = firstChars if c == firstContentC else centerChars
+				startX = Cell.addRuns(runs, startX, self._cells[lastC - c], self.colWidths[c], elDecorator, fwDecorator, cellChars)
 
 			if startX >= maxX:
 				break
 
-		# The line is responsible for drawing the last wall at the full width and space chars before it
 		if len(effSepClass.space.strip()) > 0 and startX < maxX:
-			window.addstr(y, startX, (maxX - len(effSepClass.endWall) - startX) * effSepClass.space, fwDecorator)
-		window.addstr(y, maxX-len(effSepClass.endWall)-1, effSepClass.endWall, fwDecorator)
+			runs.add(startX, (maxX - len(effSepClass.endWall) - startX) * effSepClass.space, fwDecorator)
+		runs.place(maxX-len(effSepClass.endWall)-1, effSepClass.endWall, fwDecorator)
+		runs.draw(window, y)
 
 		return startX
 
@@ -109,6 +189,6 @@ class Line(Connectable):
 		return self.colWidths
 
 	def getTopContentLen(self):
-		return len(self.content)
+		return len(self._cells)
 	def getBottomContentLen(self):
-		return len(self.content)
+		return len(self._cells)
@@ -8,24 +8,119 @@ class ScrollableWindow:
 	MIN_SCROLL = 0
 	CENTER = 1
 
-	def __init__(self, win):
+	# With padScreens, frames are drawn to a curses pad that holds that many window heights of rows around top, and scrolling only
+	# moves which part of the pad is shown (see refresh), so nothing has to be drawn again until top leaves the pad (see isDrawn)
+	# Frames drawn while the pad stays put (ie after moving the focus) only draw what is on screen, which leaves the rest of the pad out of
+	# date, so scrolling off of those rows draws the whole pad again
+	def __init__(self, win, padScreens: int = None):
 		self.win = win
 		self.h, self.w = self.win.getmaxyx()
 		self.contentLen = 0
 		self.top = 0
 
+		self.padScreens = padScreens
+		self.pad = None
+		self.padTop = 0
+		# The rows [drawnTop, drawnBottom) of the pad that are up to date
+		self.drawnTop = 0
+		self.drawnBottom = 0
+
+		# The calls drawn to each row of the window by the last drawFrame, and those of the frame being drawn (see drawFrame)
+		self._lastFrame = {}
+		self._frame = None
+
 
 	def setWindow(self, window):
 		self.win = window
 		self.h, self.w = self.win.getmaxyx()
+		self._lastFrame = {}
+		self.pad = None
+		self.drawnTop = self.drawnBottom = 0
+
+
+	@property
+	def padRows(self) -> int:
+		return self.padScreens * self.h
+
+	# The rows [top, bottom) the next frame should draw: what is on screen, or what the pad will hold, centered on what is on screen
+	def drawRange(self) -> tuple:
+		if self.padScreens is None or self.isDrawn():
+			return (self.top, self.top + self.h)
+		# The pad keeps the band of rows it holds for as long as what is on screen is in it, so frames can be compared with the last
+		if self._onScreen(self.padTop, self.padTop + self.padRows):
+			return (self.padTop, self.padTop + self.padRows)
+		padTop = max(0, self.top - (self.padRows - self.h) // 2)
+		return (padTop, padTop + self.padRows)
+
+	# Whether every row on screen is already drawn on the pad, so scrolling to it only needs a refresh
+	def isDrawn(self) -> bool:
+		return self._onScreen(self.drawnTop, self.drawnBottom)
+
+	# Whether every row on screen is in [top, bottom) of the pad (the rows past the end of the content are never out of date)
+	def _onScreen(self, top: int, bottom: int) -> bool:
+		if self.pad is None:
+			return False
+		return self.top >= top and (self.top + self.h <= bottom or bottom >= self.contentLen)
+
+	# Shows the rows from top on, which for a pad is just a matter of which of its rows are copied to the screen
+	def refresh(self):
+		if self.pad is None:
+			self.win.refresh()
+			return
+		y, x = self.win.getbegyx()
+		self.win.noutrefresh()
+		self.pad.refresh(self.top - self.padTop, 0, y, x, y + self.h-1, x + self.w-1)
 
 
 	def drawAll(self, lines: LineBlock):
-		lines.draw(self, y = 0)
+		# Skipped blocks never draw their rows, so the content length is where drawing ended rather than the last row drawn
+		self.contentLen = max(self.contentLen, lines.draw(self, y = 0))
+
+	# Draws lines as a whole frame, like erase and drawAll, but only rewrites the rows of the window (or pad) that are different from the
+	# last frame drawn this way.  Moving the focus only changes a row or two, so the rest are never cleared and drawn again
+	# lines only has to have the rows of drawRange, and only those are drawn
+	def drawFrame(self, lines: LineBlock):
+		top, bottom = self.drawRange()
+		# The rows on a pad only line up with the last frame's while it holds the same band of rows, so moving it starts over
+		if self.padScreens is not None and not self._onScreen(self.padTop, self.padTop + self.padRows):
+			self.erase()
+
+		self.contentLen = 0
+		self._frame = {}
+		try:
+			self.drawAll(lines)
+		finally:
+			frame, self._frame = self._frame, None
+
+		target, rows = (self.win, range(self.h)) if self.pad is None else (self.pad, range(top - self.padTop, bottom - self.padTop))
+		for effY in rows:
+			row = frame.get(effY)
+			if row == self._lastFrame.get(effY):
+				continue
+			target.move(effY, 0)
+			target.clrtoeol()
+			for x, string, args in (row if row is not None else []):
+				target.addstr(effY, x, string, *args)
+			if row is not None:
+				self._lastFrame[effY] = row
+			else:
+				self._lastFrame.pop(effY, None)
+		self.drawnTop, self.drawnBottom = top, bottom
 
 	def erase(self):
+		self._lastFrame = {}
+		if self.padScreens is None:
+			self.contentLen = 0
+			self.win.erase()
+			return
+
+		# Where the pad goes depends on how long the last frame was, so it is moved before that is forgotten
+		self.padTop = self.drawRange()[0]
+		self.drawnTop = self.drawnBottom = self.padTop
 		self.contentLen = 0
-		self.win.erase()
+		if self.pad is None:
+			self.pad = curses.newpad(self.padRows, self.w)
+		self.pad.erase()
 
 
 	def getmaxyx(self):
@@ -34,12 +129,25 @@ class ScrollableWindow:
 
 	def addstr(self, y, x, string, *args):
 		self.contentLen = max(self.contentLen, y+1)
+		if self.pad is not None:
+			effY = y - self.padTop
+			if effY >= 0 and effY < self.padRows:
+				string = string[:self.w - x - 1]
+				if self._frame is not None:
+					self._frame.setdefault(effY, []).append((x, string, args))
+				else:
+					self.pad.addstr(effY, x, string, *args)
+			return
+
 		effY = y - self.top
 		if effY >= 0 and effY < self.h:
 			# Check for widths now
 			if x + len(string) >= self.w:
 				string = string[:self.w - x - 1]
-			self.win.addstr(effY, x, string, *args)
+			if self._frame is not None:
+				self._frame.setdefault(effY, []).append((x, string, args))
+			else:
+				self.win.addstr(effY, x, string, *args)
 
 
 	def getch(self):
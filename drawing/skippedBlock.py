@@ -0,0 +1,72 @@
+from typing import List
+from .line import Line
+from .hline import HLine
+from .blockLine import LineBlock
+
+# Stands in for the blocks of a run of sibling nodes (first through last) that are entirely outside of the rows being drawn, without rendering them
+# It only knows how many rows they take up (see Node.measure), and whether any of those is a header line, which is all the parent's
+# header and content insertion needs to know (it iterates over one placeholder line of each kind instead)
+# Lines a parent prepends to it are kept and drawn, since those can still be on screen
+# The hlines either side of it need its top and bottom col widths, so only then are its first and last nodes rendered, one row each
+class SkippedBlock(LineBlock):
+	# cache is whether those rows are rendered through the nodes' render caches, like the render the block is part of (see Node.render)
+	def __init__(self, first, last, rows: int, hasHeader: bool, cache: bool = True):
+		placeholders = [Line([0], [''], None, elDecorators = Line.HEADER)] if hasHeader else []
+		placeholders.append(Line([0], [''], None))
+		super().__init__(first, placeholders)
+
+		self.first = first
+		self.last = last
+		self.rows = rows
+		self.cache = cache
+		self.placeholderCount = len(placeholders)
+
+
+	@property
+	def skippedRows(self) -> int:
+		return self.rows
+
+	# Prepended lines go in front of the placeholders, and are iterated over too so a parent's header can still be inserted into them
+	@property
+	def prepended(self) -> List[Line]:
+		return self.lines[:len(self.lines) - self.placeholderCount]
+
+	def prependLine(self, line: Line):
+		self.lines.insert(0, line)
+
+
+	def draw(self, window, y: int = 0, prevLine = None, drawTopHLine = True, drawBottomHLine = True, decorators: List[int] = None) -> int:
+		if drawTopHLine:
+			topNodes = [prevLine, self] if prevLine is not None else [self]
+			HLine(topNodes).draw(window, y, isTop = prevLine is None, isBottom = False)
+			y += 1
+
+		for line in self.prepended:
+			line.draw(window, y, decorators = decorators)
+			y += 1
+		y += self.rows
+
+		if drawBottomHLine:
+			HLine([self]).draw(window, y, isTop = False, isBottom = True)
+			y += 1
+		return y
+
+
+	def getBlockYRange(self):
+		return (None, None)
+
+	def _getNodeYRange(self, node):
+		return None
+
+
+	def getTopColWidths(self):
+		if len(self.prepended) > 0:
+			return self.prepended[0].getTopColWidths()
+		return self.first.render((0, 1), self.cache).getTopColWidths()
+
+	def getBottomColWidths(self):
+		rows = self.last.measure()[0]
+		return self.last.render((rows-1, rows), self.cache).getBottomColWidths()
+
+	def getBottomContentLen(self):
+		return len(self.getBottomColWidths()) - len(self.last._colWidths) + 1
@@ -0,0 +1,66 @@
+from ..data import Tree
+from ..drawing import Line
+
+import shutil
+import itertools
+from typing import TextIO
+
+
+# The escape codes each line type is written with when exporting with ansi (in the order of the Line line types)
+ANSI_CODES = ['', '\x1b[1;7m', '\x1b[1;34m', '\x1b[1m', '\x1b[33m']
+ANSI_RESET = '\x1b[0m'
+
+# Lines are drawn with their line types in place of curses attributes, which are all that is needed to pick escape codes
+EXPORT_DECORATORS = [lineType for lineType in range(Line.OTHER+1)]
+
+
+# Stands in for a curses window while exporting, collecting the rows [top, bottom) of what is drawn to it as characters and the
+# line type each one was drawn with (the decorators lines draw with while exporting are just their line types, see exportGroupedTable)
+class _ExportWindow:
+	def __init__(self, width: int, top: int, bottom: int):
+		self.width = width
+		self.top = top
+		self.rows = [[' '] * width for _ in range(bottom - top)]
+		self.types = [[Line.NORMAL] * width for _ in range(bottom - top)]
+
+	def getmaxyx(self):
+		return (len(self.rows), self.width)
+
+	def addstr(self, y, x, string, decorator = Line.NORMAL):
+		effY = y - self.top
+		if effY < 0 or effY >= len(self.rows):
+			return
+		string = string[:self.width - x]
+		self.rows[effY][x:x+len(string)] = string
+		self.types[effY][x:x+len(string)] = [decorator] * len(string)
+
+	def text(self, rowCount: int, ansi: bool) -> str:
+		if not ansi:
+			return ''.join([''.join(row).rstrip() + '\n' for row in self.rows[:rowCount]])
+
+		out = []
+		for row, types in zip(self.rows[:rowCount], self.types[:rowCount]):
+			end = len(''.join(row).rstrip())
+			x = 0
+			for lineType, run in itertools.groupby(types[:end]):
+				length = len(list(run))
+				chars = ''.join(row[x:x+length])
+				out.append(chars if lineType == Line.NORMAL else ANSI_CODES[lineType] + chars + ANSI_RESET)
+				x += length
+			out.append('\n')
+		return ''.join(out)
+
+
+# Writes the table as it is currently expanded to stream, as plain text or with ansi escape codes, chunkRows rows at a time
+# Each chunk is rendered through a window (see Tree.render) without the render caches, so only one chunk's lines are ever in memory
+# and the caches of a table that is also on screen are left as they were
+# The rows are drawn width characters wide (the terminal's width by default), and cut off the same way the table is on screen
+def exportGroupedTable(tree: Tree, stream: TextIO, width: int = None, ansi: bool = False, chunkRows: int = 1000):
+	width = width if width is not None else shutil.get_terminal_size((120, 24)).columns
+
+	totalRows = tree.root.measure()[0] + 2
+	for top in range(0, totalRows, chunkRows):
+		bottom = min(top + chunkRows, totalRows)
+		window = _ExportWindow(width, top, bottom)
+		tree.render(top, bottom, cache = False).draw(window, decorators = EXPORT_DECORATORS)
+		stream.write(window.text(bottom - top, ansi))
@@ -16,8 +16,13 @@ def getHelpStr(maxW):
 	enter = '[enter]: expand/collapse cell'
 	nav = '[arrow keys]: navigate cells'
 	scroll = '[shift up/down]: scroll window'
-	page = '[page up/down]: jump 10 rows'
-	keys = [quit, copy, hide, enter, nav, page, scroll]
+	page = '[page up/down]: jump a page'
+	search = '/: search'
+	searchNext = 'n/N: next/previous match'
+	filter = 'f: filter rows'
+	expand = 'e: expand all under cell'
+	depth = '[1-9]: collapse table to depth'
+	keys = [quit, copy, hide, enter, nav, page, scroll, search, searchNext, filter, expand, depth]
 	breakIndex = len(keys)
 	helpStrs = []
 	while len(keys) > 0:
@@ -65,28 +70,96 @@ def setupWindows(scr):
 	return (helpWin, statusWin, win)
 
 
-def _showGroupedTable(tree, scr):
+# The text of a prompt after typing ch into it, or None if ch does not edit text
+def editPrompt(text, ch):
+	if ch == curses.KEY_BACKSPACE or ch == 127 or ch == 8:
+		return text[:-1]
+	if 32 <= ch < 127:
+		return text + chr(ch)
+	return None
+
+
+# Filters the tree, keeping focus on the same node if it is still there (or the first one if it is not)
+# Returns the node focused on and an error message for a filter that could not be applied
+def applyFilter(tree, focusNode, predicate):
+	depth = focusNode.focusOut()
+	error = None
+	try:
+		tree.filter(predicate)
+	except Exception as e:
+		error = printable('Filter not applied:', e)
+
+	node = tree.survivor(focusNode)
+	node = node if node is not None else tree.root.children[0]
+	return (node.focusIn(depth), error)
+
+
+# Moves the focus off of a node that is inside a collapsed node onto the highest collapsed node it is inside of
+def focusVisible(focusNode):
+	hiddenBy = None
+	node = focusNode.parent
+	while node is not None:
+		if node.isCollapsed:
+			hiddenBy = node
+		node = node.parent
+	if hiddenBy is None:
+		return focusNode
+	focusNode.focusOut()
+	return hiddenBy.focusIn()
+
+
+# Moves the focus from focusNode onto the node at path (see Tree.find), expanding whatever it is inside of
+def focusPath(tree, focusNode, path):
+	revealed = tree.revealPath(path) if path is not None else None
+	if revealed is None:
+		return focusNode
+	node, depth = revealed
+	focusNode.focusOut()
+	return node.focusIn(depth)
+
+
+def _showGroupedTable(tree, scr, padScreens):
 	# Window initiation stuff
 	curses.raw()
 	curses.curs_set(0)
 
 	helpWin, statusWin, win = setupWindows(scr)
 
-	scrollWindow = ScrollableWindow(win)
+	scrollWindow = ScrollableWindow(win, padScreens)
 	focusNode = tree.root.children[0]
 	focusNode.focusIn(focusNode.depth)
 
 	Keys.initKeys()
 
-	while True:
-		# Rerender
-		lineBlock = tree.render()
+	# query is what has been typed so far while searching (None otherwise), and searchStart is where focus was when the search started
+	query = None
+	lastQuery = None
+	searchStart = None
+	# What has been typed so far while entering a filter (None otherwise)
+	filterText = None
+	# Shown in the status line in place of the focused node until the next key
+	message = None
 
-		scrollWindow.erase()
-		scrollWindow.drawAll(lineBlock)
+	redraw = True
+	while True:
+		# Rerender, only what is on screen (or on the pad), and only redraw the rows that changed
+		# Scrolling around what the pad already has drawn needs neither
+		if redraw or not scrollWindow.isDrawn():
+			top, bottom = scrollWindow.drawRange()
+			scrollWindow.drawFrame(tree.render(top, bottom))
+		scrollWindow.refresh()
+		redraw = True
 
 		statusWin.erase()
-		statusWin.addstr(0, 2, str(focusNode))
+		if message is not None:
+			statusWin.addstr(0, 0, message[:statusWin.getmaxyx()[1]-1])
+			message = None
+		elif filterText is not None:
+			statusWin.addstr(0, 2, 'filter: ' + filterText)
+		elif query is not None:
+			statusWin.addstr(0, 2, '/' + query + ('    (no matches)' if len(query) > 0 and len(tree.find(query)) == 0 else ''))
+		else:
+			statusWin.addstr(0, 2, str(focusNode))
 		statusWin.refresh()
 
 		ch = win.getch()
@@ -100,6 +173,50 @@ def _showGroupedTable(tree, scr):
 			scr.refresh()
 			continue
 
+		# While searching, every key edits the query and focus jumps to the first match from where the search started
+		# Enter keeps the focus where it is (and the query for n/N), escape puts it back where it was
+		if query is not None:
+			if ch == curses.KEY_ENTER or ch == ord('\n') or ch == ord('\r'):
+				lastQuery = query if len(query) > 0 else lastQuery
+				query = None
+				redraw = False
+				continue
+			if ch == 27:
+				query = None
+				focusNode = focusPath(tree, focusNode, tree.searchIndex.pathOf(searchStart))
+			elif editPrompt(query, ch) is not None:
+				query = editPrompt(query, ch)
+			else:
+				redraw = False
+				continue
+
+			if query is not None:
+				path = tree.findNext(query, searchStart, inclusive = True) if len(query) > 0 else tree.searchIndex.pathOf(searchStart)
+				focusNode = focusPath(tree, focusNode, path)
+			yTop, yBottom = tree.getNodeYRange(focusNode)
+			scrollWindow.scrollIntoView(yTop, yBottom)
+			continue
+
+		# A filter is applied once enter is pressed (an empty one shows every row again), escape leaves the filter as it was
+		if filterText is not None:
+			if ch == curses.KEY_ENTER or ch == ord('\n') or ch == ord('\r'):
+				focusNode, error = applyFilter(tree, focusNode, filterText if len(filterText) > 0 else None)
+				filterText = None
+				yTop, yBottom = tree.getNodeYRange(focusNode)
+				scrollWindow.scrollIntoView(yTop, yBottom)
+				message = error
+				continue
+			if ch == 27:
+				filterText = None
+			elif editPrompt(filterText, ch) is not None:
+				filterText = editPrompt(filterText, ch)
+			redraw = False
+			continue
+
+		# Nothing but the keys that scroll, copy, or are unknown leaves the table as it was
+		if ch in [Keys.S_UP, Keys.S_DOWN, ord('c')]:
+			redraw = False
+
 		# Focus management keys
 		scroll = False
 		if ch == Keys.UP:
@@ -120,20 +237,41 @@ def _showGroupedTable(tree, scr):
 			scrollWindow.scrollUp()
 		elif ch == Keys.S_DOWN:
 			scrollWindow.scrollDown()
-		elif ch == Keys.PG_DOWN:
-			# TODO: Make this better so its always about the same number of rows
-			# Rn this scrolls 10 nodes, but a node might be 2 rows, or it might be 30
-			for _ in range(10):
-				focusNode = focusNode.focusDown()
-			scroll = True
-		elif ch == Keys.PG_UP:
-			for _ in range(10):
-				focusNode = focusNode.focusUp()
+		elif ch == Keys.PG_DOWN or ch == Keys.PG_UP:
+			# Focus on whatever is drawn a screen's height of rows away, however many nodes that is
+			step = 1 if ch == Keys.PG_DOWN else -1
+			yTop, yBottom = tree.getNodeYRange(focusNode)
+			pageNode = tree.getFocusableNodeNearY(yTop + 1 + step * scrollWindow.h, step)
+			if pageNode is not None and pageNode is not focusNode:
+				depth = focusNode.focusOut()
+				focusNode = pageNode.focusIn(depth)
 			scroll = True
 
 		elif ch == ord('c'):
 			pyperclip.copy(str(focusNode))
 
+		elif ch == ord('/'):
+			query = ''
+			searchStart = focusNode
+			# Made here (the first time) so typing the query never waits on it
+			tree.searchIndex
+			redraw = False
+			continue
+
+		elif ch == ord('f'):
+			filterText = tree.filterPredicate if isinstance(tree.filterPredicate, str) else ''
+			redraw = False
+			continue
+
+		elif ch == ord('n') or ch == ord('N'):
+			path = tree.findNext(lastQuery, focusNode, 1 if ch == ord('n') else -1) if lastQuery is not None else None
+			if path is None:
+				message = 'No matches' if lastQuery is not None else 'Nothing searched for yet'
+				redraw = False
+				continue
+			focusNode = focusPath(tree, focusNode, path)
+			scroll = True
+
 		elif ch == ord('h'):
 			newFocusNode = focusNode.focusDown()
 			scroll = True
@@ -144,16 +282,28 @@ def _showGroupedTable(tree, scr):
 		elif ch == curses.KEY_ENTER or ch == ord('\n') or ch == ord('\r') or ch == ord('o'):
 			focusNode.click()
 
+		elif ch == ord('e'):
+			focusNode.expandAll()
+			scroll = True
+
+		elif ord('1') <= ch <= ord('9'):
+			tree.root.collapseToDepth(ch - ord('0'))
+			focusNode = focusVisible(focusNode)
+			scroll = True
+
 		else:
 			statusWin.erase()
 			statusWin.addstr(0, 0, printable('Unknown input:', ch))
 			statusWin.refresh()
+			redraw = False
 			continue
 
 		if scroll:
-			yTop, yBottom = lineBlock.getNodeYRange(focusNode)
+			yTop, yBottom = tree.getNodeYRange(focusNode)
 			scrollWindow.scrollIntoView(yTop, yBottom)
 
 
-def showGroupedTable(tree: Tree):
-	curses.wrapper(lambda scr: _showGroupedTable(tree, scr))
+# padScreens is how many screens of rows are drawn at a time onto a curses pad, so that scrolling within them needs no drawing
+# With None every frame draws only what is on screen
+def showGroupedTable(tree: Tree, padScreens: int = 10):
+	curses.wrapper(lambda scr: _showGroupedTable(tree, scr, padScreens))
@@ -0,0 +1,9 @@
+from ..drawing import Line
+
+import pytest
+
+
+# Lines draw with their line types in place of curses attributes, since curses is never started
+@pytest.fixture(autouse = True)
+def lineTypeDecorators(monkeypatch):
+	monkeypatch.setattr(Line, '_decorators', [lineType for lineType in range(Line.OTHER+1)])
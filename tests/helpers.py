@@ -0,0 +1,147 @@
+from ..data import Tree
+from ..config import Config
+from ..functions.exportGroupedTable import exportGroupedTable
+from ..benchmarks.buildTree import makeFrame
+
+import io
+import re
+import numpy as np
+import pandas as pd
+
+
+# The config of the frames made by makeFrame
+def frameConfig() -> Config:
+	return Config({'h_count', 'h_amount'}, {'h_count', 'h_amount', 'h_note'})
+
+
+def makeTree(rows: int = 300, depth: int = 3, seed: int = 0, **kwargs) -> Tree:
+	return Tree(makeFrame(rows, depth, seed), frameConfig(), **kwargs)
+
+
+# A frame with missing group and summed values, float columns with and without fractions, and a countable column that is grouped on
+def mixedFrame(seed: int = 0) -> pd.DataFrame:
+	rng = np.random.default_rng(seed)
+	rows = 200
+	level0 = rng.integers(0, 4, rows).astype(float)
+	level0[rng.random(rows) < 0.1] = np.nan
+	return pd.DataFrame({
+		'g_level0': level0,
+		'g_level1': rng.integers(0, 5, rows),
+		'h_count': rng.integers(0, 50, rows),
+		'h_whole': rng.integers(0, 9, rows).astype(float),
+		'h_amount': np.where(rng.random(rows) < 0.2, np.nan, rng.random(rows).round(2)),
+		'g_name': np.array(['x' + str(v) for v in rng.integers(0, 6, rows)], dtype=object),
+	})
+
+
+def mixedConfig() -> Config:
+	return Config({'h_count', 'h_whole', 'h_amount', 'g_level1'}, {'h_whole'})
+
+
+# A frame whose groups don't sort by plain value: a categorical column whose categories aren't in alphabetical order, and a
+# column that mixes ints and strings
+def unorderedFrame(seed: int = 0) -> pd.DataFrame:
+	rng = np.random.default_rng(seed)
+	rows = 200
+	mixed = np.array([3, 'a', 1, 'b', 20], dtype=object)
+	return pd.DataFrame({
+		'g_kind': pd.Categorical(rng.choice(['z', 'y', 'x'], rows), categories = ['z', 'y', 'w', 'x']),
+		'g_mixed': mixed[rng.integers(0, len(mixed), rows)],
+		'h_count': rng.integers(0, 50, rows),
+		'g_name': np.array(['x' + str(v) for v in rng.integers(0, 6, rows)], dtype=object),
+	})
+
+
+def unorderedConfig() -> Config:
+	return Config({'h_count'}, {'h_count'})
+
+
+# The whole table as it is currently expanded, one string per row
+def tableRows(tree: Tree, width: int = 100) -> list:
+	stream = io.StringIO()
+	exportGroupedTable(tree, stream, width)
+	return stream.getvalue().split('\n')[:-1]
+
+
+# Float sums differ in their last digits depending on the order they are added in
+def rounded(summary: str) -> str:
+	return re.sub(r'\d+\.\d+', lambda match: format(float(match.group(0)), '.6f'), summary) if summary is not None else None
+
+
+# Everything a node is built with, for it and every node under it
+def describe(node) -> list:
+	nodes = [(node.depth, node._contentLine, node._childHeaderLine, node._colWidths, rounded(node.colSummary), rounded(node.colSummaryLong))]
+	for child in node._children:
+		nodes.extend(describe(child))
+	return nodes
+
+
+# Stands in for a curses window or pad, keeping the text drawn to each row and counting the calls that draw it
+class TextWindow:
+	def __init__(self, h: int, w: int):
+		self.h = h
+		self.w = w
+		self.rows = [''] * h
+		self.addstrCalls = 0
+		self.clearedRows = set()
+
+	def getmaxyx(self):
+		return (self.h, self.w)
+
+	def getbegyx(self):
+		return (0, 0)
+
+	def addstr(self, y, x, string, *args):
+		self.addstrCalls += 1
+		row = self.rows[y].ljust(x)
+		self.rows[y] = row[:x] + string + row[x+len(string):]
+
+	def move(self, y, x):
+		self.y = y
+
+	def clrtoeol(self):
+		self.clearedRows.add(self.y)
+		self.rows[self.y] = ''
+
+	def erase(self):
+		self.rows = [''] * self.h
+
+	def refresh(self, *args):
+		pass
+
+	def noutrefresh(self):
+		pass
+
+	def text(self, y: int) -> str:
+		return self.rows[y].rstrip()
+
+
+# Every node of the tree under node, making any that haven't been made
+def walk(node):
+	yield node
+	for child in node.children:
+		yield from walk(child)
+
+
+# Every node that is drawn, down to the collapsed ones
+def walkDrawn(node):
+	yield node
+	if not node.isCollapsed:
+		for child in node.children:
+			yield from walkDrawn(child)
+
+
+# Every node that has been made, without making any more
+def walkLoaded(node):
+	yield node
+	if node.isLoaded:
+		for child in node._loadedChildren:
+			yield from walkLoaded(child)
+
+
+# The node at path, a tuple of _children indices from the root (see Tree.find)
+def nodeAt(tree, path: tuple):
+	node = tree.root
+	for c in path:
+		node = node._children[c]
+	return node
@@ -0,0 +1,123 @@
+from ..data import Tree
+from ..config import Config
+from ..benchmarks.buildTree import makeFrame
+from .helpers import frameConfig, mixedFrame, mixedConfig, unorderedFrame, unorderedConfig, describe, tableRows, walkLoaded
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def assertMatches(tree: Tree, df: pd.DataFrame, config: Config):
+	expected = Tree(df.reset_index(drop = True), config)
+	assert describe(tree.root) == describe(expected.root)
+	tree.root.expandAll()
+	expected.root.expandAll()
+	assert tableRows(tree) == tableRows(expected)
+
+
+def test_appended_and_removed_rows_match_building_the_rows_left():
+	aggregated = Config(set(), {'h_count', 'h_whole', 'h_amount'}, aggregations = {'h_count': ['sum', 'mean', 'max'], 'h_amount': ['min', 'count', 'size', 'sum']})
+	rng = np.random.default_rng(0)
+	for df, config in [(mixedFrame(), mixedConfig()), (unorderedFrame(), unorderedConfig()), (mixedFrame(1)[['g_level0', 'g_level1', 'g_name', 'h_count', 'h_whole', 'h_amount']], aggregated)]:
+		for kwargs in [{}, {'lazy': True}, {'compact': True}]:
+			tree = Tree(df.iloc[:150], config, **kwargs)
+			tableRows(tree)
+			for start in range(150, len(df), 17):
+				tree.append(df.iloc[start:start+17])
+				tableRows(tree)
+			assertMatches(tree, df, config)
+
+			rows = df
+			for _ in range(3):
+				mask = rng.random(len(rows)) < 0.3
+				tree.remove(mask)
+				rows = rows[~mask]
+				tableRows(tree)
+			assertMatches(tree, rows, config)
+
+
+def summarizeRows(self, df, colName, long):
+	return str(len(df)) + ' rows in ' + ', '.join([str(col) for col in df.columns]) + (': ' + str(df.iloc[:, -1].max()) if long else '')
+
+
+def test_summaries_that_cannot_be_added_up_are_made_from_the_rows():
+	rng = np.random.default_rng(1)
+	configs = [
+		(mixedFrame(), Config({'h_count'}, {'h_whole', 'h_amount'}, summarize = summarizeRows)),
+		(mixedFrame(1)[['g_level0', 'g_level1', 'g_name', 'h_count', 'h_whole', 'h_amount']], Config(set(), {'h_count', 'h_whole', 'h_amount'}, aggregations = {'h_count': ['nunique', 'median'], 'h_amount': 'std'})),
+	]
+	for df, config in configs:
+		for kwargs in [{}, {'compact': True}]:
+			tree = Tree(df.iloc[:150], config, **kwargs)
+			kept = tree.root.children[0]
+			kept.isExpanded = True
+			tableRows(tree)
+			tree.append(df.iloc[150:])
+			assert tree.root.children[0] is kept and kept.isExpanded
+			assertMatches(tree, df, config)
+
+			mask = rng.random(len(df)) < 0.3
+			tree.remove(mask)
+			assertMatches(tree, df[~mask], config)
+
+			rows = df[~mask]
+			tree.filter('h_count > 20')
+			assertMatches(tree, rows[rows['h_count'] > 20], config)
+			tree.filter(None)
+			assertMatches(tree, rows, config)
+
+		chunks = (df.iloc[start:start+37] for start in range(0, len(df), 37))
+		assert describe(Tree.fromChunks(chunks, config).root) == describe(Tree(df, config).root)
+
+
+def test_nodes_keep_their_state_through_append_and_remove():
+	df = makeFrame(600, 3)
+	tree = Tree(df.iloc[:500], frameConfig())
+	tree.root.expandAll()
+	tableRows(tree)
+	hidden = tree.root.children[1]
+	hidden.hide()
+	expanded = tree.root.children[0].children[0]
+	before = {id(node) for node in walkLoaded(tree.root)}
+
+	tree.append(df.iloc[500:])
+	mask = np.zeros(600, dtype = bool)
+	mask[[5, 550]] = True
+	tree.remove(mask)
+
+	assert tree.root._children[1] is hidden and hidden.isHidden
+	assert tree.root._children[0]._children[0] is expanded and expanded.isExpanded
+	# No group is rebuilt: the only new nodes are rows that were added, and the only ones gone are rows that were removed
+	after = {id(node) for node in walkLoaded(tree.root)}
+	assert len(after - before) <= 100
+	assert len(before - after) <= 2
+
+
+def test_removing_a_whole_group_removes_its_node():
+	df = makeFrame(300, 3)
+	tree = Tree(df, frameConfig())
+	tree.remove((df['g_level0'] == 'v1').to_numpy())
+	assert 'v1' not in [node._contentLine[0] for node in tree.root.children]
+	assertMatches(tree, df[df['g_level0'] != 'v1'], frameConfig())
+
+
+def test_removing_every_row_is_an_error():
+	tree = Tree(makeFrame(300, 3), frameConfig())
+	with pytest.raises(ValueError):
+		tree.remove(np.ones(300, dtype = bool))
+
+
+def test_appending_to_a_categorical_group_adds_to_that_group():
+	kinds = pd.CategoricalDtype(['z', 'y'])
+	df = pd.DataFrame({'g_kind': pd.Series(['z', 'y', 'z', 'y'], dtype = kinds), 'g_name': ['a', 'b', 'c', 'd'], 'h_count': [1, 2, 3, 4]})
+	added = pd.DataFrame({'g_kind': pd.Series(['z'], dtype = kinds), 'g_name': ['e'], 'h_count': [100]})
+	config = Config({'h_count'}, {'h_count'})
+	for kwargs in [{}, {'lazy': True}, {'compact': True}]:
+		tree = Tree(df, config, **kwargs)
+		tree.root.expandAll()
+		tableRows(tree)
+		tree.append(added)
+		assert [node._contentLine[0] for node in tree.root.children] == ['z', 'y']
+		assert [node.colSummary for node in tree.root.children] == [Tree(pd.concat([df, added]), config).root.children[i].colSummary for i in range(2)]
+		assertMatches(tree, pd.concat([df, added]), config)
@@ -0,0 +1,51 @@
+from ..drawing import SkippedBlock
+from .helpers import makeTree, TextWindow
+
+import pytest
+
+
+def skippedBlocks(block) -> list:
+	found = [block] if isinstance(block, SkippedBlock) else []
+	for line in block.lines:
+		if not hasattr(line, 'content'):
+			found.extend(skippedBlocks(line))
+	return found
+
+
+@pytest.mark.parametrize('window', [None, (0, 30), (200, 240)])
+def test_iterating_gives_the_row_each_line_is_drawn_on(window):
+	tree = makeTree()
+	tree.root.expandAll()
+	block = tree.render(*window) if window is not None else tree.render()
+	block.draw(TextWindow(tree.root.measure()[0] + 2, 100))
+
+	placeholders = set([id(line) for skipped in skippedBlocks(block) for line in skipped.lines[len(skipped.prepended):]])
+	lines = list(block)
+	assert len(lines) > 0
+	for y, line, lineType in lines:
+		if id(line) not in placeholders:
+			assert y == line.y
+	if window is not None and window[0] > 0:
+		assert len(placeholders) > 0
+
+
+def test_skipped_rows_are_counted():
+	tree = makeTree()
+	tree.root.expandAll()
+	block = tree.render(200, 240)
+	ys = [y for y, line, lineType in block]
+	assert ys == sorted(ys)
+	assert ys[-1] >= 240 - 1
+
+
+def test_blocks_can_be_iterated_by_more_than_one_consumer_at_once():
+	tree = makeTree()
+	tree.root.collapseToDepth(2)
+	block = tree.render()
+	first = iter(block)
+	second = iter(block)
+	interleaved = []
+	for a, b in zip(first, second):
+		interleaved.append(a)
+		assert a == b
+	assert interleaved == list(block)
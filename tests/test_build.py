@@ -0,0 +1,131 @@
+from ..data import Tree
+from ..data import tree as treeModule
+from ..data.groupIndex import GroupIndex
+from ..data.treeStore import TreeStore
+from ..data.summaryRollup import SummaryRollup, AggregationRollup
+from ..config import Config
+from ..benchmarks.buildTree import makeFrame
+from .helpers import makeTree, frameConfig, mixedFrame, mixedConfig, unorderedFrame, unorderedConfig, describe, tableRows, walkLoaded
+
+import numpy as np
+import pandas as pd
+
+
+def test_lazy_tree_draws_like_an_eager_one():
+	lazy = makeTree(depth = 4, lazy = True)
+	eager = makeTree(depth = 4)
+	assert tableRows(lazy) == tableRows(eager)
+	lazy.root.expandAll()
+	eager.root.expandAll()
+	assert tableRows(lazy) == tableRows(eager)
+
+
+def test_lazy_tree_only_builds_the_children_it_draws():
+	tree = makeTree(depth = 4, lazy = True)
+	tableRows(tree)
+	assert all([not child.isLoaded for child in tree.root._loadedChildren])
+
+	node = tree.root.children[1]
+	node.isExpanded = True
+	tableRows(tree)
+	assert node.isLoaded
+	assert all([not child.isLoaded for child in node._loadedChildren])
+	assert len(list(walkLoaded(tree.root))) == 1 + len(tree.root.children) + len(node.children)
+
+
+def test_rollup_summaries_match_summarizing_each_group():
+	config = mixedConfig()
+	for seed in range(3):
+		df = mixedFrame(seed)
+		index = GroupIndex(df, config)
+		assert describe(Tree.buildTree(df, config, index = index)) == describe(Tree.buildTreeRecursive(df, config))
+		assert isinstance(index._rollup, SummaryRollup)
+
+
+def test_aggregations_match_aggregating_each_group():
+	# The recursive build drops every column it groups on, so the aggregated columns are hidden and last to be in every group's frame
+	hidden = {'h_count', 'h_whole', 'h_amount'}
+	configs = [
+		Config(set(), hidden, aggregations = {'h_count': ['sum', 'mean', 'max'], 'h_amount': ['min', 'count', 'size', 'nunique']}),
+		Config(set(), hidden, aggregations = {'h_count': 'sum', 'h_amount': 'mean'}, summaryFormat = '{h_count_sum}', summaryFormatLong = '{h_count_sum} / {h_amount_mean}'),
+	]
+	for config in configs:
+		for seed in range(3):
+			df = mixedFrame(seed)[['g_level0', 'g_level1', 'g_name', 'h_count', 'h_whole', 'h_amount']]
+			index = GroupIndex(df, config)
+			assert describe(Tree.buildTree(df, config, index = index)) == describe(Tree.buildTreeRecursive(df, config))
+			assert isinstance(index._rollup, AggregationRollup)
+
+
+def test_aggregated_columns_missing_from_a_group_are_aggregated_as_all_na():
+	config = Config(set(), {'h_count', 'h_whole', 'h_amount'}, aggregations = {'h_count': 'sum', 'h_amount': ['min', 'count', 'size', 'sum', 'mean', 'nunique']})
+	df = mixedFrame()[['g_level0', 'g_level1', 'g_name', 'h_count', 'h_whole', 'h_amount']]
+	# Every group with g_level1 == 2 has no h_amount, so the recursive build drops it from their frames
+	df.loc[df['g_level1'] == 2, 'h_amount'] = np.nan
+	assert describe(Tree.buildTree(df, config)) == describe(Tree.buildTreeRecursive(df, config))
+
+	rows = df[df['g_level1'] == 2].drop(columns = ['h_amount'])
+	expected = config.summarize(rows.assign(h_amount = np.nan), 'g_level0')
+	assert config.summarize(rows, 'g_level0') == expected
+	assert 'amount count: 0, amount size: ' + str(len(rows)) in expected
+
+
+def test_aggregations_are_formatted_with_the_summary_formats():
+	df = pd.DataFrame({'g_group': ['a', 'a', 'b'], 'g_name': ['x', 'y', 'z'], 'h_count': [1, 2, 4]})
+	config = Config(set(), {'h_count'}, aggregations = {'h_count': ['sum', 'max']})
+	assert Tree.buildTree(df, config).children[0].colSummary == 'count sum: 3, count max: 2'
+
+	config = Config(set(), {'h_count'}, aggregations = {'h_count': ['sum', 'max']}, summaryFormat = '{h_count_sum}', summaryFormatLong = 'at most {h_count_max}')
+	node = Tree.buildTree(df, config).children[0]
+	assert (node.colSummary, node.colSummaryLong) == ('3', 'at most 2')
+
+
+def test_parallel_build_matches_the_serial_one(monkeypatch):
+	# Workers index their own batches, but the main process never indexes the whole frame
+	indexed = []
+	class CountedGroupIndex(GroupIndex):
+		def __init__(self, df, config):
+			indexed.append(len(df))
+			super().__init__(df, config)
+	monkeypatch.setattr(treeModule, 'GroupIndex', CountedGroupIndex)
+
+	aggregated = Config(set(), {'h_count', 'h_whole', 'h_amount'}, aggregations = {'h_count': ['sum', 'mean', 'max'], 'h_amount': ['min', 'count', 'size', 'sum']})
+	frames = [
+		(mixedFrame(), mixedConfig()),
+		(makeFrame(500, 4), frameConfig()),
+		(unorderedFrame(), unorderedConfig()),
+		(mixedFrame(1)[['g_level0', 'g_level1', 'g_name', 'h_count', 'h_whole', 'h_amount']], aggregated),
+	]
+	for df, config in frames:
+		serial = Tree(df, config)
+		for workers in [2, 3]:
+			del indexed[:]
+			assert describe(Tree(df, config, workers = workers).root) == describe(serial.root)
+			assert len(df) not in indexed
+
+
+def test_compact_tree_matches_the_node_build():
+	for df, config in [(mixedFrame(), mixedConfig()), (makeFrame(500, 4), frameConfig())]:
+		assert describe(Tree(df, config, compact = True).root) == describe(Tree.buildTree(df, config))
+
+
+def test_compact_tree_only_makes_the_nodes_it_draws():
+	tree = makeTree(depth = 4, compact = True)
+	assert tableRows(tree) == tableRows(makeTree(depth = 4))
+	node = tree.root.children[1]
+	node.isExpanded = True
+	tableRows(tree)
+	assert len(list(walkLoaded(tree.root))) == 1 + len(tree.root.children) + len(node.children)
+	# Only the store is kept once it is built, not the index it was built from
+	tree.find('v1')
+	assert tree._index is None
+
+
+def test_saved_store_loads_back_the_same_tree(tmp_path):
+	df = makeFrame(500, 4)
+	store = TreeStore.build(GroupIndex(df, frameConfig()))
+	store.save(str(tmp_path))
+	for mmap in [True, False]:
+		loadedStore = TreeStore.load(str(tmp_path), mmap)
+		assert describe(Tree._fromStore(loadedStore, 0, [])) == describe(Tree._fromStore(store, 0, []))
+		assert loadedStore.searchEntries() == store.searchEntries()
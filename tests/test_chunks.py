@@ -0,0 +1,39 @@
+from ..data import Tree
+from ..config import Config
+from ..benchmarks.buildTree import makeFrame
+from .helpers import frameConfig, mixedFrame, mixedConfig, unorderedFrame, unorderedConfig, describe, tableRows
+
+import pytest
+
+
+def chunked(df, size: int):
+	return (df.iloc[start:start+size] for start in range(0, len(df), size))
+
+
+def test_chunked_tree_matches_building_the_whole_frame():
+	configs = [
+		(makeFrame(500, 4), frameConfig()),
+		(mixedFrame(), mixedConfig()),
+		(unorderedFrame(), unorderedConfig()),
+		(mixedFrame(1)[['g_level0', 'g_level1', 'g_name', 'h_count', 'h_whole', 'h_amount']], Config(set(), {'h_count', 'h_whole', 'h_amount'}, aggregations = {'h_count': ['sum', 'mean', 'max'], 'h_amount': ['min', 'count', 'size', 'sum']})),
+	]
+	for df, config in configs:
+		expected = describe(Tree.buildTree(df, config))
+		for size in [1, 29, len(df)]:
+			assert describe(Tree.fromChunks(chunked(df, size), config).root) == expected
+
+
+def test_chunked_tree_draws_like_a_built_one():
+	df = makeFrame(500, 4)
+	chunkedTree = Tree.fromChunks(chunked(df, 64), frameConfig())
+	tree = Tree(df, frameConfig())
+	assert chunkedTree.df is None
+	assert tableRows(chunkedTree) == tableRows(tree)
+	chunkedTree.root.expandAll()
+	tree.root.expandAll()
+	assert tableRows(chunkedTree) == tableRows(tree)
+
+
+def test_no_chunks_is_an_error():
+	with pytest.raises(ValueError):
+		Tree.fromChunks([], frameConfig())
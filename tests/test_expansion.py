@@ -0,0 +1,99 @@
+from ..functions.showGroupedTable import focusVisible
+from .helpers import makeTree, tableRows, walk, walkDrawn
+
+
+# Only nodes drawn with their children lay them out
+def cached(node) -> bool:
+	laidOut = node._layout is not None or node.isCollapsed or len(node.children) == 0
+	return node._renderCache is not None and node._measure is not None and laidOut
+
+
+def test_expandAll_expands_every_node_under_this_one():
+	tree = makeTree()
+	node = tree.root.children[1]
+	node.expandAll()
+	assert all([not other.isCollapsed for other in walk(node)])
+	assert all([tree.root.children[c].isCollapsed for c in [0, 2]])
+
+
+def test_collapseToDepth_shows_that_many_levels():
+	tree = makeTree(depth = 4)
+	tree.root.expandAll()
+	for depth in [1, 2, 3]:
+		tree.root.collapseToDepth(depth)
+		drawn = list(walkDrawn(tree.root))
+		assert max([node.depth for node in drawn]) == depth
+		assert all([node.isCollapsed for node in drawn if node.depth == depth and len(node.children) > 1])
+		assert all([node.isExpanded for node in drawn if node.depth < depth])
+
+
+def test_collapseToDepth_is_relative_to_the_node_and_leaves_deeper_nodes_alone():
+	tree = makeTree(depth = 4)
+	tree.root.expandAll()
+	node = tree.root.children[0]
+	node.collapseToDepth(1)
+	assert not node.isCollapsed
+	assert all([child.isCollapsed for child in node.children if len(child.children) > 1])
+	# Below the collapsed level, nodes keep the state they had
+	assert all([grandchild.isExpanded for child in node.children for grandchild in child.children])
+	assert not tree.root.children[1].isCollapsed
+
+
+def test_expansion_matches_setting_isExpanded_on_each_node():
+	bulk = makeTree(depth = 4)
+	each = makeTree(depth = 4)
+	bulk.root.collapseToDepth(3)
+	for node in walk(each.root):
+		node.isExpanded = node.depth < 3
+	assert tableRows(bulk) == tableRows(each)
+
+	bulk.root.children[2].expandAll()
+	for node in walk(each.root.children[2]):
+		node.isExpanded = True
+	assert tableRows(bulk) == tableRows(each)
+
+
+def test_setExpansion_clears_the_caches_of_the_nodes_it_changes_and_their_ancestors():
+	tree = makeTree(depth = 4)
+	tree.root.expandAll()
+	tree.render()
+	assert all([cached(node) for node in walk(tree.root)])
+
+	node = tree.root.children[0].children[0]
+	node.collapseToDepth(1)
+	changed = [node, *node.children]
+	for other in [*changed, node.parent, tree.root]:
+		assert other._renderCache is None and other._measure is None and other._layout is None
+	untouched = [grandchild for child in node.children for grandchild in child.children]
+	assert len(untouched) > 0 and all([cached(other) for other in untouched])
+	assert all([cached(other) for other in walk(tree.root.children[1])])
+
+	fresh = makeTree(depth = 4)
+	fresh.root.expandAll()
+	fresh.root.children[0].children[0].collapseToDepth(1)
+	assert tableRows(tree) == tableRows(fresh)
+
+
+def test_focusVisible_moves_the_focus_onto_the_highest_collapsed_ancestor():
+	tree = makeTree(depth = 4)
+	tree.root.expandAll()
+	focusNode = tree.root.children[1].children[0].children[0].focusIn(3)
+	assert focusNode.depth == 3
+
+	tree.root.collapseToDepth(2)
+	moved = focusVisible(focusNode)
+	assert moved is tree.root.children[1].children[0]
+	assert moved.isFocused and not focusNode.isFocused
+	assert tree.getNodeYRange(moved) != (0, 0)
+
+	tree.root.collapseToDepth(1)
+	assert focusVisible(moved) is tree.root.children[1]
+
+
+def test_focusVisible_keeps_a_visible_focus():
+	tree = makeTree(depth = 4)
+	tree.root.expandAll()
+	focusNode = tree.root.children[1].children[0].focusIn(2)
+	tree.root.collapseToDepth(2)
+	assert focusVisible(focusNode) is focusNode
+	assert focusNode.isFocused
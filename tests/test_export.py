@@ -0,0 +1,80 @@
+from ..drawing import Line, Chars
+from ..drawing import chars
+from ..functions.exportGroupedTable import exportGroupedTable, ANSI_CODES
+from .helpers import makeTree, TextWindow
+
+import io
+import pytest
+
+
+def export(tree, **kwargs) -> str:
+	stream = io.StringIO()
+	exportGroupedTable(tree, stream, 100, **kwargs)
+	return stream.getvalue()
+
+
+def drawnRows(tree) -> list:
+	window = TextWindow(tree.root.measure()[0] + 2, 100)
+	tree.render().draw(window)
+	return [window.text(y) for y in range(window.h)]
+
+
+def cachedRenders(node) -> list:
+	renders = [(node, node._renderCache)]
+	if not node.isCollapsed:
+		for child in node.children:
+			renders.extend(cachedRenders(child))
+	return renders
+
+
+@pytest.mark.parametrize('chunkRows', [1, 7, 1000])
+def test_export_writes_the_table_as_drawn(chunkRows):
+	tree = makeTree()
+	tree.root.collapseToDepth(2)
+	tree.root.children[1].focusIn(2)
+	assert export(tree, chunkRows = chunkRows) == ''.join([row + '\n' for row in drawnRows(tree)])
+
+
+def test_export_colors_lines_by_type():
+	tree = makeTree()
+	tree.root.children[0].focusIn(1)
+	text = export(tree, ansi = True)
+	assert ANSI_CODES[Line.HEADER] in text
+	assert ANSI_CODES[Line.FOCUSED] in text
+	assert text.count('\n') == tree.root.measure()[0] + 2
+
+
+def test_export_leaves_render_caches_and_decorators_alone(monkeypatch):
+	tree = makeTree()
+	tree.root.collapseToDepth(2)
+	monkeypatch.setattr(Line, '_decorators', None)
+	tree.render()
+	renders = cachedRenders(tree.root)
+	assert all([render is not None for node, render in renders])
+
+	export(tree, chunkRows = 5)
+	assert Line._decorators is None
+	assert cachedRenders(tree.root) == renders
+
+
+# Drawing the table on screen while an export of it is being written (ie from the stream) sees none of the export's state
+def test_export_can_be_interleaved_with_drawing():
+	tree = makeTree()
+	tree.root.collapseToDepth(2)
+	expected = drawnRows(tree)
+
+	class DrawingStream(io.StringIO):
+		def write(self, text):
+			assert drawnRows(tree) == expected
+			return super().write(text)
+
+	exportGroupedTable(tree, DrawingStream(), 100, chunkRows = 3)
+
+
+def test_colors_without_curses_need_colorama(monkeypatch):
+	monkeypatch.setattr(Chars, 'USE_CURSES', False)
+	if chars.Style is None:
+		with pytest.raises(ImportError):
+			Chars.groupDecorator(True)
+	else:
+		assert Chars.groupDecorator(True)('x').endswith('x' + chars.Style.RESET_ALL)
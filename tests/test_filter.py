@@ -0,0 +1,86 @@
+from ..data import Tree
+from ..config import Config
+from ..benchmarks.buildTree import makeFrame
+from .helpers import unorderedFrame, unorderedConfig, tableRows
+
+import numpy as np
+import pandas as pd
+
+
+def config() -> Config:
+	return Config({'h_count', 'h_amount'}, {'h_count', 'h_amount', 'h_note'})
+
+
+# The tree is drawn the same as a tree built from just rows, with everything expanded
+def assertShows(tree: Tree, rows: pd.DataFrame):
+	expected = Tree(rows.reset_index(drop = True), config())
+	tree.root.expandAll()
+	expected.root.expandAll()
+	assert tableRows(tree) == tableRows(expected)
+
+
+def test_filter_shows_only_matching_rows():
+	df = makeFrame(300, 3)
+	tree = Tree(df, config())
+	tree.filter('g_level1 = v2')
+	assertShows(tree, df[df['g_level1'] == 'v2'])
+	tree.filter('h_count > 50')
+	assertShows(tree, df[df['h_count'] > 50])
+	tree.filter(None)
+	assertShows(tree, df)
+
+
+def test_filter_keeps_category_order_and_mixed_types():
+	df = unorderedFrame()
+	tree = Tree(df, unorderedConfig())
+	tree.filter('h_count > 20')
+	expected = Tree(df[df['h_count'] > 20].reset_index(drop = True), unorderedConfig())
+	tree.root.expandAll()
+	expected.root.expandAll()
+	assert tableRows(tree) == tableRows(expected)
+	assert [node._contentLine[0] for node in tree.root.children] == ['z', 'y', 'x']
+
+
+def test_remove_keeps_the_added_frames():
+	df = makeFrame(300, 3)
+	added = makeFrame(50, 3, seed = 1)
+	tree = Tree(df, config())
+	tree.append(added)
+	mask = np.zeros(350, dtype = bool)
+	mask[[3, 10, 320]] = True
+	tree.remove(mask)
+
+	assert [id(frame) for firstId, frame in tree._sources] == [id(df), id(added)]
+	assert tree.source.equals(pd.concat([df, added])[~mask])
+	tree.filter('h_count > 50')
+	rows = pd.concat([df, added])[~mask]
+	assertShows(tree, rows[rows['h_count'] > 50])
+
+
+def test_remove_drops_frames_without_rows_left():
+	df = makeFrame(300, 3)
+	added = makeFrame(50, 3, seed = 1)
+	tree = Tree(df, config())
+	tree.append(added)
+	tree.remove(np.arange(350) >= 300)
+	assert [id(frame) for firstId, frame in tree._sources] == [id(df)]
+	assertShows(tree, df)
+
+
+def test_append_only_checks_the_new_rows_against_the_filter(monkeypatch):
+	df = makeFrame(300, 3)
+	added = makeFrame(40, 3, seed = 1)
+	tree = Tree(df, config())
+	tree.remove(np.arange(300) < 20)
+	tree.filter('h_count > 50')
+
+	checked = []
+	matchRows = Tree._matchRows
+	monkeypatch.setattr(Tree, '_matchRows', staticmethod(lambda predicate, frame: checked.append(len(frame)) or matchRows(predicate, frame)))
+	tree.append(added)
+	assert checked == [len(added)]
+
+	rows = pd.concat([df[20:], added])
+	assertShows(tree, rows[rows['h_count'] > 50])
+	tree.filter(None)
+	assertShows(tree, rows)
@@ -0,0 +1,37 @@
+from ..data import Tree
+from ..data.groupIndex import GroupIndex
+from ..config import Config
+from ..benchmarks.buildTree import makeFrame
+
+import numpy as np
+
+
+def describeNodes(node) -> list:
+	out = []
+	stack = [node]
+	while len(stack) > 0:
+		node = stack.pop()
+		out.append((node.depth, node._contentLine, node._childHeaderLine, node._colWidths, node.colSummary, node.colSummaryLong))
+		stack.extend(reversed(node._children))
+	return out
+
+
+# Shows which rows and columns a group's frame has, and its index (which keeps the rows' original order)
+def rowsAndColumns(config, df, colName, long):
+	return str(len(df)) + ' ' + ','.join([str(col) for col in df.columns]) + (' ' + str(list(df.index)) if long else '')
+
+
+def test_groupFrame_is_the_rows_and_columns_of_the_group():
+	df = makeFrame(200, 3)
+	index = GroupIndex(df, Config(set(), set()))
+	for gn, start, end in index.subgroups(0, len(index), 0):
+		frame = index.groupFrame(start, end, [1, 3])
+		expected = df[df['g_level0'] == gn].iloc[:, [1, 3]]
+		assert frame.equals(expected)
+
+
+def test_summaries_from_group_frames_match_the_recursive_build():
+	df = makeFrame(300, 3)
+	df.loc[np.arange(0, 300, 7), 'g_level1'] = None
+	config = Config({'h_count', 'h_amount'}, {'h_count', 'h_amount', 'h_note'}, summarize = rowsAndColumns)
+	assert describeNodes(Tree(df, config).root) == describeNodes(Tree.buildTreeRecursive(df, config))
@@ -0,0 +1,124 @@
+from ..drawing import Chars, Line, HLine
+from ..drawing.hline import DummyWindow
+from .helpers import makeTree, TextWindow
+
+import pytest
+
+
+# How an hline was drawn before rows were memoized: both lines drawn, then joined a character at a time
+def referenceRow(window, topNode, bottomNode, sep) -> str:
+	dummyWin = DummyWindow(window)
+	strs = []
+	for node, colWidths, contentLen in [(topNode, 'getBottomColWidths', 'getBottomContentLen'), (bottomNode, 'getTopColWidths', 'getTopContentLen')]:
+		if node is None:
+			strs.append('')
+			continue
+		Line(getattr(node, colWidths)(), ['' for _ in range(getattr(node, contentLen)())], None, sepClass = sep).draw(dummyWin, 0, decorators = HLine._noDecorators)
+		strs.append(dummyWin.steal())
+	topStr, bottomStr = strs
+
+	outStr = ''
+	for c in range(max(len(topStr), len(bottomStr))):
+		if c >= len(topStr):
+			if bottomStr[c] == sep.startWall:
+				outStr += sep.br
+			elif bottomStr[c] == sep.centerWall:
+				outStr += sep.hBottom
+			elif bottomStr[c] == sep.endWall:
+				outStr += sep.bl
+			else:
+				outStr += bottomStr[c]
+		elif c >= len(bottomStr):
+			if topStr[c] == sep.startWall:
+				outStr += sep.tr
+			elif topStr[c] == sep.centerWall:
+				outStr += sep.hTop
+			elif topStr[c] == sep.endWall:
+				outStr += sep.tl
+			else:
+				outStr += topStr[c]
+		else:
+			outStr += HLine(topNode).combineChars(topStr[c], bottomStr[c], sep)
+	return outStr
+
+
+def drawnRow(hline: HLine, width: int, **kwargs) -> str:
+	window = TextWindow(1, width)
+	hline.draw(window, 0, **kwargs)
+	return window.rows[0]
+
+
+# The blocks of every node of an expanded tree, in the order they are drawn
+def blocks() -> list:
+	tree = makeTree(depth = 4)
+	tree.root.expandAll()
+	nodes = [tree.root]
+	for node in nodes:
+		nodes.extend(node.children)
+	return [node.render() for node in nodes]
+
+
+@pytest.mark.parametrize('sep', [Chars.singleHLineSep, Chars.heavyHLineSep])
+def test_memoized_rows_match_joining_the_lines(monkeypatch, sep):
+	monkeypatch.setattr(HLine, '_rows', {})
+	drawn = blocks()
+	for width in [100, 40]:
+		for top, bottom in zip(drawn, drawn[1:]):
+			window = TextWindow(1, width)
+			expected = [referenceRow(window, None, top, sep), referenceRow(window, top, bottom, sep), referenceRow(window, bottom, None, sep)]
+			# Drawn once to fill the memo, and again out of it
+			for _ in range(2):
+				assert drawnRow(HLine([top], sep), width, isTop = True) == expected[0]
+				assert drawnRow(HLine([top, bottom], sep), width) == expected[1]
+				assert drawnRow(HLine([bottom], sep), width, isBottom = True) == expected[2]
+	assert 0 < len(HLine._rows) < 3 * len(drawn)
+
+
+def test_memo_is_cleared_when_full(monkeypatch):
+	monkeypatch.setattr(HLine, '_rows', {})
+	monkeypatch.setattr(HLine, 'MAX_CACHED_ROWS', 4)
+	drawn = blocks()
+	for top, bottom in zip(drawn, drawn[1:]):
+		drawnRow(HLine([top, bottom]), 100)
+		assert len(HLine._rows) <= 4
+
+
+# How DummyWindow built its string before, by splicing each addstr into it
+class StringWindow:
+	def __init__(self):
+		self.string = ''
+
+	def getmaxyx(self):
+		return (1, 100)
+
+	def addstr(self, y, x, val, *args):
+		lenDiff = (x + len(str(val))) - len(self.string)
+		if lenDiff > 0:
+			self.string += ' ' * lenDiff
+		self.string = self.string[:x] + str(val) + self.string[x+len(str(val)):]
+
+
+def test_dummy_window_matches_splicing_strings():
+	dummyWin = DummyWindow(TextWindow(1, 10))
+	calls = [
+		[(0, 'abc'), (5, 'de')],
+		[(4, 'xy'), (0, 'q'), (2, 'long enough to run past the window')],
+		[(3, 'abcdef'), (4, 'Z'), (1, 42)],
+		[],
+	]
+	for strings in calls:
+		reference = StringWindow()
+		for x, val in strings:
+			dummyWin.addstr(0, x, val, 5)
+			reference.addstr(0, x, val, 5)
+		assert dummyWin.steal() == reference.string
+
+	# Lines draw their cells in any order, which steal joins up
+	tree = makeTree()
+	tree.root.expandAll()
+	y, line, lineType = next(iter(tree.root.render()))
+	reference = StringWindow()
+	dummyWin = DummyWindow(TextWindow(1, 100))
+	line.draw(reference, 0, decorators = HLine._noDecorators)
+	line.draw(dummyWin, 0, decorators = HLine._noDecorators)
+	assert dummyWin.steal() == reference.string
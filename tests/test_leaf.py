@@ -0,0 +1,59 @@
+from ..data.leafNode import LeafNode
+from .helpers import makeTree, tableRows, nodeAt
+
+import random
+
+
+# Every node that has been built, with the path of indices in _children that leads to it
+def loadedNodes(node, path: tuple = ()):
+	yield node, path
+	if node.isLoaded:
+		for c, child in enumerate(node._children):
+			yield from loadedNodes(child, (*path, c))
+
+
+# Whether node is a leaf, worked out down its chain of shown children every time
+def isLeaf(node) -> bool:
+	children = [child for child in node._children if not child.isHidden]
+	return len(children) == 0 or (len(children) == 1 and isLeaf(children[0]))
+
+
+def test_hiding_at_random_matches_hiding_the_same_nodes_from_scratch():
+	for seed in range(6):
+		rng = random.Random(seed)
+		tree = makeTree(60 + 20 * seed, depth = 4, seed = seed, lazy = seed % 2 == 0)
+		tree.root.expandAll()
+		hidden = set()
+		for _ in range(20):
+			node, path = rng.choice(list(loadedNodes(tree.root))[1:])
+			node.hide()
+			hidden ^= {path}
+
+			expected = makeTree(60 + 20 * seed, depth = 4, seed = seed)
+			expected.root.expandAll()
+			for path in sorted(hidden):
+				nodeAt(expected, path).hide()
+			assert tableRows(tree) == tableRows(expected)
+			for node, path in loadedNodes(tree.root):
+				assert LeafNode.isLeaf(node) == isLeaf(node)
+
+
+def test_unchanged_leaves_are_kept_when_children_are_recalculated():
+	tree = makeTree(100, depth = 4)
+	tree.root.expandAll()
+	parent = max([node for node, path in loadedNodes(tree.root)], key = lambda node: len([child for child in node.children if isinstance(child, LeafNode)]))
+	leaves = [child for child in parent.children if isinstance(child, LeafNode)]
+	assert len(leaves) > 2
+
+	leaves[1].derivedNode.hide()
+	kept = [child for child in parent.children if isinstance(child, LeafNode)]
+	assert len(kept) == len(leaves) - 1
+	assert all([child is leaf for child, leaf in zip(kept, [leaves[0], *leaves[2:]])])
+
+
+def test_unloaded_nodes_are_leaves_only_without_children():
+	tree = makeTree(300, depth = 4, lazy = True)
+	for node in tree.root._children:
+		if node.childCount != 1:
+			assert LeafNode.isLeaf(node) == (node.childCount == 0)
+			assert not node.isLoaded
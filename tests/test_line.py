@@ -0,0 +1,120 @@
+from ..drawing import Chars, Line
+
+import random
+
+
+# Keeps the character and attribute drawn to every column of a row, and fails on anything drawn past the edge
+class AttrWindow:
+	def __init__(self, w: int):
+		self.w = w
+		self.cells = {}
+		self.addstrCalls = 0
+
+	def getmaxyx(self):
+		return (1, self.w)
+
+	def addstr(self, y, x, string, attr = 0):
+		self.addstrCalls += 1
+		assert x + len(string) <= self.w
+		for c, char in enumerate(string):
+			self.cells[x + c] = (char, attr)
+
+	def text(self) -> str:
+		return ''.join([self.cells.get(x, (' ', 0))[0] for x in range(self.w)])
+
+	def attrs(self) -> list:
+		return [self.cells.get(x, (' ', 0))[1] for x in range(self.w)]
+
+
+def randomLine(rng: random.Random) -> Line:
+	cols = rng.randint(1, 8)
+	colWidths = [rng.randint(0, 12) for _ in range(cols)]
+	cells = rng.randint(0, cols)
+	content = [rng.choice(['', 'x', 'hello', 'a longer value', '  ', ' pad ', 'é', 3.5]) for _ in range(cells)]
+	elDecorators = [rng.randint(Line.NORMAL, Line.OTHER) for _ in range(cells)]
+	return Line(colWidths, content, None, sepClass = rng.choice([Chars.contentSep, Chars.singleHLineSep]), elDecorators = elDecorators)
+
+
+def test_line_draws_cells_with_their_attributes():
+	window = AttrWindow(30)
+	Line([3, 5], ['ab', 'cde'], None, elDecorators = [Line.FOCUSED, Line.HEADER]).draw(window, 0)
+	assert window.text() == '│ ab  │ cde                 │ '
+	assert window.attrs() == [0, 0, Line.FOCUSED, Line.FOCUSED, *[0] * 4, *[Line.HEADER] * 3, *[0] * 19]
+
+	window = AttrWindow(20)
+	Line([2, 8], ['', ' '], None, elDecorators = Line.FOCUSED).draw(window, 0)
+	assert window.text() == '│    │            │ '
+	assert set(window.attrs()) == {0}
+
+
+def test_whole_line_matches_drawing_it_cell_by_cell():
+	rng = random.Random(0)
+	decorators = Line.getElementDecorators()
+	for _ in range(3000):
+		line = randomLine(rng)
+		w = rng.randint(3, 120)
+		whole = AttrWindow(w)
+		cellByCell = AttrWindow(w)
+		endX = line.draw(whole, 0)
+		assert line._drawRuns(cellByCell, 0, line.sepClass, 0, w, decorators) == endX
+		assert (whole.text(), whole.attrs()) == (cellByCell.text(), cellByCell.attrs())
+
+
+def test_line_takes_one_addstr_per_attribute_run():
+	rng = random.Random(1)
+	for _ in range(500):
+		line = randomLine(rng)
+		window = AttrWindow(120)
+		line.draw(window, 0)
+		decorated = len([decorator for decorator in line._cellDecorators if decorator != Line.NORMAL])
+		assert window.addstrCalls <= 1 + decorated
+
+
+def test_content_past_the_edge_is_cut_off():
+	window = AttrWindow(20)
+	Line([3, 14], ['ab', 'a longer value'], None, elDecorators = [Line.NORMAL, Line.GROUP]).draw(window, 0)
+	assert window.text() == '│ ab  │ a longer..│ '
+	assert window.attrs() == [*[0] * 8, *[Line.GROUP] * 10, 0, 0]
+
+
+# How a Line kept its cells before, inserting each one in front of the others until the line was full
+class ListCells:
+	def __init__(self, colWidths: list):
+		self.colWidths = colWidths
+		self.content = []
+		self.elDecorators = []
+
+	def insertContentCell(self, content, elDecorator):
+		if len(self.content) == len(self.colWidths):
+			return
+		self.content.insert(0, content)
+		self.elDecorators.insert(0, elDecorator)
+
+
+def test_cells_added_in_front_match_inserting_each_one():
+	rng = random.Random(2)
+	for _ in range(500):
+		colWidths = [3 for _ in range(rng.randint(0, 8))]
+		content = [str(c) for c in range(rng.randint(0, 10))]
+		elDecorators = [rng.randint(Line.NORMAL, Line.OTHER) for _ in content]
+		line = Line(colWidths, content, None, elDecorators = elDecorators)
+		reference = ListCells(colWidths)
+		for c in reversed(range(len(content))):
+			reference.insertContentCell(content[c], elDecorators[c])
+
+		for batch in range(rng.randint(0, 4)):
+			added = ['p' + str(batch) + '_' + str(c) for c in range(rng.randint(0, 4))]
+			addedDecorators = [rng.randint(Line.NORMAL, Line.OTHER) for _ in added]
+			parent = object()
+			if rng.random() < 0.5 and len(added) > 0:
+				line.insertContentCell(added[-1], addedDecorators[-1], parent)
+				reference.insertContentCell(added[-1], addedDecorators[-1])
+			else:
+				line.insertContentCells(added, addedDecorators, parent)
+				for c in reversed(range(len(added))):
+					reference.insertContentCell(added[c], addedDecorators[c])
+
+		assert line.content == reference.content
+		assert line.elDecorators == reference.elDecorators
+		assert line.getTopContentLen() == len(reference.content)
+		assert line.isHeader == (Line.HEADER in reference.elDecorators)
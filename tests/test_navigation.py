@@ -0,0 +1,82 @@
+from .helpers import makeTree, walkDrawn
+
+import random
+
+
+# The nodes focus can land on, from the top of the table down
+def focusable(tree) -> list:
+	return [node for node in walkDrawn(tree.root) if node.parent is not None and (node.isCollapsed or len(node.children) == 0)]
+
+
+def expandedAtRandom(seed: int):
+	rng = random.Random(seed)
+	tree = makeTree(200, depth = 4, seed = seed, lazy = seed % 2 == 0)
+	for node in list(walkDrawn(tree.root)):
+		if rng.random() < 0.6:
+			node.isExpanded = True
+	return tree, rng
+
+
+def test_childIndex_is_the_index_in_children():
+	for seed in range(4):
+		tree, rng = expandedAtRandom(seed)
+		for node in list(walkDrawn(tree.root))[1:]:
+			assert node.parent.childIndex(node) == node.parent.children.index(node)
+
+
+def test_focusDown_and_focusUp_step_through_the_rows_in_order():
+	for seed in range(4):
+		tree, rng = expandedAtRandom(seed)
+		nodes = focusable(tree)
+		deepest = max([node.depth for node in nodes])
+		focus = tree.root.children[0].focusIn(deepest)
+		assert focus is nodes[0]
+		for node in nodes[1:]:
+			focus = focus.focusDown()
+			assert focus is node and focus.isFocused
+		assert focus.focusDown() is focus
+		for node in reversed(nodes[:-1]):
+			focus = focus.focusUp()
+			assert focus is node
+		assert [node for node in walkDrawn(tree.root) if node.isFocused] == [focus]
+
+
+def test_moving_the_focus_keeps_measures():
+	tree = makeTree(depth = 4)
+	tree.root.expandAll()
+	focus = tree.root.children[0].focusIn(4)
+	tree.render()
+	ancestors = [focus.parent, focus.parent.parent]
+	measures = [node._measure for node in ancestors]
+	focus.focusDown()
+	assert [node._measure for node in ancestors] == measures
+	assert all([node._layout is not None for node in ancestors])
+	assert all([node._renderCache is None for node in ancestors])
+
+
+def test_paging_lands_a_screen_height_away():
+	for seed in range(8):
+		tree, rng = expandedAtRandom(seed)
+		nodes = focusable(tree)
+		rows = tree.root.measure()[0]
+		focus = nodes[0].focusIn(nodes[0].depth)
+		for _ in range(50):
+			h = rng.choice([5, 20])
+			step = rng.choice([1, -1])
+			target = tree.getNodeYRange(focus)[0] + 1 + step * h
+			page = tree.getFocusableNodeNearY(target, step)
+			assert page in nodes
+
+			# The node drawn on the target row, or failing that (on an hline or a header) the nearest one in the direction of step
+			target = max(1, min(target, rows))
+			top, bottom = tree.getNodeYRange(page)
+			drawn = tree.getNodeAtY(target)
+			if drawn in nodes:
+				assert page is drawn
+			elif step > 0:
+				assert top >= target or all([tree.getNodeAtY(y) not in nodes for y in range(target, rows + 1)])
+			else:
+				assert bottom <= target or all([tree.getNodeAtY(y) not in nodes for y in range(1, target + 1)])
+
+			if page is not focus:
+				focus = page.focusIn(focus.focusOut())
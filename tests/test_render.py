@@ -0,0 +1,158 @@
+from ..data.node import Node
+from ..drawing import ScrollableWindow
+from .helpers import makeTree, TextWindow, walk, walkDrawn
+
+import random
+
+
+# Every row of a render of the whole tree
+def fullRows(tree) -> list:
+	lines = tree.render()
+	window = TextWindow(tree.root.measure()[0] + 2, 100)
+	lines.draw(window, 0)
+	return [window.text(y) for y in range(window.h)], lines
+
+
+def screenRows(tree, top: int, h: int) -> tuple:
+	scrollWindow = ScrollableWindow(TextWindow(h, 100))
+	scrollWindow.top = top
+	scrollWindow.drawAll(tree.render(top, top + h))
+	return [scrollWindow.win.text(y) for y in range(h)], scrollWindow.contentLen
+
+
+# Expands, hides and focuses nodes at random, returning the focused one
+def shuffleTree(seed: int, **kwargs):
+	rng = random.Random(seed)
+	tree = makeTree(200, depth = 4, seed = seed, **kwargs)
+	for node in list(walk(tree.root)):
+		if rng.random() < 0.6:
+			node.isExpanded = True
+	nodes = list(walk(tree.root))[1:]
+	focus = rng.choice(nodes).focusIn()
+	for node in rng.sample(nodes, 3):
+		if node.parent.isExpanded and len(node.parent.children) > 1:
+			node.hide()
+	return tree, focus, rng
+
+
+def test_windowed_render_draws_the_rows_of_the_full_render():
+	for seed in range(6):
+		tree, focus, rng = shuffleTree(seed, lazy = seed % 2 == 0)
+		rows, lines = fullRows(tree)
+		for top in [*range(0, 40), *[rng.randrange(len(rows)) for _ in range(20)]]:
+			for h in [1, 7, 25]:
+				screen, contentLen = screenRows(tree, top, h)
+				assert contentLen == len(rows)
+				assert screen == [*rows[top:top+h], *[''] * (top + h - len(rows))]
+
+
+def test_tree_node_ranges_match_the_full_render():
+	for seed in range(6):
+		tree, focus, rng = shuffleTree(seed)
+		rows, lines = fullRows(tree)
+		for node in walk(tree.root):
+			assert tree.getNodeYRange(node) == lines.getNodeYRange(node)
+
+
+def test_windowed_render_only_renders_the_rows_on_screen():
+	tree = makeTree(2000, depth = 4, lazy = True)
+	tree.root.expandAll()
+	Node.resetRenderCacheCounters()
+	screenRows(tree, 500, 20)
+	windowed = Node.renderCacheMisses
+	fullRows(tree)
+	assert windowed < 50
+	assert Node.renderCacheMisses - windowed > 2000
+
+
+# Every node, including the LeafNodes made to draw single chains, which have render caches too
+def walkAll(node):
+	yield node
+	if node.isLoaded:
+		for child in [*node._loadedChildren, *getattr(node, '_effChildren', [])]:
+			yield from walkAll(child)
+
+
+def test_cached_renders_match_rendering_from_scratch():
+	for seed in range(4):
+		tree, focus, rng = shuffleTree(seed, lazy = seed % 2 == 0)
+		for step in range(40):
+			choice = rng.random()
+			if choice < 0.4:
+				focus = focus.focusDown()
+			elif choice < 0.5:
+				focus = focus.focusUp()
+			elif choice < 0.6:
+				focus = focus.focusRight()
+			elif choice < 0.7:
+				focus = focus.focusLeft()
+			else:
+				rng.choice(list(walk(tree.root))[1:]).click()
+			rows, lines = fullRows(tree)
+			top = rng.randrange(len(rows))
+			screen, contentLen = screenRows(tree, top, 10)
+
+			for node in walkAll(tree.root):
+				node._renderCache = None
+				node._measure = None
+				node._layout = None
+			assert fullRows(tree)[0] == rows
+			assert screenRows(tree, top, 10)[0] == screen
+
+
+def test_unchanged_nodes_are_not_rendered_again():
+	tree = makeTree(depth = 4)
+	tree.root.expandAll()
+	lines = tree.render()
+	Node.resetRenderCacheCounters()
+	assert tree.render() is lines
+	assert Node.renderCacheMisses == 0
+
+	# Moving the focus only renders the nodes it leaves and lands on, and their ancestors
+	focus = tree.root.children[0].focusIn()
+	tree.render()
+	Node.resetRenderCacheCounters()
+	focus = focus.focusDown()
+	tree.render()
+	assert 0 < Node.renderCacheMisses <= 2 * (focus.depth + 1)
+
+
+def isUnder(node, ancestor) -> bool:
+	while node is not None:
+		if node is ancestor:
+			return True
+		node = node.parent
+	return False
+
+
+def test_node_at_y_is_the_deepest_node_drawn_there():
+	for seed in range(4):
+		tree, focus, rng = shuffleTree(seed)
+		rows, lines = fullRows(tree)
+		assert tree.getNodeAtY(0) is None
+		assert tree.getNodeAtY(len(rows) - 1) is None
+		for y in range(1, len(rows) - 1):
+			top, bottom = tree.getNodeYRange(tree.getNodeAtY(y))
+			assert top < y < bottom
+
+		# The header lines of ancestors prepended to a node's block belong to them, but its last row is always its own
+		for node in walkDrawn(tree.root):
+			top, bottom = tree.getNodeYRange(node)
+			if node.parent is not None:
+				assert tree.getNodeAtY(bottom - 1) is node or not (node.isCollapsed or len(node.children) == 0)
+			for y in range(top + 1, bottom):
+				found = tree.getNodeAtY(y)
+				assert isUnder(found, node) or isUnder(node, found)
+
+
+def test_nodes_that_are_not_drawn_have_no_rows():
+	tree = makeTree()
+	tree.root.expandAll()
+	node = tree.root.children[0]
+	hidden = node.children[0]
+	inside = node.children[1].children[0]
+	hidden.hide()
+	assert tree.getNodeYRange(hidden) == (0, 0)
+	node.isExpanded = False
+	assert tree.getNodeYRange(inside) == (0, 0)
+	assert tree.getNodeYRange(node) == fullRows(tree)[1].getNodeYRange(node)
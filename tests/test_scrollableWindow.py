@@ -0,0 +1,150 @@
+from ..drawing import ScrollableWindow
+from ..drawing import scrollableWindow
+from .helpers import makeTree, tableRows, TextWindow
+
+import pytest
+
+
+@pytest.fixture
+def pads(monkeypatch):
+	made = []
+	def newpad(h, w):
+		made.append(TextWindow(h, w))
+		return made[-1]
+	monkeypatch.setattr(scrollableWindow.curses, 'newpad', newpad)
+	return made
+
+
+def drawFrame(scrollWindow, tree):
+	top, bottom = scrollWindow.drawRange()
+	scrollWindow.drawFrame(tree.render(top, bottom))
+
+
+def assertShows(scrollWindow, tree):
+	rows = tableRows(tree, scrollWindow.w)
+	target = scrollWindow.win if scrollWindow.pad is None else scrollWindow.pad
+	# A window shows the rows from top on, while a pad holds them from padTop on
+	offset = 0 if scrollWindow.pad is None else scrollWindow.top - scrollWindow.padTop
+	for y in range(scrollWindow.h):
+		expected = rows[scrollWindow.top + y] if scrollWindow.top + y < len(rows) else ''
+		assert target.text(offset + y) == expected.rstrip()
+
+
+@pytest.mark.parametrize('padScreens', [None, 3])
+def test_drawFrame_redraws_only_changed_rows(pads, padScreens):
+	tree = makeTree()
+	tree.root.expandAll()
+	scrollWindow = ScrollableWindow(TextWindow(20, 100), padScreens)
+	focusNode = tree.root.children[0].focusIn(3)
+
+	drawFrame(scrollWindow, tree)
+	assertShows(scrollWindow, tree)
+
+	for _ in range(5):
+		target = scrollWindow.win if padScreens is None else scrollWindow.pad
+		target.clearedRows = set()
+		focusNode = focusNode.focusDown()
+		drawFrame(scrollWindow, tree)
+		assertShows(scrollWindow, tree)
+		# The row the focus left and the one it moved to
+		assert 0 < len(target.clearedRows) <= 4
+
+	assert len(pads) == (0 if padScreens is None else 1)
+
+
+def test_pad_moves_only_when_the_screen_leaves_it(pads):
+	tree = makeTree()
+	tree.root.expandAll()
+	scrollWindow = ScrollableWindow(TextWindow(20, 100), 3)
+	drawFrame(scrollWindow, tree)
+
+	scrollWindow.scrollDown(30)
+	assert scrollWindow.isDrawn()
+	assert scrollWindow.drawRange() == (30, 50)
+	drawFrame(scrollWindow, tree)
+	assert scrollWindow.padTop == 0
+	assertShows(scrollWindow, tree)
+
+	scrollWindow.scrollDown(20)
+	assert not scrollWindow.isDrawn()
+	drawFrame(scrollWindow, tree)
+	assert scrollWindow.padTop == 50 - 20
+	assert scrollWindow.isDrawn()
+	assertShows(scrollWindow, tree)
+
+
+def test_frames_drawn_while_the_pad_stays_put_only_draw_the_screen(pads):
+	tree = makeTree()
+	tree.root.expandAll()
+	scrollWindow = ScrollableWindow(TextWindow(20, 100), 3)
+	drawFrame(scrollWindow, tree)
+	assert (scrollWindow.drawnTop, scrollWindow.drawnBottom) == (0, 60)
+
+	# Collapsing the first group moves every row after it, but only the ones on screen are drawn again
+	tree.root.children[0].isExpanded = False
+	pads[0].clearedRows = set()
+	assert scrollWindow.drawRange() == (0, 20)
+	drawFrame(scrollWindow, tree)
+	assertShows(scrollWindow, tree)
+	assert pads[0].clearedRows <= set(range(20))
+	assert (scrollWindow.drawnTop, scrollWindow.drawnBottom) == (0, 20)
+
+	# Scrolling off of them draws the rest of the pad, which is still where it was
+	scrollWindow.scrollDown(10)
+	assert not scrollWindow.isDrawn()
+	assert scrollWindow.drawRange() == (0, 60)
+	drawFrame(scrollWindow, tree)
+	assert scrollWindow.padTop == 0 and len(pads) == 1
+	assertShows(scrollWindow, tree)
+	scrollWindow.scrollDown(20)
+	assert scrollWindow.isDrawn()
+	assertShows(scrollWindow, tree)
+
+
+def test_unchanged_frame_draws_nothing():
+	tree = makeTree()
+	tree.root.expandAll()
+	scrollWindow = ScrollableWindow(TextWindow(20, 100))
+	drawFrame(scrollWindow, tree)
+	assert scrollWindow.win.clearedRows == set(range(20))
+	scrollWindow.win.addstrCalls = 0
+	scrollWindow.win.clearedRows = set()
+	drawFrame(scrollWindow, tree)
+	assert scrollWindow.win.addstrCalls == 0
+	assert scrollWindow.win.clearedRows == set()
+
+
+def test_rows_left_by_a_shorter_frame_are_cleared():
+	tree = makeTree()
+	tree.root.expandAll()
+	scrollWindow = ScrollableWindow(TextWindow(40, 100))
+	drawFrame(scrollWindow, tree)
+	assertShows(scrollWindow, tree)
+
+	tree.root.collapseToDepth(1)
+	drawFrame(scrollWindow, tree)
+	assertShows(scrollWindow, tree)
+	assert scrollWindow.contentLen < 20
+	assert all([scrollWindow.win.text(y) == '' for y in range(scrollWindow.contentLen, 40)])
+
+
+def test_scrolling_redraws_the_rows_that_moved():
+	tree = makeTree()
+	tree.root.expandAll()
+	scrollWindow = ScrollableWindow(TextWindow(20, 100))
+	drawFrame(scrollWindow, tree)
+	for _ in range(5):
+		scrollWindow.scrollDown(3)
+		drawFrame(scrollWindow, tree)
+		assertShows(scrollWindow, tree)
+
+
+def test_new_window_is_drawn_in_full():
+	tree = makeTree()
+	tree.root.expandAll()
+	scrollWindow = ScrollableWindow(TextWindow(20, 100))
+	drawFrame(scrollWindow, tree)
+	scrollWindow.setWindow(TextWindow(30, 80))
+	drawFrame(scrollWindow, tree)
+	assertShows(scrollWindow, tree)
+	assert scrollWindow.win.clearedRows == set(range(30))
@@ -0,0 +1,119 @@
+from ..data import Tree
+from ..config import Config
+from ..benchmarks.buildTree import makeFrame
+from .helpers import makeTree, walkLoaded
+
+import pandas as pd
+import pytest
+
+
+# Every node of the tree (making all of them) with its path of _children indices
+def allNodes(node, path = ()):
+	yield (node, path)
+	for c, child in enumerate(node._children):
+		yield from allNodes(child, (*path, c))
+
+
+def expectedMatches(tree, query):
+	return sorted(set([path for node, path in allNodes(tree.root) if len(path) > 0 and str(node._contentLine[0]).lower().startswith(query.lower())]))
+
+
+def test_find_matches_every_node_with_a_value_starting_with_the_query():
+	tree = makeTree()
+	for query in ['v', 'V1', 'v2', 'note1', 'zz', '']:
+		assert tree.find(query) == expectedMatches(tree, query)
+
+
+def test_findNext_walks_the_matches_in_order_and_wraps():
+	tree = makeTree()
+	matches = tree.find('v1')
+	focusNode = tree.root.children[0].focusIn(1)
+	seen = []
+	for _ in range(len(matches) + 1):
+		path = tree.findNext('v1', focusNode)
+		node, depth = tree.revealPath(path)
+		focusNode.focusOut()
+		focusNode = node.focusIn(depth)
+		assert str(focusNode).lower().startswith('v1')
+		assert tree.searchIndex.pathOf(focusNode) == path
+		seen.append(path)
+	assert seen[:len(matches)] == matches[matches.index(seen[0]):] + matches[:matches.index(seen[0])]
+	assert seen[-1] == seen[0]
+	assert tree.findNext('v1', focusNode, -1) == seen[-2]
+
+
+def test_findNext_skips_matches_in_hidden_nodes():
+	tree = makeTree()
+	hidden = tree.root.children[1]
+	hidden.hide()
+	hiddenPath = tree.searchIndex.pathOf(hidden)
+	matches = tree.find('v')
+	visible = [path for path in matches if path[:len(hiddenPath)] != hiddenPath]
+	assert len(visible) < len(matches)
+
+	focusNode = tree.root.children[0].focusIn(1)
+	path = tree.searchIndex.pathOf(focusNode)
+	for _ in range(len(visible)):
+		path = tree.findNext('v', focusNode)
+		assert path in visible
+		node, depth = tree.revealPath(path)
+		focusNode.focusOut()
+		focusNode = node.focusIn(depth)
+	assert tree.findNext(hidden._contentLine[0], tree.root.children[0]) != hiddenPath
+
+
+def test_findNext_finds_nothing_when_every_match_is_hidden():
+	tree = Tree(pd.DataFrame({'a': ['x', 'x', 'y'], 'b': ['p', 'q', 'r'], 'c': [1, 2, 3]}), Config(set(), set()))
+	tree.root.children[0].hide()
+	assert tree.find('x') == [(0,)]
+	assert tree.find('q') == [(0, 1)]
+	assert tree.findNext('x', tree.root.children[0]) is None
+	assert tree.findNext('q', tree.root.children[0]) is None
+	assert tree.findNext('r', tree.root.children[0]) == (1, 0)
+
+
+def test_revealPath_expands_nothing_for_a_hidden_path():
+	tree = makeTree()
+	hidden = tree.root._children[0]._children[0]
+	hidden.hide()
+	path = (0, 0, 0)
+	assert tree.isPathHidden(path)
+	assert tree.revealPath(path) is None
+	assert not tree.root._children[0].isExpanded
+
+	node, depth = tree.revealPath((1, 0, 0))
+	assert tree.root._children[1].isExpanded and tree.root._children[1]._children[0].isExpanded
+	assert tree.getNodeYRange(node) != (0, 0)
+
+
+@pytest.mark.parametrize('kwargs', [{'lazy': True}, {'compact': True}])
+def test_searchIndex_makes_no_nodes(kwargs):
+	tree = makeTree(**kwargs)
+	loaded = len(list(walkLoaded(tree.root)))
+	assert len(tree.searchIndex) > 0
+	assert len(list(walkLoaded(tree.root))) == loaded
+
+	path = max(tree.find('v4'), key = len)
+	node, depth = tree.revealPath(path)
+	assert str(node.focusIn(depth)).startswith('v4')
+	# Only the nodes on the way to the match (and their siblings) are made
+	assert len(list(walkLoaded(tree.root))) < len(tree.searchIndex)
+
+
+@pytest.mark.parametrize('kind', ['lazy', 'compact', 'chunks', 'appended', 'filtered'])
+def test_searchIndex_matches_the_nodes_of_every_kind_of_tree(kind):
+	frame = makeFrame(300, 3)
+	config = Config({'h_count', 'h_amount'}, {'h_count', 'h_amount', 'h_note'})
+	if kind == 'chunks':
+		tree = Tree.fromChunks([frame[:100], frame[100:]], config)
+	else:
+		tree = Tree(frame[:200] if kind == 'appended' else frame, config, lazy = kind == 'lazy', compact = kind == 'compact')
+	if kind == 'appended':
+		tree.append(frame[200:])
+	if kind == 'filtered':
+		tree.filter('g_level1 = v2')
+
+	for query in ['v', 'v2', 'v4', '']:
+		assert tree.find(query) == expectedMatches(tree, query)
+	for node, path in allNodes(tree.root):
+		assert tree.searchIndex.pathOf(node) == path
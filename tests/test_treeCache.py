@@ -0,0 +1,111 @@
+from ..data import Tree
+from ..data.treeCache import TreeCache
+from ..config import Config
+from ..benchmarks.buildTree import makeFrame
+from .helpers import frameConfig, describe, tableRows
+
+import os
+
+
+def test_second_build_loads_the_cached_tree(tmp_path):
+	cache = TreeCache(str(tmp_path))
+	df = makeFrame(300, 3)
+	first = Tree(df, frameConfig(), cache = cache)
+	second = Tree(df.copy(), frameConfig(), cache = cache)
+	assert (first.cacheHit, second.cacheHit) == (False, True)
+	assert (cache.hits, cache.misses) == (1, 1)
+	assert second._index is None
+	assert describe(second.root) == describe(first.root)
+	assert tableRows(second) == tableRows(first)
+
+
+def test_key_changes_with_the_data_and_the_config():
+	df = makeFrame(300, 3)
+	key = TreeCache.key(df, frameConfig())
+	assert TreeCache.key(df.copy(), frameConfig()) == key
+
+	changed = df.copy()
+	changed.loc[5, 'h_count'] += 1
+	assert TreeCache.key(changed, frameConfig()) != key
+	assert TreeCache.key(df.astype({'h_count': float}), frameConfig()) != key
+	assert TreeCache.key(df.rename(columns = {'h_note': 'h_other'}), frameConfig()) != key
+	assert TreeCache.key(df, Config({'h_count'}, {'h_count', 'h_amount', 'h_note'})) != key
+	assert TreeCache.key(df, Config({'h_count', 'h_amount'}, {'h_count', 'h_amount', 'h_note'}, summarize = lambda self, df, colName, long: '')) != key
+
+
+def summarizeWith(text: str):
+	return lambda self, df, colName, long: text + str(len(df))
+
+
+def summarizeDefaulting(text: str):
+	def summarize(self, df, colName, long, text = text):
+		return text + str(len(df))
+	return summarize
+
+
+def test_key_changes_with_the_values_summarize_closes_over():
+	df = makeFrame(300, 3)
+	def key(summarize):
+		return TreeCache.key(df, Config({'h_count'}, {'h_count', 'h_amount', 'h_note'}, summarize = summarize))
+
+	assert key(summarizeWith('rows: ')) == key(summarizeWith('rows: '))
+	assert key(summarizeWith('rows: ')) != key(summarizeWith('count: '))
+	assert summarizeDefaulting('rows: ').__closure__ is None
+	assert key(summarizeDefaulting('rows: ')) == key(summarizeDefaulting('rows: '))
+	assert key(summarizeDefaulting('rows: ')) != key(summarizeDefaulting('count: '))
+
+
+def test_configs_without_an_identity_are_not_cached(tmp_path):
+	class Label:
+		pass
+	label = Label()
+	config = Config({'h_count'}, {'h_count', 'h_amount', 'h_note'}, summarize = lambda self, df, colName, long: str(label) and str(len(df)))
+	assert config.identity() is None
+
+	cache = TreeCache(str(tmp_path))
+	df = makeFrame(300, 3)
+	first = Tree(df, config, cache = cache)
+	second = Tree(df, config, cache = cache)
+	assert not first.cacheHit and not second.cacheHit
+	assert cache.entries() == []
+	assert tableRows(second) == tableRows(first)
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+	cache = TreeCache(str(tmp_path))
+	df = makeFrame(300, 3)
+	Tree(df, frameConfig(), cache = cache)
+	key = TreeCache.key(df, frameConfig())
+	os.remove(os.path.join(str(tmp_path), key, 'parent.npy'))
+
+	tree = Tree(df, frameConfig(), cache = TreeCache(str(tmp_path)))
+	assert not tree.cacheHit
+	assert cache.contains(key)
+	assert Tree(df, frameConfig(), cache = cache).cacheHit
+
+
+def test_evict_keeps_the_most_recently_used_entries(tmp_path):
+	cache = TreeCache(str(tmp_path))
+	frames = [makeFrame(300, 3, seed) for seed in range(3)]
+	for df in frames:
+		Tree(df, frameConfig(), cache = cache)
+	keys = [TreeCache.key(df, frameConfig()) for df in frames]
+	sizes = {path: size for _, size, path in cache.entries()}
+	assert len(sizes) == 3
+
+	# The first entry was used last, then shrink the cache so only two fit
+	for key, usedAt in zip(keys, [3000, 1000, 2000]):
+		os.utime(os.path.join(str(tmp_path), key), (usedAt, usedAt))
+	cache.maxBytes = sum(sizes.values()) - 1
+	cache.evict()
+	assert [cache.contains(key) for key in keys] == [True, False, True]
+
+	cache.maxBytes = 0
+	cache.evict()
+	assert [cache.contains(key) for key in keys] == [True, False, False]
+
+
+def test_lazy_trees_do_not_use_the_cache(tmp_path):
+	cache = TreeCache(str(tmp_path))
+	Tree(makeFrame(300, 3), frameConfig(), lazy = True, cache = cache)
+	assert cache.entries() == []